@@ -4,6 +4,7 @@ from app.core.dependencies import DbSession, CurrentUser
 from app.schemas.auth import RegisterRequest, LoginRequest, TokenResponse, RefreshTokenRequest
 from app.schemas.user import UserResponse
 from app.services.auth_service import AuthService
+from app.services.user_service import UserService
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -30,6 +31,7 @@ async def refresh_token(data: RefreshTokenRequest, db: DbSession):
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user(current_user: CurrentUser):
+async def get_current_user(db: DbSession, current_user: CurrentUser):
     """Get current authenticated user."""
-    return current_user
+    service = UserService(db)
+    return await service.get_user(current_user.id)
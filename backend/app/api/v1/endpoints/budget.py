@@ -1,22 +1,22 @@
 from fastapi import APIRouter, Query
-from fastapi.responses import StreamingResponse
 
-from app.core.dependencies import DbSession, AdminUser, ManagerOrAdmin
+from app.core.dependencies import DbSession, ReadDbSession, AdminUser, ManagerOrAdmin
+from app.core.http_cache import conditional_get
+from app.db.session import stream_in_session
+from app.models.budget import BudgetCategory, Expense
 from app.models.enums import PaymentStatus, GuestSide
-from app.repositories.budget import BudgetCategoryRepository
-from app.repositories.vendor import VendorRepository
-from app.repositories.event import EventRepository
-from app.repositories.user import UserRepository
 from app.schemas.budget import (
     BudgetCategoryCreate, BudgetCategoryUpdate, BudgetCategoryResponse,
     ExpenseCreate, ExpenseUpdate, ExpenseResponse, BudgetOverviewResponse,
 )
 from app.schemas.common import MessageResponse, PaginatedResponse
 from app.services.budget_service import BudgetService
-from app.utils.excel import generate_excel
+from app.utils.export import ExportFormat, export_response
 
 router = APIRouter(prefix="/budget", tags=["Budget & Expenses"])
 
+OverviewCache = conditional_get("budget_categories", "expenses")
+
 
 # --- Budget Categories ---
 
@@ -28,7 +28,7 @@ async def get_budget_categories(db: DbSession, user: ManagerOrAdmin):
 
 
 @router.get("/overview", response_model=BudgetOverviewResponse)
-async def get_budget_overview(db: DbSession, user: ManagerOrAdmin):
+async def get_budget_overview(db: ReadDbSession, user: ManagerOrAdmin, cache: OverviewCache):
     """Get full budget vs actual overview."""
     service = BudgetService(db)
     return await service.get_overview()
@@ -43,15 +43,15 @@ CATEGORY_EXPORT_COLUMNS = [
 
 
 @router.get("/categories/export")
-async def export_budget_categories(db: DbSession, user: ManagerOrAdmin):
-    """Export budget categories to Excel (manager/admin)."""
-    service = BudgetService(db)
-    items = await service.get_categories()
-    buffer = generate_excel(items, CATEGORY_EXPORT_COLUMNS, "Budget Categories")
-    return StreamingResponse(
-        buffer,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": "attachment; filename=budget_categories.xlsx"},
+async def export_budget_categories(
+    user: ManagerOrAdmin,
+    export_format: ExportFormat = Query(ExportFormat.XLSX, alias="format"),
+):
+    """Export budget categories as xlsx, CSV or Parquet (manager/admin)."""
+    rows = stream_in_session(lambda session: BudgetService(session).stream_categories())
+    return export_response(
+        rows, CATEGORY_EXPORT_COLUMNS, "Budget Categories", "budget_categories", export_format,
+        model=BudgetCategory,
     )
 
 
@@ -94,6 +94,7 @@ async def get_expenses(
     user: ManagerOrAdmin,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
     budget_id: int | None = None,
     vendor_id: int | None = None,
     event_id: int | None = None,
@@ -104,21 +105,17 @@ async def get_expenses(
     """Get all expenses with optional filters."""
     service = BudgetService(db)
     skip = (page - 1) * page_size
-    items = await service.get_expenses(
+    items, total, next_cursor = await service.get_expenses_page(
         skip=skip, limit=page_size, budget_id=budget_id,
         vendor_id=vendor_id, event_id=event_id, payment_status=payment_status,
         side=side, paid_by_user_id=paid_by_user_id,
+        cursor=cursor,
     )
-    total = await service.count_expenses()
-    return PaginatedResponse(
-        items=items, total=total, page=page, page_size=page_size,
-        total_pages=(total + page_size - 1) // page_size,
-    )
+    return PaginatedResponse.create(items, total, page, page_size, next_cursor)
 
 
 @router.get("/expenses/export")
 async def export_expenses(
-    db: DbSession,
     user: ManagerOrAdmin,
     budget_id: int | None = None,
     vendor_id: int | None = None,
@@ -126,51 +123,33 @@ async def export_expenses(
     payment_status: PaymentStatus | None = None,
     side: GuestSide | None = None,
     paid_by_user_id: int | None = None,
+    export_format: ExportFormat = Query(ExportFormat.XLSX, alias="format"),
 ):
-    """Export expenses to Excel (manager/admin)."""
-    service = BudgetService(db)
-    items = await service.get_expenses(
-        skip=0, limit=10000, budget_id=budget_id,
-        vendor_id=vendor_id, event_id=event_id, payment_status=payment_status,
-        side=side, paid_by_user_id=paid_by_user_id,
+    """Export expenses as xlsx, CSV or Parquet (manager/admin)."""
+    rows = stream_in_session(
+        lambda session: BudgetService(session).stream_expenses(
+            budget_id=budget_id, vendor_id=vendor_id, event_id=event_id,
+            payment_status=payment_status, side=side, paid_by_user_id=paid_by_user_id,
+        )
     )
 
-    categories = await BudgetCategoryRepository(db).get_all(limit=10000)
-    vendors = await VendorRepository(db).get_all(limit=10000)
-    events = await EventRepository(db).get_all(limit=10000)
-    users = await UserRepository(db).get_all(limit=10000)
-    cat_map = {c.id: c.category for c in categories}
-    vendor_map = {v.id: v.name for v in vendors}
-    event_map = {e.id: e.name for e in events}
-    user_map = {u.id: f"{u.first_name} {u.last_name}" for u in users}
-
-    def paid_by(exp):
-        if exp.paid_by_user_id:
-            return user_map.get(exp.paid_by_user_id, "")
-        return exp.paid_by_name or ""
-
     columns = [
-        (lambda exp: cat_map.get(exp.budget_id, ""), "Budget Category"),
-        (lambda exp: vendor_map.get(exp.vendor_id, ""), "Vendor"),
-        (lambda exp: event_map.get(exp.event_id, ""), "Event"),
+        ("budget_category", "Budget Category"),
+        ("vendor", "Vendor"),
+        ("event", "Event"),
         ("description", "Description"),
         ("amount", "Amount"),
         ("payment_method", "Payment Method"),
         ("payment_status", "Payment Status"),
         ("payment_date", "Payment Date"),
-        (paid_by, "Paid By"),
+        ("paid_by", "Paid By"),
         ("side", "Side"),
         ("receipt_url", "Receipt URL"),
         ("notes", "Notes"),
         ("created_at", "Created At"),
     ]
 
-    buffer = generate_excel(items, columns, "Expenses")
-    return StreamingResponse(
-        buffer,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": "attachment; filename=expenses.xlsx"},
-    )
+    return export_response(rows, columns, "Expenses", "expenses", export_format, model=Expense)
 
 
 @router.get("/expenses/{expense_id}", response_model=ExpenseResponse)
@@ -0,0 +1,18 @@
+from fastapi import APIRouter
+
+from app.core.dependencies import DbSession, ManagerOrAdmin
+from app.schemas.dashboard import DashboardResponse
+from app.services.dashboard_service import DashboardService
+
+router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
+
+
+@router.get("", response_model=DashboardResponse)
+async def get_dashboard(db: DbSession, user: ManagerOrAdmin):
+    """Get every module's summary in one call (manager/admin).
+
+    Served from precomputed snapshots; sections changed since their last
+    build are recomputed on the way.
+    """
+    service = DashboardService(db)
+    return await service.get_dashboard()
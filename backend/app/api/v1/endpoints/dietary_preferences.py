@@ -1,15 +1,19 @@
 from fastapi import APIRouter
 
 from app.core.dependencies import DbSession, AdminUser, ManagerOrAdmin
+from app.core.http_cache import conditional_get, max_age
 from app.schemas.lookup import LookupCreate, LookupUpdate, LookupResponse
 from app.schemas.common import MessageResponse
 from app.services.dietary_preference_service import DietaryPreferenceService
 
 router = APIRouter(prefix="/dietary-preferences", tags=["Dietary Preferences"])
 
+# Lookup lists rarely change: clients may reuse them for a minute
+ListCache = conditional_get("dietary_preferences", cache_control=max_age(60))
+
 
 @router.get("", response_model=list[LookupResponse])
-async def get_dietary_preferences(db: DbSession, user: ManagerOrAdmin):
+async def get_dietary_preferences(db: DbSession, user: ManagerOrAdmin, cache: ListCache):
     """Get all active dietary preferences (manager/admin)."""
     service = DietaryPreferenceService(db)
     return await service.get_all()
@@ -1,21 +1,26 @@
 from fastapi import APIRouter, Query
-from fastapi.responses import StreamingResponse
 
-from app.core.dependencies import DbSession, CurrentUser, AdminUser, ManagerOrAdmin
+from app.core.dependencies import DbSession, ReadDbSession, CurrentUser, AdminUser, ManagerOrAdmin
+from app.core.http_cache import conditional_get
+from app.db.session import stream_in_session
 from app.models.enums import EventStatus
-from app.repositories.event_type import EventTypeRepository
+from app.models.event import Event
 from app.schemas.event import EventCreate, EventUpdate, EventResponse, EventSummaryResponse
 from app.schemas.common import MessageResponse, PaginatedResponse
 from app.services.event_service import EventService
-from app.utils.excel import generate_excel
+from app.utils.export import ExportFormat, export_response
 
 router = APIRouter(prefix="/events", tags=["Events"])
 
+ListCache = conditional_get("events")
+SummaryCache = conditional_get("events", "event_types")
+
 
 @router.get("", response_model=PaginatedResponse[EventResponse])
 async def get_events(
     db: DbSession,
     current_user: CurrentUser,
+    cache: ListCache,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     status: EventStatus | None = None,
@@ -33,7 +38,7 @@ async def get_events(
 
 
 @router.get("/summary", response_model=EventSummaryResponse)
-async def get_event_summary(db: DbSession, current_user: CurrentUser):
+async def get_event_summary(db: ReadDbSession, current_user: CurrentUser, cache: SummaryCache):
     """Get event summary statistics."""
     service = EventService(db)
     return await service.get_summary()
@@ -41,21 +46,21 @@ async def get_event_summary(db: DbSession, current_user: CurrentUser):
 
 @router.get("/export")
 async def export_events(
-    db: DbSession,
     current_user: CurrentUser,
     status: EventStatus | None = None,
     event_type_id: int | None = None,
+    export_format: ExportFormat = Query(ExportFormat.XLSX, alias="format"),
 ):
-    """Export events to Excel."""
-    service = EventService(db)
-    items = await service.get_events(skip=0, limit=10000, status=status, event_type_id=event_type_id)
-
-    event_types = await EventTypeRepository(db).get_all(limit=10000)
-    et_map = {e.id: e.name for e in event_types}
+    """Export events as xlsx, CSV or Parquet."""
+    rows = stream_in_session(
+        lambda session: EventService(session).stream_events(
+            status=status, event_type_id=event_type_id,
+        )
+    )
 
     columns = [
         ("name", "Name"),
-        (lambda e: et_map.get(e.event_type_id, ""), "Event Type"),
+        ("event_type", "Event Type"),
         ("description", "Description"),
         ("venue_name", "Venue Name"),
         ("venue_address", "Venue Address"),
@@ -66,12 +71,7 @@ async def export_events(
         ("created_at", "Created At"),
     ]
 
-    buffer = generate_excel(items, columns, "Events")
-    return StreamingResponse(
-        buffer,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": "attachment; filename=events.xlsx"},
-    )
+    return export_response(rows, columns, "Events", "events", export_format, model=Event)
 
 
 @router.get("/{event_id}", response_model=EventResponse)
@@ -1,15 +1,19 @@
 from fastapi import APIRouter
 
 from app.core.dependencies import DbSession, AdminUser, ManagerOrAdmin
+from app.core.http_cache import conditional_get, max_age
 from app.schemas.lookup import LookupCreate, LookupUpdate, LookupResponse
 from app.schemas.common import MessageResponse
 from app.services.family_group_service import FamilyGroupService
 
 router = APIRouter(prefix="/family-groups", tags=["Family Groups"])
 
+# Lookup lists rarely change: clients may reuse them for a minute
+ListCache = conditional_get("family_groups", cache_control=max_age(60))
+
 
 @router.get("", response_model=list[LookupResponse])
-async def get_family_groups(db: DbSession, user: ManagerOrAdmin):
+async def get_family_groups(db: DbSession, user: ManagerOrAdmin, cache: ListCache):
     """Get all active family groups (manager/admin)."""
     service = FamilyGroupService(db)
     return await service.get_all()
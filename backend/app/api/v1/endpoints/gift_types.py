@@ -1,15 +1,19 @@
 from fastapi import APIRouter
 
 from app.core.dependencies import DbSession, AdminUser, ManagerOrAdmin
+from app.core.http_cache import conditional_get, max_age
 from app.schemas.lookup import LookupCreate, LookupUpdate, LookupResponse
 from app.schemas.common import MessageResponse
 from app.services.gift_type_service import GiftTypeService
 
 router = APIRouter(prefix="/gift-types", tags=["Gift Types"])
 
+# Lookup lists rarely change: clients may reuse them for a minute
+ListCache = conditional_get("gift_types", cache_control=max_age(60))
+
 
 @router.get("", response_model=list[LookupResponse])
-async def get_gift_types(db: DbSession, user: ManagerOrAdmin):
+async def get_gift_types(db: DbSession, user: ManagerOrAdmin, cache: ListCache):
     """Get all active gift types (manager/admin)."""
     service = GiftTypeService(db)
     return await service.get_all()
@@ -1,16 +1,18 @@
 from fastapi import APIRouter, Query
-from fastapi.responses import StreamingResponse
 
-from app.core.dependencies import DbSession, AdminUser, ManagerOrAdmin
-from app.repositories.guest import GuestRepository
-from app.repositories.gift_type import GiftTypeRepository
+from app.core.dependencies import DbSession, ReadDbSession, AdminUser, ManagerOrAdmin
+from app.core.http_cache import conditional_get
+from app.db.session import stream_in_session
+from app.models.gift import Gift
 from app.schemas.gift import GiftCreate, GiftUpdate, GiftResponse, GiftSummaryResponse
 from app.schemas.common import MessageResponse, PaginatedResponse
 from app.services.gift_service import GiftService
-from app.utils.excel import generate_excel
+from app.utils.export import ExportFormat, export_response
 
 router = APIRouter(prefix="/gifts", tags=["Gifts"])
 
+SummaryCache = conditional_get("gifts", "gift_types")
+
 
 @router.get("", response_model=PaginatedResponse[GiftResponse])
 async def get_gifts(
@@ -35,7 +37,7 @@ async def get_gifts(
 
 
 @router.get("/summary", response_model=GiftSummaryResponse)
-async def get_gift_summary(db: DbSession, user: ManagerOrAdmin):
+async def get_gift_summary(db: ReadDbSession, user: ManagerOrAdmin, cache: SummaryCache):
     """Get gift summary statistics."""
     service = GiftService(db)
     return await service.get_summary()
@@ -50,25 +52,21 @@ async def get_thank_you_pending(db: DbSession, user: ManagerOrAdmin):
 
 @router.get("/export")
 async def export_gifts(
-    db: DbSession,
     user: ManagerOrAdmin,
     guest_id: int | None = None,
     gift_type_id: int | None = None,
+    export_format: ExportFormat = Query(ExportFormat.XLSX, alias="format"),
 ):
-    """Export gifts to Excel (manager/admin)."""
-    service = GiftService(db)
-    items = await service.get_gifts(
-        skip=0, limit=10000, guest_id=guest_id, gift_type_id=gift_type_id,
+    """Export gifts as xlsx, CSV or Parquet (manager/admin)."""
+    rows = stream_in_session(
+        lambda session: GiftService(session).stream_gifts(
+            guest_id=guest_id, gift_type_id=gift_type_id,
+        )
     )
 
-    guests = await GuestRepository(db).get_all(limit=10000)
-    gift_types = await GiftTypeRepository(db).get_all(limit=10000)
-    guest_map = {g.id: f"{g.first_name} {g.last_name}" for g in guests}
-    gt_map = {t.id: t.name for t in gift_types}
-
     columns = [
-        (lambda g: guest_map.get(g.guest_id, ""), "Guest"),
-        (lambda g: gt_map.get(g.gift_type_id, ""), "Gift Type"),
+        ("guest", "Guest"),
+        ("gift_type", "Gift Type"),
         ("description", "Description"),
         ("estimated_value", "Estimated Value"),
         ("received_at", "Received At"),
@@ -77,12 +75,7 @@ async def export_gifts(
         ("created_at", "Created At"),
     ]
 
-    buffer = generate_excel(items, columns, "Gifts")
-    return StreamingResponse(
-        buffer,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": "attachment; filename=gifts.xlsx"},
-    )
+    return export_response(rows, columns, "Gifts", "gifts", export_format, model=Gift)
 
 
 @router.get("/{gift_id}", response_model=GiftResponse)
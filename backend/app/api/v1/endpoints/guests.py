@@ -1,18 +1,26 @@
-from fastapi import APIRouter, Query
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, File, Query, UploadFile
 
-from app.core.dependencies import DbSession, AdminUser, ManagerOrAdmin, StaffUser
+from app.core.config import get_settings
+from app.core.dependencies import DbSession, ReadDbSession, AdminUser, ManagerOrAdmin, StaffUser
+from app.core.http_cache import conditional_get
+from app.core.exceptions import BadRequestException
+from app.db.session import stream_in_session
 from app.models.enums import GuestSide
-from app.repositories.relation_type import RelationTypeRepository
-from app.repositories.family_group import FamilyGroupRepository
-from app.repositories.dietary_preference import DietaryPreferenceRepository
-from app.schemas.guest import GuestCreate, GuestUpdate, GuestResponse, GuestSummaryResponse
+from app.models.guest import Guest
+from app.schemas.guest import (
+    GuestCreate, GuestUpdate, GuestResponse, GuestSummaryResponse, GuestImportResponse,
+)
 from app.schemas.common import MessageResponse, PaginatedResponse
 from app.services.guest_service import GuestService
-from app.utils.excel import generate_excel
+from app.utils.export import ExportFormat, export_response
+from app.utils.importer import read_spreadsheet
+
+settings = get_settings()
 
 router = APIRouter(prefix="/guests", tags=["Guests"])
 
+SummaryCache = conditional_get("guests", "dietary_preferences")
+
 
 @router.get("", response_model=PaginatedResponse[GuestResponse])
 async def get_guests(
@@ -20,6 +28,7 @@ async def get_guests(
     user: StaffUser,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
     side: GuestSide | None = None,
     family_group_id: int | None = None,
     is_vip: bool | None = None,
@@ -28,20 +37,17 @@ async def get_guests(
     """Get all guests with optional filters (admin/manager/user)."""
     service = GuestService(db)
     skip = (page - 1) * page_size
-    items = await service.get_guests(
+    items, total, next_cursor = await service.get_guests_page(
         skip=skip, limit=page_size, side=side,
         family_group_id=family_group_id, is_vip=is_vip,
         dietary_preference_id=dietary_preference_id,
+        cursor=cursor,
     )
-    total = await service.count_guests()
-    return PaginatedResponse(
-        items=items, total=total, page=page, page_size=page_size,
-        total_pages=(total + page_size - 1) // page_size,
-    )
+    return PaginatedResponse.create(items, total, page, page_size, next_cursor)
 
 
 @router.get("/summary", response_model=GuestSummaryResponse)
-async def get_guest_summary(db: DbSession, user: StaffUser):
+async def get_guest_summary(db: ReadDbSession, user: StaffUser, cache: SummaryCache):
     """Get guest summary statistics (admin/manager/user)."""
     service = GuestService(db)
     return await service.get_summary()
@@ -49,37 +55,30 @@ async def get_guest_summary(db: DbSession, user: StaffUser):
 
 @router.get("/export")
 async def export_guests(
-    db: DbSession,
     user: StaffUser,
     side: GuestSide | None = None,
     family_group_id: int | None = None,
     is_vip: bool | None = None,
     dietary_preference_id: int | None = None,
+    export_format: ExportFormat = Query(ExportFormat.XLSX, alias="format"),
 ):
-    """Export guests to Excel (admin/manager/user)."""
-    service = GuestService(db)
-    items = await service.get_guests(
-        skip=0, limit=10000, side=side,
-        family_group_id=family_group_id, is_vip=is_vip,
-        dietary_preference_id=dietary_preference_id,
+    """Export guests as xlsx, CSV or Parquet (admin/manager/user)."""
+    rows = stream_in_session(
+        lambda session: GuestService(session).stream_guests(
+            side=side, family_group_id=family_group_id, is_vip=is_vip,
+            dietary_preference_id=dietary_preference_id,
+        )
     )
 
-    relation_types = await RelationTypeRepository(db).get_all(limit=10000)
-    family_groups = await FamilyGroupRepository(db).get_all(limit=10000)
-    dietary_prefs = await DietaryPreferenceRepository(db).get_all(limit=10000)
-    rt_map = {r.id: r.name for r in relation_types}
-    fg_map = {f.id: f.name for f in family_groups}
-    dp_map = {d.id: d.name for d in dietary_prefs}
-
     columns = [
         ("first_name", "First Name"),
         ("last_name", "Last Name"),
         ("email", "Email"),
         ("phone", "Phone"),
         ("side", "Side"),
-        (lambda g: rt_map.get(g.relation_type_id, ""), "Relation Type"),
-        (lambda g: fg_map.get(g.family_group_id, ""), "Family Group"),
-        (lambda g: dp_map.get(g.dietary_preference_id, ""), "Dietary Preference"),
+        ("relation_type", "Relation Type"),
+        ("family_group", "Family Group"),
+        ("dietary_preference", "Dietary Preference"),
         ("age_group", "Age Group"),
         ("number_of_persons", "No. of Persons"),
         ("room_number", "Room Number"),
@@ -91,12 +90,30 @@ async def export_guests(
         ("created_at", "Created At"),
     ]
 
-    buffer = generate_excel(items, columns, "Guests")
-    return StreamingResponse(
-        buffer,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": "attachment; filename=guests.xlsx"},
-    )
+    return export_response(rows, columns, "Guests", "guests", export_format, model=Guest)
+
+
+@router.post("/import", response_model=GuestImportResponse)
+async def import_guests(
+    db: DbSession,
+    user: ManagerOrAdmin,
+    file: UploadFile = File(...),
+    dry_run: bool = False,
+):
+    """Bulk-create guests from an xlsx or CSV file (admin/manager).
+
+    Accepts the guest export's columns. Valid rows are created, invalid ones
+    are reported by spreadsheet row number; ``dry_run`` only validates.
+    """
+    max_bytes = settings.max_file_size_mb * 1024 * 1024
+    content = await file.read(max_bytes + 1)
+    if len(content) > max_bytes:
+        raise BadRequestException(
+            f"File too large. Maximum size is {settings.max_file_size_mb}MB"
+        )
+    rows = await read_spreadsheet(content, file.filename)
+    service = GuestService(db)
+    return await service.import_guests(rows, dry_run=dry_run)
 
 
 @router.get("/{guest_id}", response_model=GuestResponse)
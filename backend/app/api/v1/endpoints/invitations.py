@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Query
 
-from app.core.dependencies import DbSession, CurrentUser, AdminUser, ManagerOrAdmin, StaffUser
+from app.core.dependencies import DbSession, ReadDbSession, CurrentUser, AdminUser, ManagerOrAdmin, StaffUser
+from app.core.http_cache import conditional_get
 from app.schemas.invitation import (
     InvitationCreate, BulkInvitationCreate, InvitationUpdate,
     BulkRSVPUpdate, InvitationResponse, BulkInvitationResponse,
@@ -12,6 +13,8 @@ from app.repositories.guest import GuestRepository
 
 router = APIRouter(prefix="/invitations", tags=["Invitations"])
 
+RSVPSummaryCache = conditional_get("invitations", "events")
+
 
 @router.get("", response_model=list[InvitationResponse])
 async def list_all_invitations(db: DbSession, user: StaffUser):
@@ -38,16 +41,15 @@ async def get_invitations_by_event(
     user: StaffUser,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
 ):
     """Get invitations for an event (admin/manager/user)."""
     service = InvitationService(db)
     skip = (page - 1) * page_size
-    items = await service.get_by_event(event_id, skip, page_size)
-    total = await service.count_by_event(event_id)
-    return PaginatedResponse(
-        items=items, total=total, page=page, page_size=page_size,
-        total_pages=(total + page_size - 1) // page_size,
+    items, total, next_cursor = await service.get_by_event_page(
+        event_id, skip, page_size, cursor
     )
+    return PaginatedResponse.create(items, total, page, page_size, next_cursor)
 
 
 @router.get("/guest/{guest_id}", response_model=list[InvitationResponse])
@@ -60,7 +62,9 @@ async def get_invitations_by_guest(
 
 
 @router.get("/rsvp-summary/{event_id}", response_model=RSVPSummaryResponse)
-async def get_rsvp_summary(event_id: int, db: DbSession, user: StaffUser):
+async def get_rsvp_summary(
+    event_id: int, db: ReadDbSession, user: StaffUser, cache: RSVPSummaryCache
+):
     """Get RSVP summary for an event (admin/manager/user)."""
     service = InvitationService(db)
     return await service.get_rsvp_summary(event_id)
@@ -87,6 +91,13 @@ async def bulk_invite(data: BulkInvitationCreate, db: DbSession, user: ManagerOr
     return await service.bulk_invite(data)
 
 
+@router.put("/bulk-rsvp", response_model=list[InvitationResponse])
+async def bulk_update_rsvp(data: BulkRSVPUpdate, db: DbSession, user: ManagerOrAdmin):
+    """Bulk update RSVP statuses (manager/admin)."""
+    service = InvitationService(db)
+    return await service.bulk_update_rsvp(data)
+
+
 @router.put("/{invitation_id}", response_model=InvitationResponse)
 async def update_invitation(
     invitation_id: int, data: InvitationUpdate, db: DbSession, user: ManagerOrAdmin
@@ -96,13 +107,6 @@ async def update_invitation(
     return await service.update_invitation(invitation_id, data)
 
 
-@router.put("/bulk-rsvp", response_model=list[InvitationResponse])
-async def bulk_update_rsvp(data: BulkRSVPUpdate, db: DbSession, user: ManagerOrAdmin):
-    """Bulk update RSVP statuses (manager/admin)."""
-    service = InvitationService(db)
-    return await service.bulk_update_rsvp(data)
-
-
 @router.delete("/{invitation_id}", response_model=MessageResponse)
 async def delete_invitation(invitation_id: int, db: DbSession, admin: AdminUser):
     """Delete an invitation (admin only)."""
@@ -1,14 +1,18 @@
 from pathlib import Path
 
-from fastapi import APIRouter, UploadFile, File
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, BackgroundTasks, Query, Request, UploadFile, File
 
 from app.core.config import get_settings
 from app.core.dependencies import DbSession, StaffUser, ManagerOrAdmin
-from app.core.exceptions import NotFoundException
-from app.schemas.media_attachment import MediaAttachmentResponse
+from app.core.exceptions import BadRequestException, NotFoundException
+from app.core.http_cache import IMMUTABLE
+from app.schemas.media_attachment import EntityAttachmentsResponse, MediaAttachmentResponse
 from app.schemas.common import MessageResponse
-from app.services.media_attachment_service import MediaAttachmentService
+from app.services.media_attachment_service import MediaAttachmentService, BLOB_DIR
+from app.utils.file_serving import accel_redirect_response, file_response
+from app.utils.thumbnails import (
+    THUMBNAIL_MIME_TYPES, THUMBNAIL_SIZES, generate_thumbnails, thumbnail_path,
+)
 
 settings = get_settings()
 
@@ -25,56 +29,128 @@ async def upload_attachments(
     entity_id: int,
     db: DbSession,
     user: StaffUser,
+    background_tasks: BackgroundTasks,
     files: list[UploadFile] = File(...),
 ):
     """Upload one or more files to a vendor_service or task."""
     service = MediaAttachmentService(db)
-    return await service.upload_files(entity_type, entity_id, files)
-
-
-@router.get(
-    "/{entity_type}/{entity_id}",
-    response_model=list[MediaAttachmentResponse],
-)
-async def get_attachments(
-    entity_type: str,
-    entity_id: int,
-    db: DbSession,
-    user: StaffUser,
-):
-    """Get all attachments for a vendor_service or task."""
-    service = MediaAttachmentService(db)
-    return await service.get_attachments(entity_type, entity_id)
+    return await service.upload_files(entity_type, entity_id, files, background_tasks)
 
 
 @router.get("/file/{attachment_id}")
 async def serve_file(
     attachment_id: int,
+    request: Request,
     db: DbSession,
     user: StaffUser,
 ):
-    """Serve/download a specific attachment file."""
+    """Serve/download a specific attachment file.
+
+    With ``media_accel_redirect_location`` set, nginx sends the bytes
+    after this authorization check; otherwise they are served here with
+    Range and conditional GET support.
+    """
     service = MediaAttachmentService(db)
     attachment = await service.get_attachment(attachment_id)
 
+    if settings.media_accel_redirect_location:
+        return accel_redirect_response(
+            settings.media_accel_redirect_location.rstrip("/") + "/" + attachment.upload_path,
+            attachment.original_filename,
+            attachment.mime_type,
+        )
+
     abs_path = Path(settings.upload_dir) / attachment.upload_path
     if not abs_path.exists():
         raise NotFoundException("File not found on disk")
 
-    return FileResponse(
-        path=str(abs_path),
-        filename=attachment.original_filename,
-        media_type=attachment.mime_type,
+    # Blobs are named by their SHA-256, which makes a strong ETag
+    etag = None
+    if attachment.upload_path.startswith(f"{BLOB_DIR}/"):
+        etag = f'"{abs_path.name}"'
+    return file_response(
+        request, abs_path, attachment.original_filename, attachment.mime_type, etag=etag
     )
 
 
+@router.get("/thumbnail/{attachment_id}")
+async def serve_thumbnail(
+    attachment_id: int,
+    request: Request,
+    db: DbSession,
+    user: StaffUser,
+    size: int = Query(THUMBNAIL_SIZES[0]),
+):
+    """Serve a WebP preview of an image attachment.
+
+    Previews are made in the background after upload (or by the backfill
+    command); a missing one is created on the spot. An attachment never
+    changes, so clients may keep the response for a year.
+    """
+    if size not in THUMBNAIL_SIZES:
+        raise BadRequestException(
+            f"Invalid size. Must be one of: {', '.join(map(str, THUMBNAIL_SIZES))}"
+        )
+    service = MediaAttachmentService(db)
+    attachment = await service.get_attachment(attachment_id)
+    if attachment.mime_type not in THUMBNAIL_MIME_TYPES:
+        raise NotFoundException("No thumbnail for this attachment")
+
+    relative_path = thumbnail_path(attachment.upload_path, size)
+    abs_path = Path(settings.upload_dir) / relative_path
+    if not abs_path.exists() and not await generate_thumbnails(attachment.upload_path):
+        raise NotFoundException("No thumbnail for this attachment")
+
+    filename = f"{Path(attachment.original_filename).stem}.webp"
+    if settings.media_accel_redirect_location:
+        return accel_redirect_response(
+            settings.media_accel_redirect_location.rstrip("/") + "/" + relative_path,
+            filename,
+            "image/webp",
+            cache_control=IMMUTABLE,
+        )
+    return file_response(request, abs_path, filename, "image/webp", cache_control=IMMUTABLE)
+
+
+@router.get(
+    "/batch/{entity_type}",
+    response_model=list[EntityAttachmentsResponse],
+)
+async def get_batch_attachments(
+    entity_type: str,
+    db: DbSession,
+    user: StaffUser,
+    entity_ids: list[int] = Query(..., min_length=1),
+    limit: int | None = Query(None, ge=0, description="Newest attachments per entity; 0 for counts only"),
+):
+    """Get attachment counts and lists for many vendor_services or tasks at once."""
+    service = MediaAttachmentService(db)
+    return await service.get_batch_attachments(entity_type, entity_ids, limit)
+
+
+@router.get(
+    "/{entity_type}/{entity_id}",
+    response_model=list[MediaAttachmentResponse],
+)
+async def get_attachments(
+    entity_type: str,
+    entity_id: int,
+    db: DbSession,
+    user: StaffUser,
+):
+    """Get all attachments for a vendor_service or task."""
+    service = MediaAttachmentService(db)
+    return await service.get_attachments(entity_type, entity_id)
+
+
 @router.delete("/{attachment_id}", response_model=MessageResponse)
 async def delete_attachment(
     attachment_id: int,
     db: DbSession,
     user: ManagerOrAdmin,
+    background_tasks: BackgroundTasks,
 ):
     """Delete an attachment (manager/admin only)."""
     service = MediaAttachmentService(db)
-    await service.delete_attachment(attachment_id)
+    await service.delete_attachment(attachment_id, background_tasks)
     return MessageResponse(message="Attachment deleted successfully")
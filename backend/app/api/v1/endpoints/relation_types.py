@@ -1,15 +1,19 @@
 from fastapi import APIRouter
 
 from app.core.dependencies import DbSession, AdminUser, ManagerOrAdmin
+from app.core.http_cache import conditional_get, max_age
 from app.schemas.lookup import LookupCreate, LookupUpdate, LookupResponse
 from app.schemas.common import MessageResponse
 from app.services.relation_type_service import RelationTypeService
 
 router = APIRouter(prefix="/relation-types", tags=["Relation Types"])
 
+# Lookup lists rarely change: clients may reuse them for a minute
+ListCache = conditional_get("relation_types", cache_control=max_age(60))
+
 
 @router.get("", response_model=list[LookupResponse])
-async def get_relation_types(db: DbSession, user: ManagerOrAdmin):
+async def get_relation_types(db: DbSession, user: ManagerOrAdmin, cache: ListCache):
     """Get all active relation types (manager/admin)."""
     service = RelationTypeService(db)
     return await service.get_all()
@@ -1,15 +1,14 @@
 from fastapi import APIRouter, Query
-from fastapi.responses import StreamingResponse
 
-from app.core.dependencies import DbSession, CurrentUser, AdminUser, ManagerOrAdmin, StaffUser
+from app.core.dependencies import DbSession, ReadDbSession, CurrentUser, AdminUser, ManagerOrAdmin, StaffUser
 from app.core.exceptions import ForbiddenException
+from app.db.session import stream_in_session
 from app.models.enums import TaskStatus, TaskPriority
-from app.repositories.event import EventRepository
-from app.repositories.user import UserRepository
+from app.models.task import Task
 from app.schemas.task import TaskCreate, TaskUpdate, TaskUserUpdate, TaskResponse, TaskSummaryResponse
 from app.schemas.common import MessageResponse, PaginatedResponse
 from app.services.task_service import TaskService
-from app.utils.excel import generate_excel
+from app.utils.export import ExportFormat, export_response
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
@@ -20,6 +19,7 @@ async def get_tasks(
     user: ManagerOrAdmin,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
     status: TaskStatus | None = None,
     priority: TaskPriority | None = None,
     event_id: int | None = None,
@@ -28,19 +28,16 @@ async def get_tasks(
     """Get all tasks with optional filters (manager/admin)."""
     service = TaskService(db)
     skip = (page - 1) * page_size
-    items = await service.get_tasks(
+    items, total, next_cursor = await service.get_tasks_page(
         skip=skip, limit=page_size, status=status, priority=priority,
         event_id=event_id, assigned_to_user_id=assigned_to_user_id,
+        cursor=cursor,
     )
-    total = await service.count_tasks()
-    return PaginatedResponse(
-        items=items, total=total, page=page, page_size=page_size,
-        total_pages=(total + page_size - 1) // page_size,
-    )
+    return PaginatedResponse.create(items, total, page, page_size, next_cursor)
 
 
 @router.get("/summary", response_model=TaskSummaryResponse)
-async def get_task_summary(db: DbSession, user: ManagerOrAdmin):
+async def get_task_summary(db: ReadDbSession, user: ManagerOrAdmin):
     """Get task summary statistics (manager/admin)."""
     service = TaskService(db)
     return await service.get_summary()
@@ -48,31 +45,27 @@ async def get_task_summary(db: DbSession, user: ManagerOrAdmin):
 
 @router.get("/export")
 async def export_tasks(
-    db: DbSession,
     user: ManagerOrAdmin,
     status: TaskStatus | None = None,
     priority: TaskPriority | None = None,
     event_id: int | None = None,
     assigned_to_user_id: int | None = None,
+    export_format: ExportFormat = Query(ExportFormat.XLSX, alias="format"),
 ):
-    """Export tasks to Excel (manager/admin)."""
-    service = TaskService(db)
-    items = await service.get_tasks(
-        skip=0, limit=10000, status=status, priority=priority,
-        event_id=event_id, assigned_to_user_id=assigned_to_user_id,
+    """Export tasks as xlsx, CSV or Parquet (manager/admin)."""
+    rows = stream_in_session(
+        lambda session: TaskService(session).stream_tasks(
+            status=status, priority=priority,
+            event_id=event_id, assigned_to_user_id=assigned_to_user_id,
+        )
     )
 
-    events = await EventRepository(db).get_all(limit=10000)
-    users = await UserRepository(db).get_all(limit=10000)
-    event_map = {e.id: e.name for e in events}
-    user_map = {u.id: u.email for u in users}
-
     columns = [
         ("title", "Title"),
         ("description", "Description"),
-        (lambda t: event_map.get(t.event_id, ""), "Event"),
-        (lambda t: user_map.get(t.assigned_to_user_id, ""), "Assigned To"),
-        (lambda t: user_map.get(t.created_by_user_id, ""), "Created By"),
+        ("event", "Event"),
+        ("assigned_to", "Assigned To"),
+        ("created_by", "Created By"),
         ("priority", "Priority"),
         ("status", "Status"),
         ("due_date", "Due Date"),
@@ -80,12 +73,7 @@ async def export_tasks(
         ("created_at", "Created At"),
     ]
 
-    buffer = generate_excel(items, columns, "Tasks")
-    return StreamingResponse(
-        buffer,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": "attachment; filename=tasks.xlsx"},
-    )
+    return export_response(rows, columns, "Tasks", "tasks", export_format, model=Task)
 
 
 @router.get("/overdue", response_model=list[TaskResponse])
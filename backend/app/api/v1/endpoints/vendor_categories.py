@@ -1,15 +1,19 @@
 from fastapi import APIRouter
 
 from app.core.dependencies import DbSession, AdminUser, ManagerOrAdmin
+from app.core.http_cache import conditional_get, max_age
 from app.schemas.lookup import LookupCreate, LookupUpdate, LookupResponse
 from app.schemas.common import MessageResponse
 from app.services.vendor_category_service import VendorCategoryService
 
 router = APIRouter(prefix="/vendor-categories", tags=["Vendor Categories"])
 
+# Lookup lists rarely change: clients may reuse them for a minute
+ListCache = conditional_get("vendor_categories", cache_control=max_age(60))
+
 
 @router.get("", response_model=list[LookupResponse])
-async def get_vendor_categories(db: DbSession, user: ManagerOrAdmin):
+async def get_vendor_categories(db: DbSession, user: ManagerOrAdmin, cache: ListCache):
     """Get all active vendor categories (manager/admin)."""
     service = VendorCategoryService(db)
     return await service.get_all()
@@ -1,20 +1,22 @@
 from fastapi import APIRouter, Query
-from fastapi.responses import StreamingResponse
 
-from app.core.dependencies import DbSession, AdminUser, ManagerOrAdmin, StaffUser
+from app.core.dependencies import DbSession, ReadDbSession, AdminUser, ManagerOrAdmin, StaffUser
+from app.core.http_cache import conditional_get
+from app.db.session import stream_in_session
 from app.models.enums import VendorServiceStatus
-from app.repositories.vendor import VendorRepository
-from app.repositories.event import EventRepository
+from app.models.vendor_service import VendorServiceItem
 from app.schemas.vendor_service import (
     VendorServiceCreate, VendorServiceUpdate,
     VendorServiceResponse, VendorServiceSummaryResponse,
 )
 from app.schemas.common import MessageResponse, PaginatedResponse
 from app.services.vendor_service_manager import VendorServiceManager
-from app.utils.excel import generate_excel
+from app.utils.export import ExportFormat, export_response
 
 router = APIRouter(prefix="/vendor-services", tags=["Vendor Services"])
 
+SummaryCache = conditional_get("vendor_services")
+
 
 @router.get("", response_model=PaginatedResponse[VendorServiceResponse])
 async def get_vendor_services(
@@ -22,6 +24,7 @@ async def get_vendor_services(
     user: StaffUser,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=1000),
+    cursor: str | None = None,
     vendor_id: int | None = None,
     event_id: int | None = None,
     status: VendorServiceStatus | None = None,
@@ -30,19 +33,18 @@ async def get_vendor_services(
     """Get all vendor services with optional filters (admin/manager/user)."""
     service = VendorServiceManager(db)
     skip = (page - 1) * page_size
-    items = await service.get_services(
+    items, total, next_cursor = await service.get_services_page(
         skip=skip, limit=page_size, vendor_id=vendor_id,
         event_id=event_id, status=status, unassigned=unassigned,
+        cursor=cursor,
     )
-    total = await service.count_services()
-    return PaginatedResponse(
-        items=items, total=total, page=page, page_size=page_size,
-        total_pages=(total + page_size - 1) // page_size,
-    )
+    return PaginatedResponse.create(items, total, page, page_size, next_cursor)
 
 
 @router.get("/summary", response_model=VendorServiceSummaryResponse)
-async def get_vendor_service_summary(db: DbSession, user: StaffUser):
+async def get_vendor_service_summary(
+    db: ReadDbSession, user: StaffUser, cache: SummaryCache
+):
     """Get vendor service summary statistics (admin/manager/user)."""
     service = VendorServiceManager(db)
     return await service.get_summary()
@@ -50,29 +52,24 @@ async def get_vendor_service_summary(db: DbSession, user: StaffUser):
 
 @router.get("/export")
 async def export_vendor_services(
-    db: DbSession,
     user: StaffUser,
     vendor_id: int | None = None,
     event_id: int | None = None,
     status: VendorServiceStatus | None = None,
+    export_format: ExportFormat = Query(ExportFormat.XLSX, alias="format"),
 ):
-    """Export vendor services to Excel (admin/manager/user)."""
-    service = VendorServiceManager(db)
-    items = await service.get_services(
-        skip=0, limit=10000, vendor_id=vendor_id,
-        event_id=event_id, status=status,
+    """Export vendor services as xlsx, CSV or Parquet (admin/manager/user)."""
+    rows = stream_in_session(
+        lambda session: VendorServiceManager(session).stream_services(
+            vendor_id=vendor_id, event_id=event_id, status=status,
+        )
     )
 
-    vendors = await VendorRepository(db).get_all(limit=10000)
-    events = await EventRepository(db).get_all(limit=10000)
-    vendor_map = {v.id: v.name for v in vendors}
-    event_map = {e.id: e.name for e in events}
-
     columns = [
         ("title", "Title"),
         ("description", "Description"),
-        (lambda vs: vendor_map.get(vs.vendor_id, ""), "Vendor"),
-        (lambda vs: event_map.get(vs.event_id, ""), "Event"),
+        ("vendor", "Vendor"),
+        ("event", "Event"),
         ("service_date", "Service Date"),
         ("start_time", "Start Time"),
         ("end_time", "End Time"),
@@ -82,11 +79,9 @@ async def export_vendor_services(
         ("created_at", "Created At"),
     ]
 
-    buffer = generate_excel(items, columns, "Vendor Services")
-    return StreamingResponse(
-        buffer,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": "attachment; filename=vendor_services.xlsx"},
+    return export_response(
+        rows, columns, "Vendor Services", "vendor_services", export_format,
+        model=VendorServiceItem,
     )
 
 
@@ -1,15 +1,18 @@
 from fastapi import APIRouter, Query
-from fastapi.responses import StreamingResponse
 
-from app.core.dependencies import DbSession, AdminUser, ManagerOrAdmin, StaffUser
-from app.repositories.vendor_category import VendorCategoryRepository
+from app.core.dependencies import DbSession, ReadDbSession, AdminUser, ManagerOrAdmin, StaffUser
+from app.core.http_cache import conditional_get
+from app.db.session import stream_in_session
+from app.models.vendor import Vendor
 from app.schemas.vendor import VendorCreate, VendorUpdate, VendorResponse, VendorSummaryResponse
 from app.schemas.common import MessageResponse, PaginatedResponse
 from app.services.vendor_service import VendorService
-from app.utils.excel import generate_excel
+from app.utils.export import ExportFormat, export_response
 
 router = APIRouter(prefix="/vendors", tags=["Vendors"])
 
+SummaryCache = conditional_get("vendors", "vendor_categories")
+
 
 @router.get("", response_model=PaginatedResponse[VendorResponse])
 async def get_vendors(
@@ -35,7 +38,7 @@ async def get_vendors(
 
 
 @router.get("/summary", response_model=VendorSummaryResponse)
-async def get_vendor_summary(db: DbSession, user: StaffUser):
+async def get_vendor_summary(db: ReadDbSession, user: StaffUser, cache: SummaryCache):
     """Get vendor summary statistics (admin/manager/user)."""
     service = VendorService(db)
     return await service.get_summary()
@@ -43,24 +46,21 @@ async def get_vendor_summary(db: DbSession, user: StaffUser):
 
 @router.get("/export")
 async def export_vendors(
-    db: DbSession,
     user: StaffUser,
     vendor_category_id: int | None = None,
     is_booked: bool | None = None,
+    export_format: ExportFormat = Query(ExportFormat.XLSX, alias="format"),
 ):
-    """Export vendors to Excel (admin/manager/user)."""
-    service = VendorService(db)
-    items = await service.get_vendors(
-        skip=0, limit=10000,
-        vendor_category_id=vendor_category_id, is_booked=is_booked,
+    """Export vendors as xlsx, CSV or Parquet (admin/manager/user)."""
+    rows = stream_in_session(
+        lambda session: VendorService(session).stream_vendors(
+            vendor_category_id=vendor_category_id, is_booked=is_booked,
+        )
     )
 
-    categories = await VendorCategoryRepository(db).get_all(limit=10000)
-    cat_map = {c.id: c.name for c in categories}
-
     columns = [
         ("name", "Name"),
-        (lambda v: cat_map.get(v.vendor_category_id, ""), "Vendor Category"),
+        ("vendor_category", "Vendor Category"),
         ("contact_person", "Contact Person"),
         ("phone", "Phone"),
         ("email", "Email"),
@@ -71,12 +71,7 @@ async def export_vendors(
         ("created_at", "Created At"),
     ]
 
-    buffer = generate_excel(items, columns, "Vendors")
-    return StreamingResponse(
-        buffer,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": "attachment; filename=vendors.xlsx"},
-    )
+    return export_response(rows, columns, "Vendors", "vendors", export_format, model=Vendor)
 
 
 @router.get("/{vendor_id}", response_model=VendorResponse)
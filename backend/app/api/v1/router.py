@@ -18,6 +18,7 @@ from app.api.v1.endpoints import (
     gifts,
     vendor_services,
     media_attachments,
+    dashboard,
 )
 
 router = APIRouter(prefix="/api/v1")
@@ -39,3 +40,4 @@ router.include_router(tasks.router)
 router.include_router(gifts.router)
 router.include_router(vendor_services.router)
 router.include_router(media_attachments.router)
+router.include_router(dashboard.router)
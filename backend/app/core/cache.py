@@ -0,0 +1,187 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Hashable
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.http_cache import table_versions
+from app.models.dietary_preference import DietaryPreference
+from app.models.event_type import EventType
+from app.models.family_group import FamilyGroup
+from app.models.gift_type import GiftType
+from app.models.relation_type import RelationType
+from app.models.vendor_category import VendorCategory
+
+settings = get_settings()
+
+
+class TTLCache:
+    """Small in-process LRU cache whose entries expire after ``ttl`` seconds.
+
+    Entries live in the worker process only, so with several workers an
+    invalidation reaches just the one that made the change; the TTL bounds
+    how long the others can serve a stale entry. ``ttl <= 0`` disables it.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+@dataclass(frozen=True, slots=True)
+class AuthenticatedUser:
+    """The fields of the requesting user that authorization needs."""
+
+    id: int
+    email: str
+    role: str
+    is_active: bool
+
+    @classmethod
+    def from_user(cls, user) -> "AuthenticatedUser":
+        return cls(id=user.id, email=user.email, role=user.role, is_active=user.is_active)
+
+
+# Active-user snapshots keyed by user id, read by get_current_user.
+user_cache = TTLCache(settings.user_cache_max_size, settings.user_cache_ttl_seconds)
+
+
+def _invalidate(cache: TTLCache, db: AsyncSession, key: Hashable) -> None:
+    """Drop ``key`` now and again once ``db``'s transaction ends.
+
+    The second pop covers a concurrent request re-caching the old row
+    between this call and the commit that makes the change visible, or
+    this request caching its own write before a rollback.
+    """
+    cache.pop(key)
+    for name in ("after_commit", "after_rollback"):
+        event.listen(db.sync_session, name, lambda _: cache.pop(key), once=True)
+
+
+def invalidate_user(db: AsyncSession, user_id: int) -> None:
+    """Forget a user's snapshot after a profile, role or status change."""
+    _invalidate(user_cache, db, user_id)
+
+
+@dataclass(frozen=True, slots=True)
+class LookupEntry:
+    """Read-only copy of a lookup-table row (event type, gift type, ...)."""
+
+    id: int
+    name: str
+    description: str | None
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+LOOKUP_MODELS = frozenset(
+    {EventType, VendorCategory, DietaryPreference, GiftType, RelationType, FamilyGroup}
+)
+
+
+class LookupCache:
+    """Whole-table copies of the lookup tables, keyed by model.
+
+    A table is loaded in one query on first use (or by ``warm`` at
+    startup) and dropped by the owning service on every write. Other
+    workers drop it when their table versions show the change, or at the
+    latest when the TTL runs out; an id missing from their copy reloads it
+    straight away.
+    """
+
+    def __init__(self, ttl: float):
+        self._tables = TTLCache(maxsize=32, ttl=ttl)
+
+    async def _load(self, db: AsyncSession, model) -> dict[int, LookupEntry]:
+        result = await db.execute(
+            select(model).where(model.is_deleted == False).order_by(model.name)
+        )
+        table = {
+            row.id: LookupEntry(
+                id=row.id,
+                name=row.name,
+                description=row.description,
+                is_active=row.is_active,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
+            )
+            for row in result.scalars()
+        }
+        self._tables.set(model, table)
+        return table
+
+    async def _table(self, db: AsyncSession, model) -> dict[int, LookupEntry]:
+        table = self._tables.get(model)
+        if table is None:
+            table = await self._load(db, model)
+        return table
+
+    async def get(self, db: AsyncSession, model, id: int) -> LookupEntry | None:
+        """Entry by id (active or not, excludes soft-deleted).
+
+        A miss on a cached copy reloads the table once before answering
+        ``None``: the row may have been created by another worker since
+        the copy was taken.
+        """
+        table = self._tables.get(model)
+        if table is None or id not in table:
+            table = await self._load(db, model)
+        return table.get(id)
+
+    async def get_active(self, db: AsyncSession, model) -> list[LookupEntry]:
+        """Active entries ordered by name."""
+        return [e for e in (await self._table(db, model)).values() if e.is_active]
+
+    async def ids_by_name(self, db: AsyncSession, model) -> dict[str, int]:
+        """Case-insensitive name -> id for every entry (active or not)."""
+        return {e.name.casefold(): e.id for e in (await self._table(db, model)).values()}
+
+    async def warm(self, db: AsyncSession, models) -> None:
+        for model in models:
+            await self._table(db, model)
+
+    def invalidate(self, db: AsyncSession, model) -> None:
+        """Forget ``model``'s table after a write made through ``db``."""
+        _invalidate(self._tables, db, model)
+
+    def forget(self, model) -> None:
+        self._tables.pop(model)
+
+
+lookup_cache = LookupCache(settings.lookup_cache_ttl_seconds)
+
+for _model in LOOKUP_MODELS:
+    table_versions.subscribe(
+        _model.__tablename__, lambda model=_model: lookup_cache.forget(model)
+    )
@@ -16,6 +16,15 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str
+    # Optional read replica for summary and export queries
+    database_read_url: str = ""
+    db_echo: bool = False
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_statement_cache_size: int = 100
 
     # Redis
     redis_url: str = "redis://localhost:6379/0"
@@ -26,6 +35,29 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 7
 
+    # Password hashing: bcrypt cost (log2 rounds) and hashing threads
+    bcrypt_rounds: int = 12
+    password_hash_workers: int = 4
+
+    # Auth cache: current-user snapshots are reused for this many seconds
+    # (0 disables). With trust_token_claims, role/active claims in a valid
+    # access token are used as-is and the users table is not read at all.
+    user_cache_ttl_seconds: int = 60
+    user_cache_max_size: int = 1024
+    trust_token_claims: bool = False
+
+    # Lookup tables (event types, gift types, ...) are cached per worker
+    # and reloaded after this many seconds or on any local write
+    lookup_cache_ttl_seconds: int = 300
+
+    # Dashboard snapshots are rebuilt after any write to their tables and
+    # at least this often (time-based counts like overdue tasks drift)
+    dashboard_snapshot_max_age_seconds: int = 300
+
+    # How long a worker trusts its copy of the table version counters behind
+    # ETags before re-reading them (its own writes expire it immediately)
+    http_cache_version_ttl_seconds: float = 1.0
+
     # LLM API Keys
     openai_api_key: str = ""
     anthropic_api_key: str = ""
@@ -35,6 +67,11 @@ class Settings(BaseSettings):
     # File uploads
     upload_dir: str = "uploads"
     max_file_size_mb: int = 10
+    # nginx ``internal`` location aliasing upload_dir (e.g. "/_protected_media/");
+    # when set, downloads are handed to nginx with X-Accel-Redirect
+    media_accel_redirect_location: str = ""
+    # Threads creating WebP previews of uploaded images
+    thumbnail_workers: int = 2
 
     # First Admin
     first_admin_email: str = "admin@example.com"
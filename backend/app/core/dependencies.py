@@ -4,22 +4,30 @@ from fastapi import Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
+from app.core.cache import AuthenticatedUser, user_cache
+from app.core.config import get_settings
 from app.core.security import decode_token
 from app.core.exceptions import UnauthorizedException, ForbiddenException
 from app.repositories.user import UserRepository
-from app.models.user import User
+
+settings = get_settings()
 
 security = HTTPBearer()
 
 DbSession = Annotated[AsyncSession, Depends(get_db)]
+ReadDbSession = Annotated[AsyncSession, Depends(get_read_db)]
 
 
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
     db: DbSession,
-) -> User:
-    """Get current authenticated user from JWT token."""
+) -> AuthenticatedUser:
+    """Get current authenticated user from JWT token.
+
+    The user row is read at most once per ``user_cache_ttl_seconds`` per
+    worker; with ``trust_token_claims`` it is not read at all.
+    """
     token = credentials.credentials
 
     payload = decode_token(token)
@@ -33,10 +41,24 @@ async def get_current_user(
     if not user_id:
         raise UnauthorizedException("Invalid token payload")
 
-    user_repo = UserRepository(db)
-    user = await user_repo.get_by_id(int(user_id))
-    if not user:
-        raise UnauthorizedException("User not found")
+    user_id = int(user_id)
+    if settings.trust_token_claims and "role" in payload:
+        user = AuthenticatedUser(
+            id=user_id,
+            email=payload.get("email", ""),
+            role=payload["role"],
+            is_active=bool(payload.get("active")),
+        )
+    else:
+        user = user_cache.get(user_id)
+        if user is None:
+            user_repo = UserRepository(db)
+            db_user = await user_repo.get_by_id(user_id)
+            if not db_user:
+                raise UnauthorizedException("User not found")
+            user = AuthenticatedUser.from_user(db_user)
+            if user.is_active:
+                user_cache.set(user_id, user)
 
     if not user.is_active:
         raise UnauthorizedException("User is inactive")
@@ -45,8 +67,8 @@ async def get_current_user(
 
 
 async def get_current_active_user(
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> User:
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
+) -> AuthenticatedUser:
     """Ensure user is active."""
     return current_user
 
@@ -54,8 +76,8 @@ async def get_current_active_user(
 def require_roles(*allowed_roles: str):
     """Factory for role-based dependency injection."""
     async def check_role(
-        current_user: Annotated[User, Depends(get_current_active_user)],
-    ) -> User:
+        current_user: Annotated[AuthenticatedUser, Depends(get_current_active_user)],
+    ) -> AuthenticatedUser:
         if current_user.role not in allowed_roles:
             raise ForbiddenException("Insufficient permissions")
         return current_user
@@ -63,7 +85,7 @@ def require_roles(*allowed_roles: str):
 
 
 # Type aliases for cleaner endpoint signatures
-CurrentUser = Annotated[User, Depends(get_current_active_user)]
-AdminUser = Annotated[User, Depends(require_roles("admin"))]
-ManagerOrAdmin = Annotated[User, Depends(require_roles("admin", "manager"))]
-StaffUser = Annotated[User, Depends(require_roles("admin", "manager", "user"))]
+CurrentUser = Annotated[AuthenticatedUser, Depends(get_current_active_user)]
+AdminUser = Annotated[AuthenticatedUser, Depends(require_roles("admin"))]
+ManagerOrAdmin = Annotated[AuthenticatedUser, Depends(require_roles("admin", "manager"))]
+StaffUser = Annotated[AuthenticatedUser, Depends(require_roles("admin", "manager", "user"))]
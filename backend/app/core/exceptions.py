@@ -28,3 +28,10 @@ class NotFoundException(HTTPException):
 class ConflictException(HTTPException):
     def __init__(self, detail: str = "Resource already exists"):
         super().__init__(status_code=status.HTTP_409_CONFLICT, detail=detail)
+
+
+class NotModifiedException(HTTPException):
+    """304 for a conditional GET whose ETag still matches (no body)."""
+
+    def __init__(self, headers: dict[str, str]):
+        super().__init__(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
@@ -0,0 +1,106 @@
+import hashlib
+import time
+from collections.abc import Callable, Sequence
+from typing import Annotated
+
+from fastapi import Depends, Request, Response
+from sqlalchemy import select
+
+from app.core.config import get_settings
+from app.core.exceptions import NotModifiedException
+from app.db.session import ReadSessionLocal
+from app.models.table_version import TableVersion
+
+settings = get_settings()
+
+# Tables whose writes never change an API payload; versioning them would
+# bump a counter on every dashboard read (and on every version bump).
+UNVERSIONED_TABLES = frozenset({"table_versions", "dashboard_snapshots"})
+
+# Cache-Control policies used by the routers
+REVALIDATE = "private, no-cache"
+IMMUTABLE = "private, max-age=31536000, immutable"
+
+
+def max_age(seconds: int) -> str:
+    """Policy letting clients reuse a response for ``seconds`` before revalidating."""
+    return f"private, max-age={seconds}"
+
+
+class TableVersions:
+    """Worker-local copy of the ``table_versions`` counters.
+
+    Reloaded in one small SELECT at most every ``ttl`` seconds, and on the
+    next read after this worker commits a write; a client therefore sees
+    its own changes at once and other workers' within ``ttl``. Read from
+    the read engine so versions never run ahead of replica data.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._versions: dict[str, int] = {}
+        self._loaded_at = float("-inf")
+        self._subscribers: dict[str, list[Callable[[], None]]] = {}
+
+    def subscribe(self, table_name: str, callback: Callable[[], None]) -> None:
+        """Call ``callback`` whenever a reload finds ``table_name`` changed."""
+        self._subscribers.setdefault(table_name, []).append(callback)
+
+    def expire(self) -> None:
+        self._loaded_at = float("-inf")
+
+    async def _reload(self) -> None:
+        async with ReadSessionLocal() as session:
+            result = await session.execute(
+                select(TableVersion.table_name, TableVersion.version)
+            )
+            versions = dict(result.all())
+        for table_name, callbacks in self._subscribers.items():
+            if versions.get(table_name) != self._versions.get(table_name):
+                for callback in callbacks:
+                    callback()
+        self._versions = versions
+        self._loaded_at = time.monotonic()
+
+    async def get(self, tables: Sequence[str]) -> tuple[int, ...]:
+        if time.monotonic() - self._loaded_at >= self.ttl:
+            await self._reload()
+        return tuple(self._versions.get(table, 0) for table in tables)
+
+
+table_versions = TableVersions(settings.http_cache_version_ttl_seconds)
+
+
+def etag_matches(etag: str, if_none_match: str | None) -> bool:
+    """Weak comparison against an If-None-Match header (RFC 9110 13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def conditional_get(*tables: str, cache_control: str = REVALIDATE):
+    """Annotated dependency for a GET whose payload depends only on ``tables``.
+
+    The ETag hashes the URL with the tables' versions. A matching
+    ``If-None-Match`` ends the request with 304 before the endpoint runs
+    its queries or serializes anything; otherwise ``ETag`` and
+    ``Cache-Control`` are added to the response. Declare it after the
+    user parameter so authentication and role checks run first.
+    """
+
+    async def check(request: Request, response: Response) -> None:
+        versions = await table_versions.get(tables)
+        key = f"{request.url.path}?{request.url.query}|{versions}"
+        etag = f'W/"{hashlib.sha1(key.encode()).hexdigest()[:20]}"'
+        headers = {"ETag": etag, "Cache-Control": cache_control}
+        if etag_matches(etag, request.headers.get("if-none-match")):
+            raise NotModifiedException(headers)
+        response.headers.update(headers)
+
+    return Annotated[None, Depends(check)]
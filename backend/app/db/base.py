@@ -21,3 +21,5 @@ from app.models.task import Task
 from app.models.gift import Gift
 from app.models.vendor_service import VendorServiceItem
 from app.models.media_attachment import MediaAttachment
+from app.models.dashboard_snapshot import DashboardSnapshot
+from app.models.table_version import TableVersion
@@ -4,11 +4,14 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import select
 
+from app.core.cache import LOOKUP_MODELS, lookup_cache
 from app.core.config import get_settings
+from app.core.dependencies import AdminUser
 from app.api.v1.router import router as v1_router
-from app.db.session import engine
+from app.db.session import AsyncSessionLocal, engine, read_engine, pool_stats
 from app.db.base import Base
 from app.repositories.user import UserRepository
+from app.services.dashboard_service import DashboardService
 from app.core.security import hash_password
 from app.models.event_type import EventType
 from app.models.vendor_category import VendorCategory
@@ -56,7 +59,7 @@ async def create_first_admin(engine):
         if not admin:
             admin_data = {
                 "email": settings.first_admin_email,
-                "hashed_password": hash_password(settings.first_admin_password),
+                "hashed_password": await hash_password(settings.first_admin_password),
                 "first_name": "Admin",
                 "last_name": "User",
                 "role": "admin",
@@ -93,8 +96,14 @@ async def lifespan(app: FastAPI):
 
     await create_first_admin(engine)
     await seed_lookup_tables(engine)
+    async with AsyncSessionLocal() as session:
+        await lookup_cache.warm(session, LOOKUP_MODELS)
+        await DashboardService(session).ensure_sections()
+        await session.commit()
     yield
     await engine.dispose()
+    if read_engine is not engine:
+        await read_engine.dispose()
 
 
 app = FastAPI(
@@ -119,3 +128,15 @@ app.include_router(v1_router)
 @app.get("/")
 async def root():
     return {"app": settings.app_name, "version": "1.0.0", "docs": "/docs"}
+
+
+@app.get("/health")
+async def health():
+    """Liveness probe; public and touches nothing but the process."""
+    return {"status": "ok"}
+
+
+@app.get("/health/db")
+async def db_health(user: AdminUser):
+    """Connection pool usage, for monitoring (admins only)."""
+    return pool_stats()
@@ -1,6 +1,6 @@
 from datetime import date
 
-from sqlalchemy import String, Text, Numeric, Date, ForeignKey, Enum as SAEnum
+from sqlalchemy import String, Text, Numeric, Date, ForeignKey, Index, Enum as SAEnum
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base
@@ -49,3 +49,21 @@ class Expense(Base):
         nullable=True,
     )
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+
+# Partial indexes matching ExpenseRepository list filters/ordering
+Index(
+    "ix_expenses_active_payment_date",
+    Expense.payment_date.desc().nullslast(), Expense.id.desc(),
+    postgresql_where=Expense.is_deleted == False,
+)
+Index(
+    "ix_expenses_active_payment_status",
+    Expense.payment_status, Expense.payment_date.desc().nullslast(), Expense.id.desc(),
+    postgresql_where=Expense.is_deleted == False,
+)
+Index(
+    "ix_expenses_active_budget",
+    Expense.budget_id,
+    postgresql_where=Expense.is_deleted == False,
+)
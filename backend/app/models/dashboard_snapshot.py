@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from sqlalchemy import String, Integer, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class DashboardSnapshot(Base):
+    """Precomputed summary for one dashboard section (guests, budget, ...).
+
+    Writes to the section's tables bump ``version``; the snapshot is
+    current while ``built_version`` matches it.
+    """
+
+    __tablename__ = "dashboard_snapshots"
+
+    section: Mapped[str] = mapped_column(String(50), nullable=False, unique=True)
+    version: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    built_version: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    data: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    built_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
@@ -1,6 +1,6 @@
 from datetime import date, time
 
-from sqlalchemy import String, Text, Date, Time, ForeignKey, Enum as SAEnum
+from sqlalchemy import String, Text, Date, Time, ForeignKey, Index, Enum as SAEnum
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base
@@ -25,3 +25,11 @@ class Event(Base):
         default=EventStatus.UPCOMING,
         nullable=False,
     )
+
+
+# Partial index matching EventRepository status filters ordered by date
+Index(
+    "ix_events_active_status_event_date",
+    Event.status, Event.event_date,
+    postgresql_where=Event.is_deleted == False,
+)
@@ -1,6 +1,6 @@
 from datetime import date
 
-from sqlalchemy import String, Text, Date, Numeric, ForeignKey
+from sqlalchemy import String, Text, Date, Numeric, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base
@@ -22,3 +22,11 @@ class Gift(Base):
     received_at: Mapped[date | None] = mapped_column(Date, nullable=True)
     thank_you_sent: Mapped[bool] = mapped_column(default=False, nullable=False)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+
+# Partial index for GiftRepository.get_thank_you_pending
+Index(
+    "ix_gifts_active_thank_you_pending",
+    Gift.received_at.asc().nullslast(),
+    postgresql_where=(Gift.is_deleted == False) & (Gift.thank_you_sent == False),
+)
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import String, Text, Boolean, Integer, DateTime, ForeignKey, Enum as SAEnum
+from sqlalchemy import String, Text, Boolean, Integer, DateTime, ForeignKey, Index, Enum as SAEnum
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base
@@ -39,3 +39,21 @@ class Guest(Base):
     departure_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
     is_vip: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+
+
+# Partial indexes matching GuestRepository list filters/ordering
+Index(
+    "ix_guests_active_first_name",
+    Guest.first_name, Guest.id,
+    postgresql_where=Guest.is_deleted == False,
+)
+Index(
+    "ix_guests_active_side_first_name",
+    Guest.side, Guest.first_name, Guest.id,
+    postgresql_where=Guest.is_deleted == False,
+)
+Index(
+    "ix_guests_active_vip_first_name",
+    Guest.first_name, Guest.id,
+    postgresql_where=(Guest.is_deleted == False) & (Guest.is_vip == True),
+)
@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, Text, ForeignKey, UniqueConstraint, Enum as SAEnum
+from sqlalchemy import Integer, Text, ForeignKey, Index, UniqueConstraint, Enum as SAEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base
@@ -27,3 +27,11 @@ class Invitation(Base):
 
     guest = relationship("Guest", lazy="noload")
     event = relationship("Event", lazy="noload")
+
+
+# Partial index for per-event listing and RSVP summaries
+Index(
+    "ix_invitations_active_event_status",
+    Invitation.event_id, Invitation.status,
+    postgresql_where=Invitation.is_deleted == False,
+)
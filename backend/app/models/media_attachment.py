@@ -1,4 +1,4 @@
-from sqlalchemy import String, Integer, Text
+from sqlalchemy import String, Integer, Text, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base
@@ -17,4 +17,13 @@ class MediaAttachment(Base):
     stored_filename: Mapped[str] = mapped_column(String(500), nullable=False, unique=True)
     file_size: Mapped[int] = mapped_column(Integer, nullable=False)
     mime_type: Mapped[str] = mapped_column(String(200), nullable=False)
-    upload_path: Mapped[str] = mapped_column(Text, nullable=False)
+    # Relative to upload_dir; attachments with identical content share one
+    # blob, and the file is deleted once no live row references it.
+    upload_path: Mapped[str] = mapped_column(Text, nullable=False, index=True)
+
+
+# Attachment lookups by owning entity, single or batched
+Index(
+    "ix_media_attachments_entity",
+    MediaAttachment.entity_type, MediaAttachment.entity_id, MediaAttachment.is_deleted,
+)
@@ -0,0 +1,19 @@
+from sqlalchemy import String, BigInteger
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class TableVersion(Base):
+    """Write counter per table, bumped by every transaction that changes it.
+
+    HTTP ETags are derived from these, so unchanged tables can be
+    answered with 304 Not Modified.
+    """
+
+    __tablename__ = "table_versions"
+
+    table_name: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
+    version: Mapped[int] = mapped_column(
+        BigInteger, default=0, server_default="0", nullable=False
+    )
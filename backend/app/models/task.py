@@ -1,6 +1,6 @@
 from datetime import date, datetime
 
-from sqlalchemy import String, Text, Date, DateTime, ForeignKey, Enum as SAEnum
+from sqlalchemy import String, Text, Date, DateTime, ForeignKey, Index, Enum as SAEnum
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base
@@ -35,3 +35,16 @@ class Task(Base):
     completed_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+
+
+# Partial indexes matching TaskRepository list filters/ordering
+Index(
+    "ix_tasks_active_due_date",
+    Task.due_date.asc().nullslast(), Task.id,
+    postgresql_where=Task.is_deleted == False,
+)
+Index(
+    "ix_tasks_active_status_due_date",
+    Task.status, Task.due_date.asc().nullslast(), Task.id,
+    postgresql_where=Task.is_deleted == False,
+)
@@ -1,6 +1,6 @@
 from datetime import date, time
 
-from sqlalchemy import String, Text, Numeric, Date, Time, ForeignKey, Enum as SAEnum
+from sqlalchemy import String, Text, Numeric, Date, Time, ForeignKey, Index, Enum as SAEnum
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base
@@ -28,3 +28,16 @@ class VendorServiceItem(Base):
         nullable=False,
     )
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+
+# Partial indexes matching VendorServiceRepository list filters/ordering
+Index(
+    "ix_vendor_services_active_service_date",
+    VendorServiceItem.service_date.asc().nullslast(), VendorServiceItem.id,
+    postgresql_where=VendorServiceItem.is_deleted == False,
+)
+Index(
+    "ix_vendor_services_active_status",
+    VendorServiceItem.status, VendorServiceItem.service_date.asc().nullslast(), VendorServiceItem.id,
+    postgresql_where=VendorServiceItem.is_deleted == False,
+)
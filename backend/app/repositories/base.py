@@ -1,16 +1,143 @@
-from typing import Generic, TypeVar, Type
+from collections.abc import AsyncIterator, Sequence
+from typing import Any, Generic, TypeVar, Type
 
-from sqlalchemy import select, update, delete
+from sqlalchemy import (
+    select, insert, update, delete, event, func, literal, union_all, Row, Select,
+    ColumnElement,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
 
+from app.core.http_cache import UNVERSIONED_TABLES, table_versions
 from app.models.base import Base
+from app.models.dashboard_snapshot import DashboardSnapshot
+from app.models.table_version import TableVersion
+from app.utils.pagination import (
+    SortKey, keyset_condition, keyset_tail, encode_cursor, decode_cursor,
+)
 
 ModelType = TypeVar("ModelType", bound=Base)
 
+# Rows fetched per round trip when iterating a server-side cursor.
+STREAM_BATCH_SIZE = 1000
+
+# Session.info keys collecting what a transaction wrote, flushed to the
+# dashboard snapshot and table version counters just before it commits.
+_STALE_SECTIONS = "stale_dashboard_sections"
+_WRITTEN_TABLES = "written_tables"
+_VERSIONS_BUMPED = "table_versions_bumped"
+
+
+def mark_dashboard_stale(db: AsyncSession, sections: Sequence[str]) -> None:
+    """Invalidate ``sections``' dashboard snapshots when ``db`` commits."""
+    if sections:
+        db.info.setdefault(_STALE_SECTIONS, set()).update(sections)
+
+
+def _record_written_tables(session: Session, names) -> None:
+    names = set(names) - UNVERSIONED_TABLES
+    if names:
+        session.info.setdefault(_WRITTEN_TABLES, set()).update(names)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_dml(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        _record_written_tables(state.session, (state.statement.table.name,))
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flush(session: Session, flush_context) -> None:
+    """Tables the flush wrote to.
+
+    ``session.dirty`` also holds objects whose attributes were set to
+    their current values; those flush no UPDATE and bump no version.
+    """
+    dirty = (obj for obj in session.dirty if session.is_modified(obj))
+    _record_written_tables(
+        session,
+        (obj.__table__.name for obj in (*session.new, *dirty, *session.deleted)),
+    )
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_dashboard_versions(session: Session) -> None:
+    """One UPDATE per transaction, committed atomically with the writes."""
+    sections = session.info.pop(_STALE_SECTIONS, None)
+    if sections:
+        session.execute(
+            update(DashboardSnapshot)
+            .where(DashboardSnapshot.section.in_(sorted(sections)))
+            .values(version=DashboardSnapshot.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_table_versions(session: Session) -> None:
+    """Upsert the written tables' counters in one statement (sorted, so
+    concurrent commits lock the rows in the same order)."""
+    tables = session.info.pop(_WRITTEN_TABLES, None)
+    if not tables:
+        return
+    table = TableVersion.__table__
+    query = pg_insert(table).values(
+        [{"table_name": name, "version": 1} for name in sorted(tables)]
+    )
+    query = query.on_conflict_do_update(
+        index_elements=[table.c.table_name],
+        set_={"version": table.c.version + 1, "updated_at": func.now()},
+    )
+    session.execute(query)
+    session.info[_VERSIONS_BUMPED] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _expire_table_versions(session: Session) -> None:
+    if session.info.pop(_VERSIONS_BUMPED, False):
+        table_versions.expire()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _forget_pending_writes(session: Session, previous_transaction) -> None:
+    for key in (_STALE_SECTIONS, _WRITTEN_TABLES, _VERSIONS_BUMPED):
+        session.info.pop(key, None)
+
+
+def lookup_join(target, foreign_key: ColumnElement) -> tuple:
+    """``(target, onclause)`` pair for ``stream_filtered`` joining an active lookup row."""
+    return target, (foreign_key == target.id) & (target.is_deleted == False)
+
+
+async def existing_references(db: AsyncSession, refs: Sequence[tuple[type, int]]) -> set[int]:
+    """Positions in ``refs`` whose ``(model, id)`` row exists (excludes soft-deleted).
+
+    Every reference is checked in one UNION ALL round trip.
+    """
+    if not refs:
+        return set()
+    selects = [
+        select(literal(pos).label("pos"))
+        .select_from(model)
+        .where(model.id == id, model.is_deleted == False)
+        for pos, (model, id) in enumerate(refs)
+    ]
+    query = selects[0] if len(selects) == 1 else union_all(*selects)
+    result = await db.execute(query)
+    return set(result.scalars().all())
+
 
 class BaseRepository(Generic[ModelType]):
     """Base repository with generic CRUD operations."""
 
+    # Ordering applied by get_filtered when none is given; subclasses
+    # override it with their list ordering (ending in a unique column).
+    default_order_by: tuple = ()
+
+    # Dashboard sections summarising this table; writes mark them stale.
+    dashboard_sections: tuple[str, ...] = ()
+
     def __init__(self, db: AsyncSession, model: Type[ModelType]):
         self.db = db
         self.model = model
@@ -35,16 +162,219 @@ class BaseRepository(Generic[ModelType]):
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
+    def _filtered_query(
+        self,
+        filters: dict[str, Any] | None = None,
+        conditions: Sequence[ColumnElement[bool]] = (),
+    ) -> Select:
+        """Build a SELECT combining every supplied filter (excludes soft-deleted).
+
+        ``filters`` maps column names to values; ``None`` values are skipped
+        so optional query parameters can be passed straight through.
+        ``conditions`` are extra SQL expressions (e.g. ``col.is_(None)``).
+        """
+        query = select(self.model).where(self.model.is_deleted == False, *conditions)
+        for field, value in (filters or {}).items():
+            if value is not None:
+                query = query.where(getattr(self.model, field) == value)
+        return query
+
+    def _order_by(self, order_by: Sequence | None = None) -> Sequence:
+        return order_by or self.default_order_by or (self.model.id,)
+
+    def _sort_keys(self, order_by: Sequence | None = None) -> list[SortKey]:
+        keys = [SortKey.parse(expr) for expr in self._order_by(order_by)]
+        if not keys[-1].column.compare(self.model.id.__clause_element__()):
+            keys.append(SortKey.parse(self.model.id))
+        return keys
+
+    def cursor_for(self, item: ModelType, order_by: Sequence | None = None) -> str:
+        """Opaque keyset cursor pointing just after ``item``."""
+        return encode_cursor(
+            [getattr(item, key.column.key) for key in self._sort_keys(order_by)]
+        )
+
+    async def get_filtered(
+        self,
+        filters: dict[str, Any] | None = None,
+        conditions: Sequence[ColumnElement[bool]] = (),
+        order_by: Sequence | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[ModelType]:
+        """Get records matching all supplied filters in a single query."""
+        query = (
+            self._filtered_query(filters, conditions)
+            .order_by(*self._order_by(order_by))
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def get_page(
+        self,
+        filters: dict[str, Any] | None = None,
+        conditions: Sequence[ColumnElement[bool]] = (),
+        order_by: Sequence | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[ModelType], int]:
+        """Get one page of filtered records and the filtered total.
+
+        The total comes from ``count(*) OVER ()`` in the same statement, so
+        a page costs one round trip. Only a page past the end (no rows to
+        carry the window value) falls back to a separate count.
+        """
+        query = (
+            self._filtered_query(filters, conditions)
+            .add_columns(func.count().over().label("total"))
+            .order_by(*self._order_by(order_by))
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.db.execute(query)
+        rows = result.all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+        if skip == 0:
+            return [], 0
+        return [], await self.count_filtered(filters, conditions)
+
+    async def get_keyset_page(
+        self,
+        filters: dict[str, Any] | None = None,
+        conditions: Sequence[ColumnElement[bool]] = (),
+        order_by: Sequence | None = None,
+        cursor: str | None = None,
+        limit: int = 100,
+    ) -> tuple[list[ModelType], str | None]:
+        """Get the page after ``cursor`` by seeking on the sort keys.
+
+        Unlike OFFSET, the cost does not grow with depth: the seek is an
+        index range on the sort keys. Rows whose leading key is NULL form
+        their own block, read by a second query only on the page that
+        crosses into it. Returns the items and the cursor for the next
+        page (``None`` on the last page).
+        """
+        keys = self._sort_keys(order_by)
+        base = self._filtered_query(filters, conditions).order_by(*self._order_by(order_by))
+        if len(keys) > len(self._order_by(order_by)):
+            base = base.order_by(keys[-1].column)
+
+        if not cursor:
+            result = await self.db.execute(base.limit(limit + 1))
+            items = list(result.scalars().all())
+        else:
+            values = decode_cursor(cursor, keys)
+            result = await self.db.execute(
+                base.where(keyset_condition(keys, values)).limit(limit + 1)
+            )
+            items = list(result.scalars().all())
+            tail = keyset_tail(keys, values)
+            if len(items) <= limit and tail is not None:
+                result = await self.db.execute(base.where(tail).limit(limit + 1 - len(items)))
+                items += result.scalars().all()
+
+        if len(items) <= limit:
+            return items, None
+        items = items[:limit]
+        return items, self.cursor_for(items[-1], order_by)
+
+    async def paginate(
+        self,
+        filters: dict[str, Any] | None = None,
+        conditions: Sequence[ColumnElement[bool]] = (),
+        order_by: Sequence | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> tuple[list[ModelType], int | None, str | None]:
+        """Offset or keyset page, returning ``(items, total, next_cursor)``.
+
+        With a ``cursor`` the keyset path is used and ``total`` is ``None``;
+        offset pages also return a cursor so clients can switch modes.
+        """
+        if cursor:
+            items, next_cursor = await self.get_keyset_page(
+                filters, conditions, order_by, cursor, limit
+            )
+            return items, None, next_cursor
+        items, total = await self.get_page(filters, conditions, order_by, skip, limit)
+        next_cursor = None
+        if items and skip + len(items) < total:
+            next_cursor = self.cursor_for(items[-1], order_by)
+        return items, total, next_cursor
+
+    async def stream_filtered(
+        self,
+        filters: dict[str, Any] | None = None,
+        conditions: Sequence[ColumnElement[bool]] = (),
+        columns: Sequence[ColumnElement] | None = None,
+        joins: Sequence[tuple] = (),
+        order_by: Sequence | None = None,
+    ) -> AsyncIterator[Row]:
+        """Yield every matching row through a server-side cursor.
+
+        Rows are plain tuples of ``columns`` (the model's own columns by
+        default) rather than ORM instances, fetched ``STREAM_BATCH_SIZE`` at
+        a time, so memory stays flat however many rows match. ``joins`` are
+        ``(target, onclause)`` pairs added as LEFT OUTER JOINs, typically
+        lookup tables whose names are selected in ``columns``.
+        """
+        query = (
+            self._filtered_query(filters, conditions)
+            .with_only_columns(*(columns or self.model.__table__.columns))
+            .select_from(self.model)
+        )
+        for target, onclause in joins:
+            query = query.outerjoin(target, onclause)
+        query = query.order_by(*self._order_by(order_by)).execution_options(
+            yield_per=STREAM_BATCH_SIZE
+        )
+        result = await self.db.stream(query)
+        async for row in result:
+            yield row
+
+    async def stream_all(
+        self,
+        columns: Sequence[ColumnElement] | None = None,
+        joins: Sequence[tuple] = (),
+        order_by: Sequence | None = None,
+    ) -> AsyncIterator[Row]:
+        """Yield every record (excludes soft-deleted); see ``stream_filtered``."""
+        async for row in self.stream_filtered(None, (), columns, joins, order_by):
+            yield row
+
+    async def count_filtered(
+        self,
+        filters: dict[str, Any] | None = None,
+        conditions: Sequence[ColumnElement[bool]] = (),
+    ) -> int:
+        """Count records matching all supplied filters."""
+        query = self._filtered_query(filters, conditions).with_only_columns(
+            func.count(self.model.id)
+        )
+        result = await self.db.execute(query)
+        return result.scalar() or 0
+
     async def create(self, data: dict) -> ModelType:
-        """Create a new record."""
-        instance = self.model(**data)
-        self.db.add(instance)
-        await self.db.flush()
-        await self.db.refresh(instance)
-        return instance
+        """Create a new record.
+
+        A single INSERT ... RETURNING hydrates the instance, server defaults
+        (``id``, ``created_at``, ``updated_at``) included.
+        """
+        query = insert(self.model).values(**data).returning(self.model)
+        result = await self.db.execute(query)
+        mark_dashboard_stale(self.db, self.dashboard_sections)
+        return result.scalar_one()
 
     async def update(self, id: int, data: dict) -> ModelType | None:
-        """Update a record by ID."""
+        """Update a record by ID.
+
+        The updated row comes back from UPDATE ... RETURNING and replaces
+        any stale copy in the session, so no follow-up SELECT is needed.
+        """
         if not data:
             return await self.get_by_id(id)
 
@@ -52,10 +382,12 @@ class BaseRepository(Generic[ModelType]):
             update(self.model)
             .where(self.model.id == id, self.model.is_deleted == False)
             .values(**data)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
         )
-        await self.db.execute(query)
-        await self.db.flush()
-        return await self.get_by_id(id)
+        result = await self.db.execute(query)
+        mark_dashboard_stale(self.db, self.dashboard_sections)
+        return result.scalar_one_or_none()
 
     async def delete(self, id: int) -> bool:
         """Soft delete a record by ID."""
@@ -66,6 +398,7 @@ class BaseRepository(Generic[ModelType]):
         )
         result = await self.db.execute(query)
         await self.db.flush()
+        mark_dashboard_stale(self.db, self.dashboard_sections)
         return result.rowcount > 0
 
     async def hard_delete(self, id: int) -> bool:
@@ -73,4 +406,5 @@ class BaseRepository(Generic[ModelType]):
         query = delete(self.model).where(self.model.id == id)
         result = await self.db.execute(query)
         await self.db.flush()
+        mark_dashboard_stale(self.db, self.dashboard_sections)
         return result.rowcount > 0
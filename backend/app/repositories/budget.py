@@ -1,15 +1,20 @@
+from collections.abc import AsyncIterator
 from decimal import Decimal
 
-from sqlalchemy import select, func
+from sqlalchemy import select, case, func, tuple_, Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.budget import BudgetCategory, Expense
-from app.models.enums import PaymentStatus, GuestSide
-from app.repositories.base import BaseRepository
+from app.models.event import Event
+from app.models.user import User
+from app.models.vendor import Vendor
+from app.repositories.base import BaseRepository, lookup_join
 
 
 class BudgetCategoryRepository(BaseRepository[BudgetCategory]):
 
+    dashboard_sections = ("budget",)
+
     def __init__(self, db: AsyncSession):
         super().__init__(db, BudgetCategory)
 
@@ -31,81 +36,39 @@ class BudgetCategoryRepository(BaseRepository[BudgetCategory]):
 
 class ExpenseRepository(BaseRepository[Expense]):
 
+    default_order_by = (Expense.payment_date.desc().nullslast(), Expense.id.desc())
+
+    dashboard_sections = ("budget",)
+
     def __init__(self, db: AsyncSession):
         super().__init__(db, Expense)
 
-    async def get_by_budget(
-        self, budget_id: int, skip: int = 0, limit: int = 100
-    ) -> list[Expense]:
-        query = (
-            select(Expense)
-            .where(Expense.budget_id == budget_id, Expense.is_deleted == False)
-            .order_by(Expense.payment_date.desc().nullslast())
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
-
-    async def get_by_vendor(
-        self, vendor_id: int, skip: int = 0, limit: int = 100
-    ) -> list[Expense]:
-        query = (
-            select(Expense)
-            .where(Expense.vendor_id == vendor_id, Expense.is_deleted == False)
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
-
-    async def get_by_event(
-        self, event_id: int, skip: int = 0, limit: int = 100
-    ) -> list[Expense]:
-        query = (
-            select(Expense)
-            .where(Expense.event_id == event_id, Expense.is_deleted == False)
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
-
-    async def get_by_payment_status(
-        self, status: PaymentStatus, skip: int = 0, limit: int = 100
-    ) -> list[Expense]:
-        query = (
-            select(Expense)
-            .where(Expense.payment_status == status, Expense.is_deleted == False)
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
-
-    async def get_by_side(
-        self, side: GuestSide, skip: int = 0, limit: int = 100
-    ) -> list[Expense]:
-        query = (
-            select(Expense)
-            .where(Expense.side == side, Expense.is_deleted == False)
-            .offset(skip)
-            .limit(limit)
+    def stream_export(self, filters: dict | None = None) -> AsyncIterator[Row]:
+        """Stream expenses with category, vendor, event and payer names joined in.
+
+        ``paid_by`` is the linked user's name, or the free-text
+        ``paid_by_name`` when no user is linked.
+        """
+        paid_by = case(
+            (Expense.paid_by_user_id.isnot(None), User.first_name + " " + User.last_name),
+            else_=Expense.paid_by_name,
         )
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
-
-    async def get_by_paid_by_user(
-        self, user_id: int, skip: int = 0, limit: int = 100
-    ) -> list[Expense]:
-        query = (
-            select(Expense)
-            .where(Expense.paid_by_user_id == user_id, Expense.is_deleted == False)
-            .offset(skip)
-            .limit(limit)
+        return self.stream_filtered(
+            filters,
+            columns=(
+                *Expense.__table__.columns,
+                BudgetCategory.category.label("budget_category"),
+                Vendor.name.label("vendor"),
+                Event.name.label("event"),
+                paid_by.label("paid_by"),
+            ),
+            joins=(
+                lookup_join(BudgetCategory, Expense.budget_id),
+                lookup_join(Vendor, Expense.vendor_id),
+                lookup_join(Event, Expense.event_id),
+                lookup_join(User, Expense.paid_by_user_id),
+            ),
         )
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
 
     async def get_spent_by_budget(self, budget_id: int) -> Decimal:
         query = select(func.coalesce(func.sum(Expense.amount), 0)).where(
@@ -119,24 +82,46 @@ class ExpenseRepository(BaseRepository[Expense]):
         result = await self.db.execute(query)
         return result.scalar() or 0
 
-    async def get_overview(self, categories: list[BudgetCategory]) -> dict:
+    async def get_overview(self) -> dict:
+        """Budget vs actual overview in a constant number of queries.
+
+        Per-category spend comes from one grouped aggregate over expenses
+        LEFT JOINed to budget_categories; the payment status and method
+        breakdowns share a second GROUPING SETS query.
+        """
         base = Expense.is_deleted == False
 
+        spent = (
+            select(
+                Expense.budget_id,
+                func.sum(Expense.amount).label("total_spent"),
+                func.count(Expense.id).label("expense_count"),
+            )
+            .where(base, Expense.budget_id.isnot(None))
+            .group_by(Expense.budget_id)
+            .subquery()
+        )
+        cat_q = (
+            select(
+                BudgetCategory,
+                func.coalesce(spent.c.total_spent, 0),
+                func.coalesce(spent.c.expense_count, 0),
+            )
+            .outerjoin(spent, spent.c.budget_id == BudgetCategory.id)
+            .where(BudgetCategory.is_deleted == False)
+            .order_by(BudgetCategory.id)
+        )
+        cat_r = await self.db.execute(cat_q)
+
         total_estimated = Decimal(0)
         total_spent = Decimal(0)
         cat_details = []
 
-        for cat in categories:
-            spent = await self.get_spent_by_budget(cat.id)
+        for cat, cat_spent, expense_count in cat_r.all():
+            spent_amount = Decimal(str(cat_spent))
             est = Decimal(str(cat.estimated_amount))
             total_estimated += est
-            total_spent += spent
-
-            count_q = select(func.count(Expense.id)).where(
-                base, Expense.budget_id == cat.id
-            )
-            count_r = await self.db.execute(count_q)
-            expense_count = count_r.scalar() or 0
+            total_spent += spent_amount
 
             cat_details.append({
                 "id": cat.id,
@@ -145,26 +130,35 @@ class ExpenseRepository(BaseRepository[Expense]):
                 "category": cat.category,
                 "estimated_amount": est,
                 "notes": cat.notes,
-                "total_spent": spent,
-                "remaining": est - spent,
+                "total_spent": spent_amount,
+                "remaining": est - spent_amount,
                 "expense_count": expense_count,
             })
 
-        status_q = (
-            select(Expense.payment_status, func.coalesce(func.sum(Expense.amount), 0))
-            .where(base)
-            .group_by(Expense.payment_status)
-        )
-        status_r = await self.db.execute(status_q)
-        by_status = {k.value: Decimal(str(v)) for k, v in status_r.all()}
-
-        method_q = (
-            select(Expense.payment_method, func.coalesce(func.sum(Expense.amount), 0))
+        breakdown_q = (
+            select(
+                Expense.payment_status,
+                Expense.payment_method,
+                func.grouping(Expense.payment_status).label("by_method"),
+                func.coalesce(func.sum(Expense.amount), 0).label("amount"),
+            )
             .where(base)
-            .group_by(Expense.payment_method)
+            .group_by(
+                func.grouping_sets(
+                    tuple_(Expense.payment_status),
+                    tuple_(Expense.payment_method),
+                )
+            )
         )
-        method_r = await self.db.execute(method_q)
-        by_method = {k.value: Decimal(str(v)) for k, v in method_r.all()}
+        breakdown_r = await self.db.execute(breakdown_q)
+
+        by_status = {}
+        by_method = {}
+        for row in breakdown_r.all():
+            if row.by_method:
+                by_method[row.payment_method.value] = Decimal(str(row.amount))
+            else:
+                by_status[row.payment_status.value] = Decimal(str(row.amount))
 
         return {
             "total_estimated": total_estimated,
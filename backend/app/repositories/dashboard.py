@@ -0,0 +1,52 @@
+from sqlalchemy import select, update, func, Row
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.dashboard_snapshot import DashboardSnapshot
+from app.repositories.base import BaseRepository
+
+
+class DashboardRepository(BaseRepository[DashboardSnapshot]):
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(db, DashboardSnapshot)
+
+    async def ensure_sections(self, sections) -> None:
+        """Create missing snapshot rows so writes have a version to bump."""
+        table = DashboardSnapshot.__table__
+        query = pg_insert(table).on_conflict_do_nothing(index_elements=[table.c.section])
+        await self.db.execute(query, [{"section": section} for section in sorted(sections)])
+
+    async def get_snapshots(self) -> dict[str, Row]:
+        """Every snapshot row keyed by section, in one query."""
+        query = select(
+            DashboardSnapshot.section,
+            DashboardSnapshot.version,
+            DashboardSnapshot.built_version,
+            DashboardSnapshot.data,
+            DashboardSnapshot.built_at,
+        )
+        result = await self.db.execute(query)
+        return {row.section: row for row in result.all()}
+
+    async def save(self, section: str, data: dict, version: int) -> None:
+        """Store a snapshot built while the section was at ``version``.
+
+        Skipped if a write has bumped the version since, so a summary
+        computed before that write committed never looks current. Also
+        skipped, rather than waited for, while a committing write holds
+        the row: that write is about to make this snapshot stale anyway.
+        """
+        unlocked = (
+            select(DashboardSnapshot.id)
+            .where(DashboardSnapshot.section == section)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        query = (
+            update(DashboardSnapshot)
+            .where(DashboardSnapshot.id == unlocked, DashboardSnapshot.version == version)
+            .values(built_version=version, data=data, built_at=func.now(), updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.execute(query)
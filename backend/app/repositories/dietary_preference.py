@@ -7,6 +7,8 @@ from app.repositories.base import BaseRepository
 
 class DietaryPreferenceRepository(BaseRepository[DietaryPreference]):
 
+    dashboard_sections = ("guests",)
+
     def __init__(self, db: AsyncSession):
         super().__init__(db, DietaryPreference)
 
@@ -16,12 +18,3 @@ class DietaryPreferenceRepository(BaseRepository[DietaryPreference]):
         )
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
-
-    async def get_active(self) -> list[DietaryPreference]:
-        query = (
-            select(DietaryPreference)
-            .where(DietaryPreference.is_active == True, DietaryPreference.is_deleted == False)
-            .order_by(DietaryPreference.name)
-        )
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
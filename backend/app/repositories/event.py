@@ -1,17 +1,31 @@
-from sqlalchemy import select, func
+from collections.abc import AsyncIterator
+
+from sqlalchemy import select, func, Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.event import Event
 from app.models.event_type import EventType
 from app.models.enums import EventStatus
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, lookup_join
 
 
 class EventRepository(BaseRepository[Event]):
 
+    default_order_by = (Event.event_date, Event.id)
+
+    dashboard_sections = ("events", "tasks")
+
     def __init__(self, db: AsyncSession):
         super().__init__(db, Event)
 
+    def stream_export(self, filters: dict | None = None) -> AsyncIterator[Row]:
+        """Stream events with the event type name joined in."""
+        return self.stream_filtered(
+            filters,
+            columns=(*Event.__table__.columns, EventType.name.label("event_type")),
+            joins=(lookup_join(EventType, Event.event_type_id),),
+        )
+
     async def get_by_status(
         self, status: EventStatus, skip: int = 0, limit: int = 100
     ) -> list[Event]:
@@ -7,6 +7,8 @@ from app.repositories.base import BaseRepository
 
 class EventTypeRepository(BaseRepository[EventType]):
 
+    dashboard_sections = ("events",)
+
     def __init__(self, db: AsyncSession):
         super().__init__(db, EventType)
 
@@ -16,12 +18,3 @@ class EventTypeRepository(BaseRepository[EventType]):
         )
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
-
-    async def get_active(self) -> list[EventType]:
-        query = (
-            select(EventType)
-            .where(EventType.is_active == True, EventType.is_deleted == False)
-            .order_by(EventType.name)
-        )
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
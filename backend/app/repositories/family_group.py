@@ -16,12 +16,3 @@ class FamilyGroupRepository(BaseRepository[FamilyGroup]):
         )
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
-
-    async def get_active(self) -> list[FamilyGroup]:
-        query = (
-            select(FamilyGroup)
-            .where(FamilyGroup.is_active == True, FamilyGroup.is_deleted == False)
-            .order_by(FamilyGroup.name)
-        )
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
@@ -1,16 +1,38 @@
-from sqlalchemy import select, func
+from collections.abc import AsyncIterator
+
+from sqlalchemy import select, func, Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.gift import Gift
 from app.models.gift_type import GiftType
-from app.repositories.base import BaseRepository
+from app.models.guest import Guest
+from app.repositories.base import BaseRepository, lookup_join
 
 
 class GiftRepository(BaseRepository[Gift]):
 
+    default_order_by = (Gift.received_at.desc().nullslast(), Gift.id.desc())
+
+    dashboard_sections = ("gifts",)
+
     def __init__(self, db: AsyncSession):
         super().__init__(db, Gift)
 
+    def stream_export(self, filters: dict | None = None) -> AsyncIterator[Row]:
+        """Stream gifts with guest and gift type names joined in."""
+        return self.stream_filtered(
+            filters,
+            columns=(
+                *Gift.__table__.columns,
+                (Guest.first_name + " " + Guest.last_name).label("guest"),
+                GiftType.name.label("gift_type"),
+            ),
+            joins=(
+                lookup_join(Guest, Gift.guest_id),
+                lookup_join(GiftType, Gift.gift_type_id),
+            ),
+        )
+
     async def get_by_guest(
         self, guest_id: int, skip: int = 0, limit: int = 100
     ) -> list[Gift]:
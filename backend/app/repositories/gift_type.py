@@ -7,6 +7,8 @@ from app.repositories.base import BaseRepository
 
 class GiftTypeRepository(BaseRepository[GiftType]):
 
+    dashboard_sections = ("gifts",)
+
     def __init__(self, db: AsyncSession):
         super().__init__(db, GiftType)
 
@@ -16,12 +18,3 @@ class GiftTypeRepository(BaseRepository[GiftType]):
         )
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
-
-    async def get_active(self) -> list[GiftType]:
-        query = (
-            select(GiftType)
-            .where(GiftType.is_active == True, GiftType.is_deleted == False)
-            .order_by(GiftType.name)
-        )
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
@@ -1,55 +1,46 @@
-from sqlalchemy import select, func, distinct
+from collections.abc import AsyncIterator
+
+from sqlalchemy import select, func, distinct, or_, tuple_, Row
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.guest import Guest
 from app.models.dietary_preference import DietaryPreference
-from app.models.enums import GuestSide
-from app.repositories.base import BaseRepository
+from app.models.family_group import FamilyGroup
+from app.models.relation_type import RelationType
+from app.repositories.base import BaseRepository, lookup_join, mark_dashboard_stale
+
+# grouping(side, age_group, diet) bitmask: a set bit means "not grouped by".
+_GROUPED_BY_SIDE = 0b011
+_GROUPED_BY_AGE = 0b101
+_GROUPED_BY_DIET = 0b110
 
 
 class GuestRepository(BaseRepository[Guest]):
 
-    def __init__(self, db: AsyncSession):
-        super().__init__(db, Guest)
+    default_order_by = (Guest.first_name, Guest.id)
 
-    async def get_by_side(
-        self, side: GuestSide, skip: int = 0, limit: int = 100
-    ) -> list[Guest]:
-        query = (
-            select(Guest)
-            .where(Guest.side == side, Guest.is_deleted == False)
-            .order_by(Guest.first_name)
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+    dashboard_sections = ("guests",)
 
-    async def get_by_family_group(
-        self, family_group_id: int, skip: int = 0, limit: int = 100
-    ) -> list[Guest]:
-        query = (
-            select(Guest)
-            .where(Guest.family_group_id == family_group_id, Guest.is_deleted == False)
-            .order_by(Guest.first_name)
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+    def __init__(self, db: AsyncSession):
+        super().__init__(db, Guest)
 
-    async def get_vip_guests(
-        self, skip: int = 0, limit: int = 100
-    ) -> list[Guest]:
-        query = (
-            select(Guest)
-            .where(Guest.is_vip == True, Guest.is_deleted == False)
-            .order_by(Guest.first_name)
-            .offset(skip)
-            .limit(limit)
+    def stream_export(self, filters: dict | None = None) -> AsyncIterator[Row]:
+        """Stream guests with relation type, family group and diet names joined in."""
+        return self.stream_filtered(
+            filters,
+            columns=(
+                *Guest.__table__.columns,
+                RelationType.name.label("relation_type"),
+                FamilyGroup.name.label("family_group"),
+                DietaryPreference.name.label("dietary_preference"),
+            ),
+            joins=(
+                lookup_join(RelationType, Guest.relation_type_id),
+                lookup_join(FamilyGroup, Guest.family_group_id),
+                lookup_join(DietaryPreference, Guest.dietary_preference_id),
+            ),
         )
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
 
     async def get_by_email(self, email: str) -> Guest | None:
         query = select(Guest).where(Guest.email == email, Guest.is_deleted == False)
@@ -61,46 +52,97 @@ class GuestRepository(BaseRepository[Guest]):
         result = await self.db.execute(query)
         return result.scalar_one_or_none() is not None
 
+    async def find_taken(
+        self, phones: set[str], emails: set[str]
+    ) -> tuple[set[str], set[str]]:
+        """Which of ``phones``/``emails`` any guest row already uses.
+
+        Soft-deleted rows count too: the unique constraints still apply.
+        """
+        conditions = []
+        if phones:
+            conditions.append(Guest.phone.in_(phones))
+        if emails:
+            conditions.append(Guest.email.in_(emails))
+        if not conditions:
+            return set(), set()
+        result = await self.db.execute(select(Guest.phone, Guest.email).where(or_(*conditions)))
+        rows = result.all()
+        return (
+            {phone for phone, _ in rows if phone in phones},
+            {email for _, email in rows if email in emails},
+        )
+
+    async def bulk_create(self, rows: list[dict]) -> set[str]:
+        """Insert guests with batched multi-row INSERTs.
+
+        Rows that hit a unique constraint (a concurrent insert since
+        validation) are skipped; returns the phones actually inserted.
+        """
+        if not rows:
+            return set()
+        table = Guest.__table__
+        query = pg_insert(table).on_conflict_do_nothing().returning(table.c.phone)
+        result = await self.db.execute(query, rows)
+        mark_dashboard_stale(self.db, self.dashboard_sections)
+        return set(result.scalars().all())
+
     async def count_all(self) -> int:
         query = select(func.count(Guest.id)).where(Guest.is_deleted == False)
         result = await self.db.execute(query)
         return result.scalar() or 0
 
     async def get_summary(self) -> dict:
-        base = Guest.is_deleted == False
-
-        side_q = select(Guest.side, func.count(Guest.id)).where(base).group_by(Guest.side)
-        side_r = await self.db.execute(side_q)
-        by_side = {k.value: v for k, v in side_r.all()}
+        """Compute all guest statistics in a single pass over ``guests``.
 
-        diet_q = (
-            select(DietaryPreference.name, func.count(Guest.id))
-            .join(DietaryPreference, Guest.dietary_preference_id == DietaryPreference.id)
-            .where(base)
-            .group_by(DietaryPreference.name)
-        )
-        diet_r = await self.db.execute(diet_q)
-        by_diet = dict(diet_r.all())
-
-        age_q = select(Guest.age_group, func.count(Guest.id)).where(base).group_by(Guest.age_group)
-        age_r = await self.db.execute(age_q)
-        by_age = {k.value: v for k, v in age_r.all()}
-
-        vip_q = select(func.count(Guest.id)).where(base, Guest.is_vip == True)
-        vip_r = await self.db.execute(vip_q)
-        vip_count = vip_r.scalar() or 0
-
-        fg_q = select(func.count(distinct(Guest.family_group_id))).where(
-            base, Guest.family_group_id.isnot(None)
+        One GROUPING SETS query produces a row per side, per age group,
+        per dietary preference and a grand-total row; ``grouping()``
+        tells them apart.
+        """
+        diet_name = DietaryPreference.name.label("diet")
+        query = (
+            select(
+                Guest.side,
+                Guest.age_group,
+                diet_name,
+                func.grouping(Guest.side, Guest.age_group, diet_name).label("grp"),
+                func.count(Guest.id).label("guest_count"),
+                func.count(Guest.id).filter(Guest.is_vip == True).label("vips"),
+                func.count(distinct(Guest.family_group_id)).label("family_groups"),
+                func.coalesce(func.sum(Guest.number_of_persons), 0).label("persons"),
+            )
+            .select_from(Guest)
+            .outerjoin(DietaryPreference, Guest.dietary_preference_id == DietaryPreference.id)
+            .where(Guest.is_deleted == False)
+            .group_by(
+                func.grouping_sets(
+                    tuple_(Guest.side),
+                    tuple_(Guest.age_group),
+                    tuple_(diet_name),
+                    tuple_(),
+                )
+            )
         )
-        fg_r = await self.db.execute(fg_q)
-        fg_count = fg_r.scalar() or 0
-
-        total = sum(by_side.values())
+        result = await self.db.execute(query)
 
-        persons_q = select(func.coalesce(func.sum(Guest.number_of_persons), 0)).where(base)
-        persons_r = await self.db.execute(persons_q)
-        total_persons = persons_r.scalar() or 0
+        by_side: dict[str, int] = {}
+        by_diet: dict[str, int] = {}
+        by_age: dict[str, int] = {}
+        total = total_persons = vip_count = fg_count = 0
+
+        for row in result.all():
+            if row.grp == _GROUPED_BY_SIDE:
+                by_side[row.side.value] = row.guest_count
+            elif row.grp == _GROUPED_BY_AGE:
+                by_age[row.age_group.value] = row.guest_count
+            elif row.grp == _GROUPED_BY_DIET:
+                if row.diet is not None:
+                    by_diet[row.diet] = row.guest_count
+            else:
+                total = row.guest_count
+                total_persons = row.persons or 0
+                vip_count = row.vips or 0
+                fg_count = row.family_groups or 0
 
         return {
             "total_guests": total,
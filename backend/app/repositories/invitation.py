@@ -1,9 +1,11 @@
-from sqlalchemy import select, func, update as sa_update
+from sqlalchemy import select, func, cast, literal, values, column, Integer, update as sa_update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, joinedload
 
 from app.models.invitation import Invitation
 from app.models.event import Event
+from app.models.guest import Guest
 from app.models.enums import InvitationStatus
 from app.repositories.base import BaseRepository
 
@@ -13,6 +15,11 @@ class InvitationRepository(BaseRepository[Invitation]):
     def __init__(self, db: AsyncSession):
         super().__init__(db, Invitation)
 
+    def _filtered_query(self, filters=None, conditions=()):
+        return super()._filtered_query(filters, conditions).options(
+            selectinload(Invitation.guest), selectinload(Invitation.event)
+        )
+
     async def get_all(self) -> list[Invitation]:
         query = (
             select(Invitation)
@@ -87,6 +94,87 @@ class InvitationRepository(BaseRepository[Invitation]):
         result = await self.db.execute(refetch)
         return result.scalar_one_or_none()
 
+    async def bulk_invite(
+        self, event_id: int, guest_ids: list[int], status: InvitationStatus
+    ) -> int:
+        """Invite many guests to an event in a single statement.
+
+        INSERT ... SELECT only picks ids of existing, non-deleted guests, and
+        ON CONFLICT reactivates soft-deleted invitations. Active invitations
+        are left untouched. Returns the number of invitations created or
+        reactivated.
+        """
+        table = Invitation.__table__
+        guests = select(
+            Guest.id,
+            literal(event_id),
+            literal(status, table.c.status.type),
+            literal(0),
+            literal(False),
+        ).where(Guest.id.in_(guest_ids), Guest.is_deleted == False)
+
+        stmt = pg_insert(Invitation).from_select(
+            ["guest_id", "event_id", "status", "plus_ones", "is_deleted"], guests
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_guest_event",
+            set_={
+                "is_deleted": False,
+                "status": stmt.excluded.status,
+                "plus_ones": 0,
+                "notes": None,
+                "updated_at": func.now(),
+            },
+            where=table.c.is_deleted == True,
+        ).returning(table.c.id)
+
+        result = await self.db.execute(stmt)
+        await self.db.flush()
+        return len(result.all())
+
+    async def bulk_update_rsvp(
+        self, updates: list[tuple[int, InvitationStatus, int | None]]
+    ) -> list[Invitation]:
+        """Apply many (invitation_id, status, plus_ones) changes at once.
+
+        One UPDATE ... FROM (VALUES ...) statement writes every change
+        (a ``None`` plus_ones keeps the current value), then one select
+        returns the updated invitations with guest and event joined in.
+        """
+        table = Invitation.__table__
+        rsvp = values(
+            column("id", Integer),
+            column("status", table.c.status.type),
+            column("plus_ones", Integer),
+            name="rsvp",
+        ).data(updates)
+
+        stmt = (
+            sa_update(Invitation)
+            .where(Invitation.id == rsvp.c.id, Invitation.is_deleted == False)
+            .values(
+                status=rsvp.c.status,
+                plus_ones=func.coalesce(cast(rsvp.c.plus_ones, Integer), Invitation.plus_ones),
+            )
+            .returning(Invitation.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(stmt)
+        updated_ids = set(result.scalars().all())
+        await self.db.flush()
+        if not updated_ids:
+            return []
+
+        refetch = (
+            select(Invitation)
+            .options(joinedload(Invitation.guest), joinedload(Invitation.event))
+            .where(Invitation.id.in_(updated_ids))
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(refetch)
+        by_id = {inv.id: inv for inv in result.scalars().all()}
+        return [by_id[inv_id] for inv_id, _, _ in updates if inv_id in by_id]
+
     async def count_by_event(self, event_id: int) -> int:
         query = select(func.count(Invitation.id)).where(
             Invitation.event_id == event_id, Invitation.is_deleted == False
@@ -1,4 +1,6 @@
-from sqlalchemy import select, func
+from collections.abc import Sequence
+
+from sqlalchemy import select, distinct, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.media_attachment import MediaAttachment
@@ -35,3 +37,93 @@ class MediaAttachmentRepository(BaseRepository[MediaAttachment]):
         )
         result = await self.db.execute(query)
         return result.scalar() or 0
+
+    async def count_by_entities(
+        self, entity_type: str, entity_ids: Sequence[int]
+    ) -> dict[int, int]:
+        """Vectorized ``count_by_entity``: one grouped count for many entities.
+
+        Entities without attachments are omitted.
+        """
+        if not entity_ids:
+            return {}
+        query = (
+            select(MediaAttachment.entity_id, func.count(MediaAttachment.id))
+            .where(
+                MediaAttachment.entity_type == entity_type,
+                MediaAttachment.entity_id.in_(entity_ids),
+                MediaAttachment.is_deleted == False,
+            )
+            .group_by(MediaAttachment.entity_id)
+        )
+        result = await self.db.execute(query)
+        return dict(result.all())
+
+    async def get_by_entities(
+        self,
+        entity_type: str,
+        entity_ids: Sequence[int],
+        per_entity: int | None = None,
+    ) -> dict[int, tuple[int, list[MediaAttachment]]]:
+        """Attachments and counts for many entities in one query.
+
+        Maps each entity id that has attachments to ``(count, newest
+        first attachments)``; ``per_entity`` caps the list (e.g. previews)
+        without affecting the count. Both come from window functions over
+        the ``(entity_type, entity_id, is_deleted)`` index.
+        """
+        if not entity_ids:
+            return {}
+        ranked = (
+            select(
+                MediaAttachment.id,
+                func.count().over(partition_by=MediaAttachment.entity_id).label("total"),
+                func.row_number()
+                .over(
+                    partition_by=MediaAttachment.entity_id,
+                    order_by=(MediaAttachment.created_at.desc(), MediaAttachment.id.desc()),
+                )
+                .label("position"),
+            )
+            .where(
+                MediaAttachment.entity_type == entity_type,
+                MediaAttachment.entity_id.in_(entity_ids),
+                MediaAttachment.is_deleted == False,
+            )
+            .subquery()
+        )
+        query = (
+            select(MediaAttachment, ranked.c.total)
+            .join(ranked, ranked.c.id == MediaAttachment.id)
+            .order_by(MediaAttachment.entity_id, ranked.c.position)
+        )
+        if per_entity is not None:
+            query = query.where(ranked.c.position <= per_entity)
+        result = await self.db.execute(query)
+
+        grouped: dict[int, tuple[int, list[MediaAttachment]]] = {}
+        for attachment, total in result.all():
+            grouped.setdefault(attachment.entity_id, (total, []))[1].append(attachment)
+        return grouped
+
+    async def lock_path(self, upload_path: str) -> None:
+        """Take a transaction-scoped advisory lock on a stored file path."""
+        await self.db.execute(select(func.pg_advisory_xact_lock(func.hashtext(upload_path))))
+
+    async def count_by_path(self, upload_path: str) -> int:
+        """Live attachments referencing a stored file (its reference count)."""
+        query = select(func.count(MediaAttachment.id)).where(
+            MediaAttachment.upload_path == upload_path,
+            MediaAttachment.is_deleted == False,
+        )
+        result = await self.db.execute(query)
+        return result.scalar() or 0
+
+    async def get_stored_paths(self, mime_types: set[str]) -> list[str]:
+        """Distinct stored files of live attachments with one of ``mime_types``."""
+        query = select(distinct(MediaAttachment.upload_path)).where(
+            MediaAttachment.mime_type.in_(mime_types),
+            MediaAttachment.is_deleted == False,
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
@@ -16,12 +16,3 @@ class RelationTypeRepository(BaseRepository[RelationType]):
         )
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
-
-    async def get_active(self) -> list[RelationType]:
-        query = (
-            select(RelationType)
-            .where(RelationType.is_active == True, RelationType.is_deleted == False)
-            .order_by(RelationType.name)
-        )
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
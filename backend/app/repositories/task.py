@@ -1,70 +1,44 @@
+from collections.abc import AsyncIterator
 from datetime import date as date_type
 
-from sqlalchemy import select, func
+from sqlalchemy import select, func, Row
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.models.task import Task
 from app.models.event import Event
-from app.models.enums import TaskPriority, TaskStatus
-from app.repositories.base import BaseRepository
+from app.models.enums import TaskStatus
+from app.models.user import User
+from app.repositories.base import BaseRepository, lookup_join
 
 
 class TaskRepository(BaseRepository[Task]):
 
-    def __init__(self, db: AsyncSession):
-        super().__init__(db, Task)
-
-    async def get_by_status(
-        self, status: TaskStatus, skip: int = 0, limit: int = 100
-    ) -> list[Task]:
-        query = (
-            select(Task)
-            .where(Task.status == status, Task.is_deleted == False)
-            .order_by(Task.due_date.asc().nullslast())
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+    default_order_by = (Task.due_date.asc().nullslast(), Task.id)
 
-    async def get_by_priority(
-        self, priority: TaskPriority, skip: int = 0, limit: int = 100
-    ) -> list[Task]:
-        query = (
-            select(Task)
-            .where(Task.priority == priority, Task.is_deleted == False)
-            .order_by(Task.due_date.asc().nullslast())
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+    dashboard_sections = ("tasks",)
 
-    async def get_by_event(
-        self, event_id: int, skip: int = 0, limit: int = 100
-    ) -> list[Task]:
-        query = (
-            select(Task)
-            .where(Task.event_id == event_id, Task.is_deleted == False)
-            .order_by(Task.due_date.asc().nullslast())
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+    def __init__(self, db: AsyncSession):
+        super().__init__(db, Task)
 
-    async def get_by_assigned_user(
-        self, user_id: int, skip: int = 0, limit: int = 100
-    ) -> list[Task]:
-        query = (
-            select(Task)
-            .where(Task.assigned_to_user_id == user_id, Task.is_deleted == False)
-            .order_by(Task.due_date.asc().nullslast())
-            .offset(skip)
-            .limit(limit)
+    def stream_export(self, filters: dict | None = None) -> AsyncIterator[Row]:
+        """Stream tasks with event name and assignee/creator emails joined in."""
+        assignee = aliased(User, name="assignee")
+        creator = aliased(User, name="creator")
+        return self.stream_filtered(
+            filters,
+            columns=(
+                *Task.__table__.columns,
+                Event.name.label("event"),
+                assignee.email.label("assigned_to"),
+                creator.email.label("created_by"),
+            ),
+            joins=(
+                lookup_join(Event, Task.event_id),
+                lookup_join(assignee, Task.assigned_to_user_id),
+                lookup_join(creator, Task.created_by_user_id),
+            ),
         )
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
 
     async def get_overdue(self) -> list[Task]:
         query = (
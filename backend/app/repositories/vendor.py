@@ -1,16 +1,30 @@
-from sqlalchemy import select, func
+from collections.abc import AsyncIterator
+
+from sqlalchemy import select, func, Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.vendor import Vendor
 from app.models.vendor_category import VendorCategory
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, lookup_join
 
 
 class VendorRepository(BaseRepository[Vendor]):
 
+    default_order_by = (Vendor.name, Vendor.id)
+
+    dashboard_sections = ("vendors",)
+
     def __init__(self, db: AsyncSession):
         super().__init__(db, Vendor)
 
+    def stream_export(self, filters: dict | None = None) -> AsyncIterator[Row]:
+        """Stream vendors with the vendor category name joined in."""
+        return self.stream_filtered(
+            filters,
+            columns=(*Vendor.__table__.columns, VendorCategory.name.label("vendor_category")),
+            joins=(lookup_join(VendorCategory, Vendor.vendor_category_id),),
+        )
+
     async def get_by_category(
         self, vendor_category_id: int, skip: int = 0, limit: int = 100
     ) -> list[Vendor]:
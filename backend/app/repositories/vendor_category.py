@@ -7,6 +7,8 @@ from app.repositories.base import BaseRepository
 
 class VendorCategoryRepository(BaseRepository[VendorCategory]):
 
+    dashboard_sections = ("vendors",)
+
     def __init__(self, db: AsyncSession):
         super().__init__(db, VendorCategory)
 
@@ -16,12 +18,3 @@ class VendorCategoryRepository(BaseRepository[VendorCategory]):
         )
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
-
-    async def get_active(self) -> list[VendorCategory]:
-        query = (
-            select(VendorCategory)
-            .where(VendorCategory.is_active == True, VendorCategory.is_deleted == False)
-            .order_by(VendorCategory.name)
-        )
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
@@ -1,67 +1,45 @@
-from sqlalchemy import select, func
+from collections.abc import AsyncIterator, Sequence
+
+from sqlalchemy import select, func, ColumnElement, Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.event import Event
+from app.models.vendor import Vendor
 from app.models.vendor_service import VendorServiceItem
-from app.models.enums import VendorServiceStatus
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, lookup_join
 
 
 class VendorServiceRepository(BaseRepository[VendorServiceItem]):
 
-    def __init__(self, db: AsyncSession):
-        super().__init__(db, VendorServiceItem)
+    default_order_by = (
+        VendorServiceItem.service_date.asc().nullslast(),
+        VendorServiceItem.id,
+    )
 
-    async def get_by_vendor(
-        self, vendor_id: int, skip: int = 0, limit: int = 100
-    ) -> list[VendorServiceItem]:
-        query = (
-            select(VendorServiceItem)
-            .where(VendorServiceItem.vendor_id == vendor_id, VendorServiceItem.is_deleted == False)
-            .order_by(VendorServiceItem.service_date.asc().nullslast())
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+    dashboard_sections = ("vendor_services",)
 
-    async def get_by_event(
-        self, event_id: int, skip: int = 0, limit: int = 100
-    ) -> list[VendorServiceItem]:
-        query = (
-            select(VendorServiceItem)
-            .where(VendorServiceItem.event_id == event_id, VendorServiceItem.is_deleted == False)
-            .order_by(VendorServiceItem.service_date.asc().nullslast())
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
-
-    async def get_by_status(
-        self, status: VendorServiceStatus, skip: int = 0, limit: int = 100
-    ) -> list[VendorServiceItem]:
-        query = (
-            select(VendorServiceItem)
-            .where(VendorServiceItem.status == status, VendorServiceItem.is_deleted == False)
-            .order_by(VendorServiceItem.service_date.asc().nullslast())
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+    def __init__(self, db: AsyncSession):
+        super().__init__(db, VendorServiceItem)
 
-    async def get_unassigned(
-        self, skip: int = 0, limit: int = 100
-    ) -> list[VendorServiceItem]:
-        query = (
-            select(VendorServiceItem)
-            .where(VendorServiceItem.vendor_id.is_(None), VendorServiceItem.is_deleted == False)
-            .order_by(VendorServiceItem.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+    def stream_export(
+        self,
+        filters: dict | None = None,
+        conditions: Sequence[ColumnElement[bool]] = (),
+    ) -> AsyncIterator[Row]:
+        """Stream vendor services with vendor and event names joined in."""
+        return self.stream_filtered(
+            filters,
+            conditions,
+            columns=(
+                *VendorServiceItem.__table__.columns,
+                Vendor.name.label("vendor"),
+                Event.name.label("event"),
+            ),
+            joins=(
+                lookup_join(Vendor, VendorServiceItem.vendor_id),
+                lookup_join(Event, VendorServiceItem.event_id),
+            ),
         )
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
 
     async def count_all(self) -> int:
         query = select(func.count(VendorServiceItem.id)).where(
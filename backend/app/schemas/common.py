@@ -12,10 +12,36 @@ class MessageResponse(BaseModel):
 
 
 class PaginatedResponse(BaseModel, Generic[DataT]):
-    """Paginated response wrapper."""
+    """Paginated response wrapper.
+
+    Offset pages report ``page``/``total``/``total_pages``. Pass
+    ``next_cursor`` back as ``cursor`` to switch to keyset pagination,
+    where those three fields are ``None``.
+    """
 
     items: list[DataT]
-    total: int
-    page: int
+    total: int | None
+    page: int | None
     page_size: int
-    total_pages: int
+    total_pages: int | None
+    next_cursor: str | None = None
+
+    @classmethod
+    def create(
+        cls,
+        items: list,
+        total: int | None,
+        page: int,
+        page_size: int,
+        next_cursor: str | None = None,
+    ) -> "PaginatedResponse":
+        if total is None:
+            return cls(
+                items=items, total=None, page=None, page_size=page_size,
+                total_pages=None, next_cursor=next_cursor,
+            )
+        return cls(
+            items=items, total=total, page=page, page_size=page_size,
+            total_pages=(total + page_size - 1) // page_size,
+            next_cursor=next_cursor,
+        )
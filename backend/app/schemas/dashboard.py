@@ -0,0 +1,21 @@
+from datetime import datetime
+
+from app.schemas.base import BaseSchema
+from app.schemas.budget import BudgetOverviewResponse
+from app.schemas.event import EventSummaryResponse
+from app.schemas.gift import GiftSummaryResponse
+from app.schemas.guest import GuestSummaryResponse
+from app.schemas.task import TaskSummaryResponse
+from app.schemas.vendor import VendorSummaryResponse
+from app.schemas.vendor_service import VendorServiceSummaryResponse
+
+
+class DashboardResponse(BaseSchema):
+    guests: GuestSummaryResponse
+    events: EventSummaryResponse
+    vendors: VendorSummaryResponse
+    tasks: TaskSummaryResponse
+    gifts: GiftSummaryResponse
+    vendor_services: VendorServiceSummaryResponse
+    budget: BudgetOverviewResponse
+    built_at: datetime
@@ -71,3 +71,15 @@ class GuestSummaryResponse(BaseSchema):
     by_age_group: dict[str, int]
     vip_count: int
     family_groups_count: int
+
+
+class GuestImportRowError(BaseSchema):
+    row: int
+    errors: list[str]
+
+
+class GuestImportResponse(BaseSchema):
+    total_rows: int
+    created: int
+    dry_run: bool
+    errors: list[GuestImportRowError]
@@ -1,4 +1,4 @@
-from app.schemas.base import BaseResponseSchema
+from app.schemas.base import BaseResponseSchema, BaseSchema
 
 
 class MediaAttachmentResponse(BaseResponseSchema):
@@ -9,3 +9,9 @@ class MediaAttachmentResponse(BaseResponseSchema):
     file_size: int
     mime_type: str
     upload_path: str
+
+
+class EntityAttachmentsResponse(BaseSchema):
+    entity_id: int
+    count: int
+    attachments: list[MediaAttachmentResponse]
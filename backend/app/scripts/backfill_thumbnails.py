@@ -0,0 +1,27 @@
+"""Create missing WebP previews for image attachments.
+
+New uploads get their previews in the background; run this once for files
+uploaded before that, or after changing THUMBNAIL_SIZES::
+
+    python -m app.scripts.backfill_thumbnails
+"""
+import asyncio
+
+from app.db.session import AsyncSessionLocal, engine
+from app.repositories.media_attachment import MediaAttachmentRepository
+from app.utils.thumbnails import THUMBNAIL_MIME_TYPES, generate_thumbnails
+
+
+async def backfill_thumbnails() -> None:
+    async with AsyncSessionLocal() as session:
+        paths = await MediaAttachmentRepository(session).get_stored_paths(THUMBNAIL_MIME_TYPES)
+
+    # Existing previews are skipped; the thumbnail pool bounds concurrency
+    results = await asyncio.gather(*(generate_thumbnails(path) for path in paths))
+    failed = results.count(False)
+    print(f"Thumbnails ready for {len(paths) - failed} of {len(paths)} images ({failed} failed)")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(backfill_thumbnails())
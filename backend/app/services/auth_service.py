@@ -2,7 +2,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import (
     hash_password,
-    verify_password,
+    verify_and_update_password,
     create_access_token,
     create_refresh_token,
     decode_token,
@@ -31,7 +31,7 @@ class AuthService:
 
         user_data = {
             "email": data.email,
-            "hashed_password": hash_password(data.password),
+            "hashed_password": await hash_password(data.password),
             "first_name": data.first_name,
             "last_name": data.last_name,
             "role": "user",
@@ -42,17 +42,20 @@ class AuthService:
         """Authenticate user and return tokens."""
         user = await self.user_repo.get_by_email(email)
 
-        if not user or not verify_password(password, user.hashed_password):
+        if not user:
             raise UnauthorizedException("Invalid email or password")
 
+        verified, new_hash = await verify_and_update_password(password, user.hashed_password)
+        if not verified:
+            raise UnauthorizedException("Invalid email or password")
+        if new_hash:
+            # Stored hash predates the current BCRYPT_ROUNDS; upgrade it
+            await self.user_repo.update(user.id, {"hashed_password": new_hash})
+
         if not user.is_active:
             raise UnauthorizedException("Account is disabled")
 
-        token_data = {"sub": str(user.id)}
-        return TokenResponse(
-            access_token=create_access_token(token_data),
-            refresh_token=create_refresh_token(token_data),
-        )
+        return self._issue_tokens(user)
 
     async def refresh_token(self, refresh_token: str) -> TokenResponse:
         """Refresh access token using refresh token."""
@@ -72,8 +75,19 @@ class AuthService:
         if not user or not user.is_active:
             raise UnauthorizedException("User not found or inactive")
 
+        return self._issue_tokens(user)
+
+    @staticmethod
+    def _issue_tokens(user: User) -> TokenResponse:
+        """Issue a token pair; access tokens also carry email/role/active claims."""
         token_data = {"sub": str(user.id)}
+        access_data = {
+            **token_data,
+            "email": user.email,
+            "role": user.role,
+            "active": user.is_active,
+        }
         return TokenResponse(
-            access_token=create_access_token(token_data),
+            access_token=create_access_token(access_data),
             refresh_token=create_refresh_token(token_data),
         )
@@ -1,12 +1,16 @@
+from collections.abc import AsyncIterator
+
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import NotFoundException, ConflictException
 from app.models.budget import BudgetCategory, Expense
 from app.models.enums import PaymentStatus, GuestSide
+from app.models.event import Event
+from app.models.user import User
+from app.models.vendor import Vendor
 from app.repositories.budget import BudgetCategoryRepository, ExpenseRepository
-from app.repositories.event import EventRepository
-from app.repositories.vendor import VendorRepository
-from app.repositories.user import UserRepository
+from app.services.references import ensure_references
 from app.schemas.budget import (
     BudgetCategoryCreate, BudgetCategoryUpdate, ExpenseCreate, ExpenseUpdate,
 )
@@ -18,9 +22,6 @@ class BudgetService:
         self.db = db
         self.budget_repo = BudgetCategoryRepository(db)
         self.expense_repo = ExpenseRepository(db)
-        self.event_repo = EventRepository(db)
-        self.vendor_repo = VendorRepository(db)
-        self.user_repo = UserRepository(db)
 
     # --- Budget Categories ---
 
@@ -33,6 +34,9 @@ class BudgetService:
     async def get_categories(self) -> list[BudgetCategory]:
         return await self.budget_repo.get_all()
 
+    def stream_categories(self) -> AsyncIterator[Row]:
+        return self.budget_repo.stream_all()
+
     async def create_category(self, data: BudgetCategoryCreate) -> BudgetCategory:
         if await self.budget_repo.category_exists(data.category):
             raise ConflictException("Budget category already exists")
@@ -64,6 +68,24 @@ class BudgetService:
             raise NotFoundException("Expense not found")
         return exp
 
+    @staticmethod
+    def _expense_filters(
+        budget_id: int | None = None,
+        vendor_id: int | None = None,
+        event_id: int | None = None,
+        payment_status: PaymentStatus | None = None,
+        side: GuestSide | None = None,
+        paid_by_user_id: int | None = None,
+    ) -> dict:
+        return {
+            "budget_id": budget_id,
+            "vendor_id": vendor_id,
+            "event_id": event_id,
+            "payment_status": payment_status,
+            "side": side,
+            "paid_by_user_id": paid_by_user_id,
+        }
+
     async def get_expenses(
         self,
         skip: int = 0,
@@ -75,59 +97,62 @@ class BudgetService:
         side: GuestSide | None = None,
         paid_by_user_id: int | None = None,
     ) -> list[Expense]:
-        if budget_id:
-            return await self.expense_repo.get_by_budget(budget_id, skip, limit)
-        if vendor_id:
-            return await self.expense_repo.get_by_vendor(vendor_id, skip, limit)
-        if event_id:
-            return await self.expense_repo.get_by_event(event_id, skip, limit)
-        if payment_status:
-            return await self.expense_repo.get_by_payment_status(payment_status, skip, limit)
-        if side:
-            return await self.expense_repo.get_by_side(side, skip, limit)
-        if paid_by_user_id:
-            return await self.expense_repo.get_by_paid_by_user(paid_by_user_id, skip, limit)
-        return await self.expense_repo.get_all(skip=skip, limit=limit)
+        filters = self._expense_filters(
+            budget_id, vendor_id, event_id, payment_status, side, paid_by_user_id
+        )
+        return await self.expense_repo.get_filtered(filters, skip=skip, limit=limit)
+
+    async def get_expenses_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        budget_id: int | None = None,
+        vendor_id: int | None = None,
+        event_id: int | None = None,
+        payment_status: PaymentStatus | None = None,
+        side: GuestSide | None = None,
+        paid_by_user_id: int | None = None,
+        cursor: str | None = None,
+    ) -> tuple[list[Expense], int | None, str | None]:
+        filters = self._expense_filters(
+            budget_id, vendor_id, event_id, payment_status, side, paid_by_user_id
+        )
+        return await self.expense_repo.paginate(
+            filters, skip=skip, limit=limit, cursor=cursor
+        )
+
+    def stream_expenses(
+        self,
+        budget_id: int | None = None,
+        vendor_id: int | None = None,
+        event_id: int | None = None,
+        payment_status: PaymentStatus | None = None,
+        side: GuestSide | None = None,
+        paid_by_user_id: int | None = None,
+    ) -> AsyncIterator[Row]:
+        filters = self._expense_filters(
+            budget_id, vendor_id, event_id, payment_status, side, paid_by_user_id
+        )
+        return self.expense_repo.stream_export(filters)
+
+    async def _check_expense_references(self, data: dict) -> None:
+        await ensure_references(
+            self.db,
+            (BudgetCategory, data.get("budget_id"), "Budget category not found"),
+            (Vendor, data.get("vendor_id"), "Vendor not found"),
+            (Event, data.get("event_id"), "Event not found"),
+            (User, data.get("paid_by_user_id"), "Paid-by user not found"),
+        )
 
     async def create_expense(self, data: ExpenseCreate) -> Expense:
-        if data.budget_id:
-            cat = await self.budget_repo.get_by_id(data.budget_id)
-            if not cat:
-                raise NotFoundException("Budget category not found")
-        if data.vendor_id:
-            vendor = await self.vendor_repo.get_by_id(data.vendor_id)
-            if not vendor:
-                raise NotFoundException("Vendor not found")
-        if data.event_id:
-            event = await self.event_repo.get_by_id(data.event_id)
-            if not event:
-                raise NotFoundException("Event not found")
-        if data.paid_by_user_id:
-            user = await self.user_repo.get_by_id(data.paid_by_user_id)
-            if not user:
-                raise NotFoundException("Paid-by user not found")
+        await self._check_expense_references(data.model_dump())
         return await self.expense_repo.create(data.model_dump())
 
     async def update_expense(self, expense_id: int, data: ExpenseUpdate) -> Expense:
         await self.get_expense(expense_id)
         update_data = data.model_dump(exclude_unset=True)
 
-        if "budget_id" in update_data and update_data["budget_id"]:
-            cat = await self.budget_repo.get_by_id(update_data["budget_id"])
-            if not cat:
-                raise NotFoundException("Budget category not found")
-        if "vendor_id" in update_data and update_data["vendor_id"]:
-            vendor = await self.vendor_repo.get_by_id(update_data["vendor_id"])
-            if not vendor:
-                raise NotFoundException("Vendor not found")
-        if "event_id" in update_data and update_data["event_id"]:
-            event = await self.event_repo.get_by_id(update_data["event_id"])
-            if not event:
-                raise NotFoundException("Event not found")
-        if "paid_by_user_id" in update_data and update_data["paid_by_user_id"]:
-            user = await self.user_repo.get_by_id(update_data["paid_by_user_id"])
-            if not user:
-                raise NotFoundException("Paid-by user not found")
+        await self._check_expense_references(update_data)
 
         updated = await self.expense_repo.update(expense_id, update_data)
         if not updated:
@@ -141,8 +166,4 @@ class BudgetService:
     # --- Overview ---
 
     async def get_overview(self) -> dict:
-        categories = await self.budget_repo.get_all()
-        return await self.expense_repo.get_overview(categories)
-
-    async def count_expenses(self) -> int:
-        return await self.expense_repo.count_all()
+        return await self.expense_repo.get_overview()
@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.db.session import AsyncSessionLocal
+from app.repositories.dashboard import DashboardRepository
+from app.schemas.budget import BudgetOverviewResponse
+from app.schemas.event import EventSummaryResponse
+from app.schemas.gift import GiftSummaryResponse
+from app.schemas.guest import GuestSummaryResponse
+from app.schemas.task import TaskSummaryResponse
+from app.schemas.vendor import VendorSummaryResponse
+from app.schemas.vendor_service import VendorServiceSummaryResponse
+from app.services.budget_service import BudgetService
+from app.services.event_service import EventService
+from app.services.gift_service import GiftService
+from app.services.guest_service import GuestService
+from app.services.task_service import TaskService
+from app.services.vendor_service import VendorService
+from app.services.vendor_service_manager import VendorServiceManager
+
+settings = get_settings()
+
+# section -> (summary builder, response schema)
+DASHBOARD_SECTIONS = {
+    "guests": (lambda db: GuestService(db).get_summary(), GuestSummaryResponse),
+    "events": (lambda db: EventService(db).get_summary(), EventSummaryResponse),
+    "vendors": (lambda db: VendorService(db).get_summary(), VendorSummaryResponse),
+    "tasks": (lambda db: TaskService(db).get_summary(), TaskSummaryResponse),
+    "gifts": (lambda db: GiftService(db).get_summary(), GiftSummaryResponse),
+    "vendor_services": (
+        lambda db: VendorServiceManager(db).get_summary(), VendorServiceSummaryResponse
+    ),
+    "budget": (lambda db: BudgetService(db).get_overview(), BudgetOverviewResponse),
+}
+
+
+class DashboardService:
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.dashboard_repo = DashboardRepository(db)
+
+    async def get_dashboard(self) -> dict:
+        """All dashboard summaries, served from the snapshot table.
+
+        A section is rebuilt only when a write has bumped its version or
+        the snapshot is older than ``dashboard_snapshot_max_age_seconds``
+        (which also picks up time-based counts such as overdue tasks).
+        Otherwise the whole dashboard is one small SELECT.
+
+        Each rebuilt snapshot is saved and committed on its own short
+        session, in the sorted order the write-side version bump locks
+        rows in, so a rebuild never holds a snapshot row while it builds
+        the next section.
+        """
+        snapshots = await self.dashboard_repo.get_snapshots()
+        if DASHBOARD_SECTIONS.keys() - snapshots.keys():
+            await self._save(lambda repo: repo.ensure_sections(DASHBOARD_SECTIONS))
+        now = datetime.now(timezone.utc)
+        oldest = now - timedelta(seconds=settings.dashboard_snapshot_max_age_seconds)
+
+        dashboard = {}
+        built_at = now
+        for section in sorted(DASHBOARD_SECTIONS):
+            build, schema = DASHBOARD_SECTIONS[section]
+            snapshot = snapshots.get(section)
+            if (
+                snapshot is not None
+                and snapshot.data is not None
+                and snapshot.built_version == snapshot.version
+                and snapshot.built_at >= oldest
+            ):
+                dashboard[section] = snapshot.data
+                built_at = min(built_at, snapshot.built_at)
+                continue
+
+            version = snapshot.version if snapshot is not None else 0
+            data = schema.model_validate(await build(self.db)).model_dump(mode="json")
+            await self._save(lambda repo: repo.save(section, data, version))
+            dashboard[section] = data
+
+        dashboard["built_at"] = built_at
+        return dashboard
+
+    async def _save(self, write) -> None:
+        async with AsyncSessionLocal() as session:
+            await write(DashboardRepository(session))
+            await session.commit()
+
+    async def ensure_sections(self) -> None:
+        await self.dashboard_repo.ensure_sections(DASHBOARD_SECTIONS)
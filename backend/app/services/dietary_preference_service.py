@@ -1,6 +1,8 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import lookup_cache
 from app.core.exceptions import NotFoundException, ConflictException
+from app.models.dietary_preference import DietaryPreference
 from app.repositories.dietary_preference import DietaryPreferenceRepository
 from app.schemas.lookup import LookupCreate, LookupUpdate
 
@@ -8,13 +10,14 @@ from app.schemas.lookup import LookupCreate, LookupUpdate
 class DietaryPreferenceService:
 
     def __init__(self, db: AsyncSession):
+        self.db = db
         self.repo = DietaryPreferenceRepository(db)
 
     async def get_all(self) -> list:
-        return await self.repo.get_active()
+        return await lookup_cache.get_active(self.db, DietaryPreference)
 
     async def get_by_id(self, id: int):
-        item = await self.repo.get_by_id(id)
+        item = await lookup_cache.get(self.db, DietaryPreference, id)
         if not item:
             raise NotFoundException("Dietary preference not found")
         return item
@@ -23,7 +26,9 @@ class DietaryPreferenceService:
         existing = await self.repo.get_by_name(data.name)
         if existing:
             raise ConflictException(f"'{data.name}' already exists")
-        return await self.repo.create(data.model_dump())
+        item = await self.repo.create(data.model_dump())
+        lookup_cache.invalidate(self.db, DietaryPreference)
+        return item
 
     async def update(self, id: int, data: LookupUpdate):
         await self.get_by_id(id)
@@ -35,8 +40,11 @@ class DietaryPreferenceService:
         updated = await self.repo.update(id, update_data)
         if not updated:
             raise NotFoundException("Dietary preference not found")
+        lookup_cache.invalidate(self.db, DietaryPreference)
         return updated
 
     async def delete(self, id: int) -> bool:
         await self.get_by_id(id)
-        return await self.repo.delete(id)
+        deleted = await self.repo.delete(id)
+        lookup_cache.invalidate(self.db, DietaryPreference)
+        return deleted
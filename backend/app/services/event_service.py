@@ -1,10 +1,14 @@
+from collections.abc import AsyncIterator
+
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import lookup_cache
 from app.core.exceptions import NotFoundException
 from app.models.enums import EventStatus
 from app.models.event import Event
+from app.models.event_type import EventType
 from app.repositories.event import EventRepository
-from app.repositories.event_type import EventTypeRepository
 from app.schemas.event import EventCreate, EventUpdate
 
 
@@ -13,7 +17,6 @@ class EventService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.event_repo = EventRepository(db)
-        self.event_type_repo = EventTypeRepository(db)
 
     async def get_event(self, event_id: int) -> Event:
         event = await self.event_repo.get_by_id(event_id)
@@ -34,8 +37,17 @@ class EventService:
             return await self.event_repo.get_by_type(event_type_id, skip, limit)
         return await self.event_repo.get_all(skip=skip, limit=limit)
 
+    def stream_events(
+        self,
+        status: EventStatus | None = None,
+        event_type_id: int | None = None,
+    ) -> AsyncIterator[Row]:
+        return self.event_repo.stream_export(
+            {"status": status, "event_type_id": event_type_id}
+        )
+
     async def create_event(self, data: EventCreate) -> Event:
-        event_type = await self.event_type_repo.get_by_id(data.event_type_id)
+        event_type = await lookup_cache.get(self.db, EventType, data.event_type_id)
         if not event_type:
             raise NotFoundException("Event type not found")
         return await self.event_repo.create(data.model_dump())
@@ -45,7 +57,7 @@ class EventService:
         update_data = data.model_dump(exclude_unset=True)
 
         if "event_type_id" in update_data:
-            event_type = await self.event_type_repo.get_by_id(update_data["event_type_id"])
+            event_type = await lookup_cache.get(self.db, EventType, update_data["event_type_id"])
             if not event_type:
                 raise NotFoundException("Event type not found")
 
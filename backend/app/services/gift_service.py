@@ -1,10 +1,14 @@
+from collections.abc import AsyncIterator
+
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import NotFoundException
 from app.models.gift import Gift
+from app.models.guest import Guest
+from app.models.gift_type import GiftType
 from app.repositories.gift import GiftRepository
-from app.repositories.guest import GuestRepository
-from app.repositories.gift_type import GiftTypeRepository
+from app.services.references import ensure_references
 from app.schemas.gift import GiftCreate, GiftUpdate
 
 
@@ -13,8 +17,6 @@ class GiftService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.gift_repo = GiftRepository(db)
-        self.guest_repo = GuestRepository(db)
-        self.gift_type_repo = GiftTypeRepository(db)
 
     async def get_gift(self, gift_id: int) -> Gift:
         gift = await self.gift_repo.get_by_id(gift_id)
@@ -35,27 +37,31 @@ class GiftService:
             return await self.gift_repo.get_by_gift_type(gift_type_id, skip, limit)
         return await self.gift_repo.get_all(skip=skip, limit=limit)
 
+    def stream_gifts(
+        self,
+        guest_id: int | None = None,
+        gift_type_id: int | None = None,
+    ) -> AsyncIterator[Row]:
+        return self.gift_repo.stream_export(
+            {"guest_id": guest_id, "gift_type_id": gift_type_id}
+        )
+
+    async def _check_gift_references(self, data: dict) -> None:
+        await ensure_references(
+            self.db,
+            (Guest, data.get("guest_id"), "Guest not found"),
+            (GiftType, data.get("gift_type_id"), "Gift type not found"),
+        )
+
     async def create_gift(self, data: GiftCreate) -> Gift:
-        guest = await self.guest_repo.get_by_id(data.guest_id)
-        if not guest:
-            raise NotFoundException("Guest not found")
-        gift_type = await self.gift_type_repo.get_by_id(data.gift_type_id)
-        if not gift_type:
-            raise NotFoundException("Gift type not found")
+        await self._check_gift_references(data.model_dump())
         return await self.gift_repo.create(data.model_dump())
 
     async def update_gift(self, gift_id: int, data: GiftUpdate) -> Gift:
         await self.get_gift(gift_id)
         update_data = data.model_dump(exclude_unset=True)
 
-        if "guest_id" in update_data and update_data["guest_id"]:
-            guest = await self.guest_repo.get_by_id(update_data["guest_id"])
-            if not guest:
-                raise NotFoundException("Guest not found")
-        if "gift_type_id" in update_data and update_data["gift_type_id"]:
-            gift_type = await self.gift_type_repo.get_by_id(update_data["gift_type_id"])
-            if not gift_type:
-                raise NotFoundException("Gift type not found")
+        await self._check_gift_references(update_data)
 
         updated = await self.gift_repo.update(gift_id, update_data)
         if not updated:
@@ -1,23 +1,52 @@
+from collections.abc import AsyncIterator
+
+from pydantic import ValidationError
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import lookup_cache
 from app.core.exceptions import NotFoundException, ConflictException
 from app.models.enums import GuestSide
 from app.models.guest import Guest
+from app.models.dietary_preference import DietaryPreference
+from app.models.relation_type import RelationType
+from app.models.family_group import FamilyGroup
 from app.repositories.guest import GuestRepository
-from app.repositories.dietary_preference import DietaryPreferenceRepository
-from app.repositories.relation_type import RelationTypeRepository
-from app.repositories.family_group import FamilyGroupRepository
+from app.services.references import ensure_references
 from app.schemas.guest import GuestCreate, GuestUpdate
 
+# Normalized import headers (the export's included) that differ from field names
+IMPORT_ALIASES = {
+    "no_of_persons": "number_of_persons",
+    "arrival": "arrival_at",
+    "departure": "departure_at",
+    "vip": "is_vip",
+}
+# Import columns holding lookup names, resolved to the *_id fields
+IMPORT_LOOKUPS = {
+    "relation_type": ("relation_type_id", RelationType),
+    "family_group": ("family_group_id", FamilyGroup),
+    "dietary_preference": ("dietary_preference_id", DietaryPreference),
+}
+
+
+def _import_value(value):
+    """Blank cells become None; spreadsheet numbers like 9876543210.0 become text."""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        value = str(value)
+    if isinstance(value, str):
+        value = value.strip()
+        return value or None
+    return value
+
 
 class GuestService:
 
     def __init__(self, db: AsyncSession):
         self.db = db
         self.guest_repo = GuestRepository(db)
-        self.diet_repo = DietaryPreferenceRepository(db)
-        self.relation_repo = RelationTypeRepository(db)
-        self.family_group_repo = FamilyGroupRepository(db)
 
     async def get_guest(self, guest_id: int) -> Guest:
         guest = await self.guest_repo.get_by_id(guest_id)
@@ -25,6 +54,20 @@ class GuestService:
             raise NotFoundException("Guest not found")
         return guest
 
+    @staticmethod
+    def _guest_filters(
+        side: GuestSide | None = None,
+        family_group_id: int | None = None,
+        is_vip: bool | None = None,
+        dietary_preference_id: int | None = None,
+    ) -> dict:
+        return {
+            "side": side,
+            "family_group_id": family_group_id,
+            "is_vip": is_vip,
+            "dietary_preference_id": dietary_preference_id,
+        }
+
     async def get_guests(
         self,
         skip: int = 0,
@@ -34,53 +77,150 @@ class GuestService:
         is_vip: bool | None = None,
         dietary_preference_id: int | None = None,
     ) -> list[Guest]:
-        if side:
-            return await self.guest_repo.get_by_side(side, skip, limit)
-        if family_group_id:
-            return await self.guest_repo.get_by_family_group(family_group_id, skip, limit)
-        if is_vip:
-            return await self.guest_repo.get_vip_guests(skip, limit)
-        return await self.guest_repo.get_all(skip=skip, limit=limit)
+        filters = self._guest_filters(side, family_group_id, is_vip, dietary_preference_id)
+        return await self.guest_repo.get_filtered(filters, skip=skip, limit=limit)
+
+    async def get_guests_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        side: GuestSide | None = None,
+        family_group_id: int | None = None,
+        is_vip: bool | None = None,
+        dietary_preference_id: int | None = None,
+        cursor: str | None = None,
+    ) -> tuple[list[Guest], int | None, str | None]:
+        filters = self._guest_filters(side, family_group_id, is_vip, dietary_preference_id)
+        return await self.guest_repo.paginate(
+            filters, skip=skip, limit=limit, cursor=cursor
+        )
+
+    def stream_guests(
+        self,
+        side: GuestSide | None = None,
+        family_group_id: int | None = None,
+        is_vip: bool | None = None,
+        dietary_preference_id: int | None = None,
+    ) -> AsyncIterator[Row]:
+        filters = self._guest_filters(side, family_group_id, is_vip, dietary_preference_id)
+        return self.guest_repo.stream_export(filters)
+
+    async def _check_guest_references(self, data: dict) -> None:
+        await ensure_references(
+            self.db,
+            (DietaryPreference, data.get("dietary_preference_id"), "Dietary preference not found"),
+            (RelationType, data.get("relation_type_id"), "Relation type not found"),
+            (FamilyGroup, data.get("family_group_id"), "Family group not found"),
+        )
 
     async def create_guest(self, data: GuestCreate) -> Guest:
         if await self.guest_repo.phone_exists(data.phone):
             raise ConflictException("Phone number already registered")
 
-        if data.dietary_preference_id:
-            pref = await self.diet_repo.get_by_id(data.dietary_preference_id)
-            if not pref:
-                raise NotFoundException("Dietary preference not found")
-
-        if data.relation_type_id:
-            rel = await self.relation_repo.get_by_id(data.relation_type_id)
-            if not rel:
-                raise NotFoundException("Relation type not found")
-
-        if data.family_group_id:
-            fg = await self.family_group_repo.get_by_id(data.family_group_id)
-            if not fg:
-                raise NotFoundException("Family group not found")
+        await self._check_guest_references(data.model_dump())
 
         return await self.guest_repo.create(data.model_dump())
 
+    @staticmethod
+    def _parse_import_row(raw: dict, lookup_ids: dict) -> tuple[dict, list[str]]:
+        """Map one spreadsheet row onto GuestCreate fields."""
+        data, errors = {}, []
+        for header, value in raw.items():
+            value = _import_value(value)
+            if header in IMPORT_LOOKUPS:
+                field, model = IMPORT_LOOKUPS[header]
+                if value is not None:
+                    entry_id = lookup_ids[header].get(str(value).casefold())
+                    if entry_id is None:
+                        errors.append(f"Unknown {header.replace('_', ' ')} '{value}'")
+                    data[field] = entry_id
+                continue
+            field = IMPORT_ALIASES.get(header, header)
+            if field not in GuestCreate.model_fields or value is None:
+                continue
+            if field in ("side", "age_group"):
+                value = str(value).lower()
+            data[field] = value
+        return data, errors
+
+    async def import_guests(
+        self, rows: list[tuple[int, dict]], dry_run: bool = False
+    ) -> dict:
+        """Validate spreadsheet rows in bulk and insert the valid ones.
+
+        Lookup names are resolved through the lookup cache, phone/email
+        uniqueness is checked against the file and the table in one query,
+        and valid rows are inserted with multi-row INSERTs. ``rows`` are
+        ``(spreadsheet row number, values)`` pairs from ``read_spreadsheet``.
+        """
+        lookup_ids = {
+            header: await lookup_cache.ids_by_name(self.db, model)
+            for header, (_, model) in IMPORT_LOOKUPS.items()
+        }
+
+        errors: dict[int, list[str]] = {}
+        valid: dict[int, GuestCreate] = {}
+        phones: dict[str, int] = {}
+        emails: dict[str, int] = {}
+        for row_no, raw in rows:
+            data, row_errors = self._parse_import_row(raw, lookup_ids)
+            try:
+                guest = GuestCreate(**data)
+            except ValidationError as exc:
+                row_errors += [
+                    f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}"
+                    for err in exc.errors()
+                ]
+            else:
+                if guest.phone in phones:
+                    row_errors.append(f"Duplicate phone (also on row {phones[guest.phone]})")
+                if guest.email and guest.email in emails:
+                    row_errors.append(f"Duplicate email (also on row {emails[guest.email]})")
+                phones.setdefault(guest.phone, row_no)
+                if guest.email:
+                    emails.setdefault(guest.email, row_no)
+            if row_errors:
+                errors[row_no] = row_errors
+            else:
+                valid[row_no] = guest
+
+        taken_phones, taken_emails = await self.guest_repo.find_taken(
+            {g.phone for g in valid.values()}, {g.email for g in valid.values() if g.email}
+        )
+        for row_no, guest in list(valid.items()):
+            row_errors = []
+            if guest.phone in taken_phones:
+                row_errors.append("Phone number already registered")
+            if guest.email in taken_emails:
+                row_errors.append("Email already registered")
+            if row_errors:
+                errors[row_no] = row_errors
+                del valid[row_no]
+
+        created = len(valid)
+        if valid and not dry_run:
+            inserted = await self.guest_repo.bulk_create(
+                [guest.model_dump() for guest in valid.values()]
+            )
+            for row_no, guest in valid.items():
+                if guest.phone not in inserted:
+                    errors[row_no] = ["Phone number or email already registered"]
+            created = len(inserted)
+
+        return {
+            "total_rows": len(rows),
+            "created": created,
+            "dry_run": dry_run,
+            "errors": [
+                {"row": row_no, "errors": errs} for row_no, errs in sorted(errors.items())
+            ],
+        }
+
     async def update_guest(self, guest_id: int, data: GuestUpdate) -> Guest:
         await self.get_guest(guest_id)
         update_data = data.model_dump(exclude_unset=True)
 
-        if "dietary_preference_id" in update_data and update_data["dietary_preference_id"]:
-            pref = await self.diet_repo.get_by_id(update_data["dietary_preference_id"])
-            if not pref:
-                raise NotFoundException("Dietary preference not found")
-
-        if "relation_type_id" in update_data and update_data["relation_type_id"]:
-            rel = await self.relation_repo.get_by_id(update_data["relation_type_id"])
-            if not rel:
-                raise NotFoundException("Relation type not found")
-
-        if "family_group_id" in update_data and update_data["family_group_id"]:
-            fg = await self.family_group_repo.get_by_id(update_data["family_group_id"])
-            if not fg:
-                raise NotFoundException("Family group not found")
+        await self._check_guest_references(update_data)
 
         updated = await self.guest_repo.update(guest_id, update_data)
         if not updated:
@@ -93,6 +233,3 @@ class GuestService:
 
     async def get_summary(self) -> dict:
         return await self.guest_repo.get_summary()
-
-    async def count_guests(self) -> int:
-        return await self.guest_repo.count_all()
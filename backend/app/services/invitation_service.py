@@ -1,10 +1,12 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import NotFoundException, ConflictException
+from app.models.event import Event
+from app.models.guest import Guest
 from app.models.invitation import Invitation
 from app.repositories.invitation import InvitationRepository
 from app.repositories.event import EventRepository
-from app.repositories.guest import GuestRepository
+from app.services.references import ensure_references
 from app.schemas.invitation import (
     InvitationCreate, InvitationUpdate, BulkInvitationCreate, BulkRSVPUpdate,
 )
@@ -16,7 +18,6 @@ class InvitationService:
         self.db = db
         self.inv_repo = InvitationRepository(db)
         self.event_repo = EventRepository(db)
-        self.guest_repo = GuestRepository(db)
 
     async def get_all(self) -> list[Invitation]:
         return await self.inv_repo.get_all()
@@ -32,6 +33,13 @@ class InvitationService:
     ) -> list[Invitation]:
         return await self.inv_repo.get_by_event(event_id, skip, limit)
 
+    async def get_by_event_page(
+        self, event_id: int, skip: int = 0, limit: int = 100, cursor: str | None = None
+    ) -> tuple[list[Invitation], int | None, str | None]:
+        return await self.inv_repo.paginate(
+            {"event_id": event_id}, skip=skip, limit=limit, cursor=cursor
+        )
+
     async def get_by_guest(
         self, guest_id: int, skip: int = 0, limit: int = 100
     ) -> list[Invitation]:
@@ -62,13 +70,11 @@ class InvitationService:
         })
 
     async def create_invitation(self, data: InvitationCreate) -> Invitation:
-        event = await self.event_repo.get_by_id(data.event_id)
-        if not event:
-            raise NotFoundException("Event not found")
-
-        guest = await self.guest_repo.get_by_id(data.guest_id)
-        if not guest:
-            raise NotFoundException("Guest not found")
+        await ensure_references(
+            self.db,
+            (Event, data.event_id, "Event not found"),
+            (Guest, data.guest_id, "Guest not found"),
+        )
 
         result = await self._reactivate_or_create(
             data.guest_id, data.event_id, data.status, data.plus_ones, data.notes
@@ -82,21 +88,13 @@ class InvitationService:
         if not event:
             raise NotFoundException("Event not found")
 
+        guest_ids = set(data.guest_ids)
         created = 0
-        skipped = 0
-        for guest_id in data.guest_ids:
-            guest = await self.guest_repo.get_by_id(guest_id)
-            if not guest:
-                skipped += 1
-                continue
-
-            result = await self._reactivate_or_create(
-                guest_id, data.event_id, data.status
+        if guest_ids:
+            created = await self.inv_repo.bulk_invite(
+                data.event_id, list(guest_ids), data.status
             )
-            if result:
-                created += 1
-            else:
-                skipped += 1
+        skipped = len(data.guest_ids) - created
 
         return {
             "created": created,
@@ -113,18 +111,14 @@ class InvitationService:
         return updated
 
     async def bulk_update_rsvp(self, data: BulkRSVPUpdate) -> list[Invitation]:
-        results = []
-        for item in data.updates:
-            inv = await self.inv_repo.get_by_id(item.invitation_id)
-            if not inv:
-                continue
-            update_data = {"status": item.status}
-            if item.plus_ones is not None:
-                update_data["plus_ones"] = item.plus_ones
-            updated = await self.inv_repo.update(item.invitation_id, update_data)
-            if updated:
-                results.append(updated)
-        return results
+        # Last update wins when the same invitation appears more than once
+        latest = {
+            item.invitation_id: (item.invitation_id, item.status, item.plus_ones)
+            for item in data.updates
+        }
+        if not latest:
+            return []
+        return await self.inv_repo.bulk_update_rsvp(list(latest.values()))
 
     async def delete_invitation(self, invitation_id: int) -> bool:
         await self.get_invitation(invitation_id)
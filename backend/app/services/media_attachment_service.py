@@ -1,20 +1,32 @@
+import asyncio
+import hashlib
+import os
 import uuid
 from pathlib import Path
+from typing import BinaryIO
 
-from fastapi import UploadFile
+from fastapi import BackgroundTasks, UploadFile
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.core.config import get_settings
 from app.core.exceptions import BadRequestException, NotFoundException
+from app.db.session import AsyncSessionLocal
 from app.models.media_attachment import MediaAttachment
 from app.repositories.media_attachment import MediaAttachmentRepository
 from app.repositories.vendor_service import VendorServiceRepository
 from app.repositories.task import TaskRepository
+from app.utils.thumbnails import THUMBNAIL_MIME_TYPES, generate_thumbnails, remove_thumbnails
 
 settings = get_settings()
 
 ALLOWED_ENTITY_TYPES = ("vendor_service", "task")
 
+# Most entity ids one batch listing may ask for
+MAX_BATCH_ENTITIES = 500
+
 ALLOWED_MIME_TYPES = {
     # Images
     "image/jpeg", "image/png", "image/gif", "image/webp", "image/svg+xml",
@@ -30,6 +42,106 @@ ALLOWED_MIME_TYPES = {
     "text/plain", "text/csv",
 }
 
+# Uploads are copied to disk this many bytes at a time.
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Uploads are content-addressed: stored once under BLOB_DIR by SHA-256,
+# however many attachments share the content. Files are staged in
+# STAGING_DIR (same filesystem, so publishing is an atomic rename).
+BLOB_DIR = "blobs"
+STAGING_DIR = ".staging"
+
+# Session.info key: blobs published by the open transaction. If it ends
+# without committing, each path gets the ``release_file`` reference check.
+_PUBLISHED_BLOBS = "published_blobs"
+
+# Running ``release_file`` tasks for blobs of rolled-back uploads.
+_pending_releases: set[asyncio.Task] = set()
+
+
+def _file_too_large() -> BadRequestException:
+    return BadRequestException(
+        f"File too large. Maximum size is {settings.max_file_size_mb}MB"
+    )
+
+
+def _blob_path(digest: str) -> str:
+    """``blobs/ab/cd/abcd...`` relative to ``upload_dir``."""
+    return f"{BLOB_DIR}/{digest[:2]}/{digest[2:4]}/{digest}"
+
+
+def _stage_upload(src: BinaryIO, staged: Path, max_bytes: int) -> tuple[int, str]:
+    """Copy ``src`` to ``staged`` chunk by chunk; return its size and SHA-256.
+
+    Runs in a worker thread. The hash is computed on the same pass, and
+    the staged file is removed if the upload is too large or fails.
+    """
+    staged.parent.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with open(staged, "wb") as out:
+            while chunk := src.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise _file_too_large()
+                digest.update(chunk)
+                out.write(chunk)
+    except BaseException:
+        staged.unlink(missing_ok=True)
+        raise
+    return size, digest.hexdigest()
+
+
+def _publish_blob(staged: Path, blob: Path) -> None:
+    """Move a staged upload into the blob store (dropped if already stored)."""
+    if blob.exists():
+        staged.unlink(missing_ok=True)
+        return
+    blob.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(staged, blob)
+
+
+async def release_file(upload_path: str) -> None:
+    """Delete a stored file once no live attachment references it.
+
+    Runs after the deleting transaction has committed, in a session of
+    its own, holding the same per-path lock uploads take before reusing
+    a blob, so a concurrent upload of the same content is never left
+    pointing at a removed file.
+    """
+    async with AsyncSessionLocal() as session:
+        repo = MediaAttachmentRepository(session)
+        await repo.lock_path(upload_path)
+        if await repo.count_by_path(upload_path) == 0:
+            await run_in_threadpool(
+                (Path(settings.upload_dir) / upload_path).unlink, missing_ok=True
+            )
+            await run_in_threadpool(remove_thumbnails, upload_path)
+        await session.commit()
+
+
+@event.listens_for(Session, "after_commit")
+def _keep_published_blobs(session: Session) -> None:
+    session.info.pop(_PUBLISHED_BLOBS, None)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _release_unrecorded_blobs(session: Session, transaction) -> None:
+    """Re-check blobs published by a transaction that rolled back.
+
+    Nothing the transaction inserted references them any more, so unless
+    another attachment shares the content they are deleted. The check
+    runs in its own session once the rollback has freed the path locks.
+    """
+    if transaction.parent is not None:
+        return
+    paths = session.info.pop(_PUBLISHED_BLOBS, None)
+    for path in sorted(paths or ()):
+        task = asyncio.get_running_loop().create_task(release_file(path))
+        _pending_releases.add(task)
+        task.add_done_callback(_pending_releases.discard)
+
 
 class MediaAttachmentService:
 
@@ -55,74 +167,159 @@ class MediaAttachmentService:
     def _validate_file(self, file: UploadFile) -> None:
         max_bytes = settings.max_file_size_mb * 1024 * 1024
         if file.size and file.size > max_bytes:
-            raise BadRequestException(
-                f"File too large. Maximum size is {settings.max_file_size_mb}MB"
-            )
+            raise _file_too_large()
         if file.content_type not in ALLOWED_MIME_TYPES:
             raise BadRequestException(
                 f"File type '{file.content_type}' is not allowed"
             )
 
-    async def upload_file(
-        self, entity_type: str, entity_id: int, file: UploadFile
-    ) -> MediaAttachment:
+    async def _stage_file(self, file: UploadFile) -> dict:
+        """Stream an upload into the staging area and hash it.
+
+        The size limit is enforced while copying, so at most one chunk of
+        the upload is held in memory.
+        """
         self._validate_file(file)
 
+        staged = Path(settings.upload_dir) / STAGING_DIR / f"{uuid.uuid4().hex}.part"
+        await file.seek(0)
+        file_size, digest = await run_in_threadpool(
+            _stage_upload, file.file, staged, settings.max_file_size_mb * 1024 * 1024
+        )
         ext = Path(file.filename).suffix.lower() if file.filename else ""
-        stored_filename = f"{uuid.uuid4().hex}{ext}"
-        relative_path = f"{entity_type}/{entity_id}/{stored_filename}"
+        return {
+            "staged": staged,
+            "original_filename": file.filename or "unknown",
+            "stored_filename": f"{uuid.uuid4().hex}{ext}",
+            "file_size": file_size,
+            "mime_type": file.content_type or "application/octet-stream",
+            "upload_path": _blob_path(digest),
+        }
 
-        abs_dir = Path(settings.upload_dir) / entity_type / str(entity_id)
-        abs_dir.mkdir(parents=True, exist_ok=True)
-        abs_path = abs_dir / stored_filename
+    async def _record_file(
+        self, entity_type: str, entity_id: int, staged: dict
+    ) -> MediaAttachment:
+        """Publish a staged upload to the blob store and add its attachment row.
 
-        content = await file.read()
-        max_bytes = settings.max_file_size_mb * 1024 * 1024
-        if len(content) > max_bytes:
-            raise BadRequestException(
-                f"File too large. Maximum size is {settings.max_file_size_mb}MB"
-            )
+        The per-path lock (held until commit) serializes this with
+        ``release_file``, so an existing blob is not deleted while it is
+        being reused. Should the transaction roll back, the blob is handed
+        to ``release_file`` instead of being left unreferenced.
+        """
+        data = dict(staged)
+        staged_path = data.pop("staged")
+        await self.repo.lock_path(data["upload_path"])
+        await run_in_threadpool(
+            _publish_blob, staged_path, Path(settings.upload_dir) / data["upload_path"]
+        )
+        self.db.info.setdefault(_PUBLISHED_BLOBS, set()).add(data["upload_path"])
+        return await self.repo.create(
+            {"entity_type": entity_type, "entity_id": entity_id, **data}
+        )
 
-        with open(abs_path, "wb") as f:
-            f.write(content)
+    @staticmethod
+    def _queue_thumbnails(
+        attachment: MediaAttachment, background_tasks: BackgroundTasks | None
+    ) -> None:
+        """Create image previews after the response has been sent."""
+        if background_tasks is not None and attachment.mime_type in THUMBNAIL_MIME_TYPES:
+            background_tasks.add_task(generate_thumbnails, attachment.upload_path)
 
-        attachment = await self.repo.create({
-            "entity_type": entity_type,
-            "entity_id": entity_id,
-            "original_filename": file.filename or "unknown",
-            "stored_filename": stored_filename,
-            "file_size": len(content),
-            "mime_type": file.content_type or "application/octet-stream",
-            "upload_path": relative_path,
-        })
+    async def upload_file(
+        self,
+        entity_type: str,
+        entity_id: int,
+        file: UploadFile,
+        background_tasks: BackgroundTasks | None = None,
+    ) -> MediaAttachment:
+        staged = await self._stage_file(file)
+        attachment = await self._record_file(entity_type, entity_id, staged)
+        self._queue_thumbnails(attachment, background_tasks)
         return attachment
 
     async def upload_files(
-        self, entity_type: str, entity_id: int, files: list[UploadFile]
+        self,
+        entity_type: str,
+        entity_id: int,
+        files: list[UploadFile],
+        background_tasks: BackgroundTasks | None = None,
     ) -> list[MediaAttachment]:
+        """Stage all files concurrently, then record them.
+
+        If any file is rejected, the others' staged copies are removed and
+        nothing is recorded. Image previews are queued on
+        ``background_tasks``.
+        """
         await self._validate_entity(entity_type, entity_id)
-        results = []
-        for file in files:
-            attachment = await self.upload_file(entity_type, entity_id, file)
-            results.append(attachment)
-        return results
+        staged = await asyncio.gather(
+            *(self._stage_file(file) for file in files), return_exceptions=True
+        )
+        errors = [item for item in staged if isinstance(item, BaseException)]
+        if errors:
+            for item in staged:
+                if isinstance(item, dict):
+                    item["staged"].unlink(missing_ok=True)
+            raise errors[0]
+
+        attachments = [
+            await self._record_file(entity_type, entity_id, item) for item in staged
+        ]
+        for attachment in attachments:
+            self._queue_thumbnails(attachment, background_tasks)
+        return attachments
 
     async def get_attachments(
         self, entity_type: str, entity_id: int
     ) -> list[MediaAttachment]:
         return await self.repo.get_by_entity(entity_type, entity_id)
 
+    async def get_batch_attachments(
+        self, entity_type: str, entity_ids: list[int], per_entity: int | None = None
+    ) -> list[dict]:
+        """Attachment counts and lists for many entities in one query.
+
+        Every requested id gets an entry, in request order, even without
+        attachments; ``per_entity=0`` returns the counts alone.
+        """
+        if entity_type not in ALLOWED_ENTITY_TYPES:
+            raise BadRequestException(
+                f"Invalid entity_type. Must be one of: {', '.join(ALLOWED_ENTITY_TYPES)}"
+            )
+        entity_ids = list(dict.fromkeys(entity_ids))
+        if len(entity_ids) > MAX_BATCH_ENTITIES:
+            raise BadRequestException(
+                f"Too many entity ids; at most {MAX_BATCH_ENTITIES} per request"
+            )
+
+        if per_entity == 0:
+            counts = await self.repo.count_by_entities(entity_type, entity_ids)
+            return [
+                {"entity_id": entity_id, "count": counts.get(entity_id, 0), "attachments": []}
+                for entity_id in entity_ids
+            ]
+
+        grouped = await self.repo.get_by_entities(entity_type, entity_ids, per_entity)
+        results = []
+        for entity_id in entity_ids:
+            count, attachments = grouped.get(entity_id, (0, []))
+            results.append({"entity_id": entity_id, "count": count, "attachments": attachments})
+        return results
+
     async def get_attachment(self, attachment_id: int) -> MediaAttachment:
         attachment = await self.repo.get_by_id(attachment_id)
         if not attachment:
             raise NotFoundException("Attachment not found")
         return attachment
 
-    async def delete_attachment(self, attachment_id: int) -> bool:
-        attachment = await self.get_attachment(attachment_id)
-
-        abs_path = Path(settings.upload_dir) / attachment.upload_path
-        if abs_path.exists():
-            abs_path.unlink()
+    async def delete_attachment(
+        self, attachment_id: int, background_tasks: BackgroundTasks
+    ) -> bool:
+        """Soft-delete an attachment; its file goes once nothing references it.
 
-        return await self.repo.delete(attachment_id)
+        The reference check runs as a background task, after the response
+        (and so after this transaction's commit).
+        """
+        attachment = await self.get_attachment(attachment_id)
+        deleted = await self.repo.delete(attachment_id)
+        background_tasks.add_task(release_file, attachment.upload_path)
+        return deleted
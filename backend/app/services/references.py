@@ -0,0 +1,27 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import LOOKUP_MODELS, lookup_cache
+from app.core.exceptions import NotFoundException
+from app.repositories.base import existing_references
+
+
+async def ensure_references(db: AsyncSession, *refs: tuple[type, int | None, str]) -> None:
+    """Raise ``NotFoundException(message)`` for the first missing reference.
+
+    Each ref is ``(model, id, message)``; refs without an id are skipped.
+    Lookup tables are checked against the lookup cache and all other
+    tables together in a single query, instead of one ``get_by_id`` each.
+    """
+    refs = [ref for ref in refs if ref[1]]
+    queried = [(model, id) for model, id, _ in refs if model not in LOOKUP_MODELS]
+    found = await existing_references(db, queried)
+
+    pos = 0
+    for model, id, message in refs:
+        if model in LOOKUP_MODELS:
+            exists = await lookup_cache.get(db, model, id) is not None
+        else:
+            exists = pos in found
+            pos += 1
+        if not exists:
+            raise NotFoundException(message)
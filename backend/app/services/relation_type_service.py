@@ -1,6 +1,8 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import lookup_cache
 from app.core.exceptions import NotFoundException, ConflictException
+from app.models.relation_type import RelationType
 from app.repositories.relation_type import RelationTypeRepository
 from app.schemas.lookup import LookupCreate, LookupUpdate
 
@@ -8,13 +10,14 @@ from app.schemas.lookup import LookupCreate, LookupUpdate
 class RelationTypeService:
 
     def __init__(self, db: AsyncSession):
+        self.db = db
         self.repo = RelationTypeRepository(db)
 
     async def get_all(self) -> list:
-        return await self.repo.get_active()
+        return await lookup_cache.get_active(self.db, RelationType)
 
     async def get_by_id(self, id: int):
-        item = await self.repo.get_by_id(id)
+        item = await lookup_cache.get(self.db, RelationType, id)
         if not item:
             raise NotFoundException("Relation type not found")
         return item
@@ -23,7 +26,9 @@ class RelationTypeService:
         existing = await self.repo.get_by_name(data.name)
         if existing:
             raise ConflictException(f"'{data.name}' already exists")
-        return await self.repo.create(data.model_dump())
+        item = await self.repo.create(data.model_dump())
+        lookup_cache.invalidate(self.db, RelationType)
+        return item
 
     async def update(self, id: int, data: LookupUpdate):
         await self.get_by_id(id)
@@ -35,8 +40,11 @@ class RelationTypeService:
         updated = await self.repo.update(id, update_data)
         if not updated:
             raise NotFoundException("Relation type not found")
+        lookup_cache.invalidate(self.db, RelationType)
         return updated
 
     async def delete(self, id: int) -> bool:
         await self.get_by_id(id)
-        return await self.repo.delete(id)
+        deleted = await self.repo.delete(id)
+        lookup_cache.invalidate(self.db, RelationType)
+        return deleted
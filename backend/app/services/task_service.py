@@ -1,14 +1,18 @@
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import AuthenticatedUser
 from app.core.exceptions import NotFoundException, ForbiddenException
 from app.models.enums import TaskStatus, TaskPriority
+from app.models.event import Event
 from app.models.task import Task
 from app.models.user import User
 from app.repositories.task import TaskRepository
-from app.repositories.event import EventRepository
 from app.repositories.user import UserRepository
+from app.services.references import ensure_references
 from app.schemas.task import TaskCreate, TaskUpdate, TaskUserUpdate
 
 
@@ -17,7 +21,6 @@ class TaskService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.task_repo = TaskRepository(db)
-        self.event_repo = EventRepository(db)
         self.user_repo = UserRepository(db)
 
     async def get_task(self, task_id: int) -> Task:
@@ -26,6 +29,20 @@ class TaskService:
             raise NotFoundException("Task not found")
         return task
 
+    @staticmethod
+    def _task_filters(
+        status: TaskStatus | None = None,
+        priority: TaskPriority | None = None,
+        event_id: int | None = None,
+        assigned_to_user_id: int | None = None,
+    ) -> dict:
+        return {
+            "status": status,
+            "priority": priority,
+            "event_id": event_id,
+            "assigned_to_user_id": assigned_to_user_id,
+        }
+
     async def get_tasks(
         self,
         skip: int = 0,
@@ -35,25 +52,43 @@ class TaskService:
         event_id: int | None = None,
         assigned_to_user_id: int | None = None,
     ) -> list[Task]:
-        if status:
-            return await self.task_repo.get_by_status(status, skip, limit)
-        if priority:
-            return await self.task_repo.get_by_priority(priority, skip, limit)
-        if event_id:
-            return await self.task_repo.get_by_event(event_id, skip, limit)
-        if assigned_to_user_id:
-            return await self.task_repo.get_by_assigned_user(assigned_to_user_id, skip, limit)
-        return await self.task_repo.get_all(skip=skip, limit=limit)
-
-    async def create_task(self, data: TaskCreate, current_user: User) -> Task:
-        if data.event_id:
-            event = await self.event_repo.get_by_id(data.event_id)
-            if not event:
-                raise NotFoundException("Event not found")
-        if data.assigned_to_user_id:
-            user = await self.user_repo.get_by_id(data.assigned_to_user_id)
-            if not user:
-                raise NotFoundException("Assigned user not found")
+        filters = self._task_filters(status, priority, event_id, assigned_to_user_id)
+        return await self.task_repo.get_filtered(filters, skip=skip, limit=limit)
+
+    async def get_tasks_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        status: TaskStatus | None = None,
+        priority: TaskPriority | None = None,
+        event_id: int | None = None,
+        assigned_to_user_id: int | None = None,
+        cursor: str | None = None,
+    ) -> tuple[list[Task], int | None, str | None]:
+        filters = self._task_filters(status, priority, event_id, assigned_to_user_id)
+        return await self.task_repo.paginate(
+            filters, skip=skip, limit=limit, cursor=cursor
+        )
+
+    def stream_tasks(
+        self,
+        status: TaskStatus | None = None,
+        priority: TaskPriority | None = None,
+        event_id: int | None = None,
+        assigned_to_user_id: int | None = None,
+    ) -> AsyncIterator[Row]:
+        filters = self._task_filters(status, priority, event_id, assigned_to_user_id)
+        return self.task_repo.stream_export(filters)
+
+    async def _check_task_references(self, data: dict) -> None:
+        await ensure_references(
+            self.db,
+            (Event, data.get("event_id"), "Event not found"),
+            (User, data.get("assigned_to_user_id"), "Assigned user not found"),
+        )
+
+    async def create_task(self, data: TaskCreate, current_user: AuthenticatedUser) -> Task:
+        await self._check_task_references(data.model_dump())
 
         task_data = data.model_dump()
         task_data["created_by_user_id"] = current_user.id
@@ -64,14 +99,7 @@ class TaskService:
         task = await self.get_task(task_id)
         update_data = data.model_dump(exclude_unset=True)
 
-        if "event_id" in update_data and update_data["event_id"]:
-            event = await self.event_repo.get_by_id(update_data["event_id"])
-            if not event:
-                raise NotFoundException("Event not found")
-        if "assigned_to_user_id" in update_data and update_data["assigned_to_user_id"]:
-            user = await self.user_repo.get_by_id(update_data["assigned_to_user_id"])
-            if not user:
-                raise NotFoundException("Assigned user not found")
+        await self._check_task_references(update_data)
 
         self._handle_completed_at(update_data, task)
 
@@ -81,7 +109,7 @@ class TaskService:
         return updated
 
     async def update_task_as_user(
-        self, task_id: int, data: TaskUserUpdate, current_user: User
+        self, task_id: int, data: TaskUserUpdate, current_user: AuthenticatedUser
     ) -> Task:
         """User-scoped update: status + reassign to admin only."""
         task = await self.get_task(task_id)
@@ -125,6 +153,3 @@ class TaskService:
 
     async def get_summary(self) -> dict:
         return await self.task_repo.get_summary()
-
-    async def count_tasks(self) -> int:
-        return await self.task_repo.count_all()
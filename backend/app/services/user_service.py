@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import invalidate_user
 from app.core.security import hash_password, verify_password
 from app.core.exceptions import NotFoundException, ConflictException, BadRequestException
 from app.repositories.user import UserRepository
@@ -32,7 +33,7 @@ class UserService:
 
         user_data = {
             "email": data.email,
-            "hashed_password": hash_password(data.password),
+            "hashed_password": await hash_password(data.password),
             "first_name": data.first_name,
             "last_name": data.last_name,
             "role": data.role,
@@ -48,6 +49,7 @@ class UserService:
         updated_user = await self.user_repo.update(user.id, update_data)
         if not updated_user:
             raise NotFoundException("User not found")
+        invalidate_user(self.db, user.id)
         return updated_user
 
     async def update_user_admin(self, user_id: int, data: UserUpdateAdmin) -> User:
@@ -58,16 +60,17 @@ class UserService:
         updated_user = await self.user_repo.update(user.id, update_data)
         if not updated_user:
             raise NotFoundException("User not found")
+        invalidate_user(self.db, user.id)
         return updated_user
 
     async def update_password(self, user_id: int, data: PasswordUpdate) -> User:
         """Update user password."""
         user = await self.get_user(user_id)
 
-        if not verify_password(data.current_password, user.hashed_password):
+        if not await verify_password(data.current_password, user.hashed_password):
             raise BadRequestException("Current password is incorrect")
 
-        update_data = {"hashed_password": hash_password(data.new_password)}
+        update_data = {"hashed_password": await hash_password(data.new_password)}
         updated_user = await self.user_repo.update(user.id, update_data)
         if not updated_user:
             raise NotFoundException("User not found")
@@ -76,4 +79,6 @@ class UserService:
     async def delete_user(self, user_id: int) -> bool:
         """Soft delete a user."""
         user = await self.get_user(user_id)
-        return await self.user_repo.delete(user.id)
+        deleted = await self.user_repo.delete(user.id)
+        invalidate_user(self.db, user.id)
+        return deleted
@@ -1,9 +1,13 @@
+from collections.abc import AsyncIterator
+
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import lookup_cache
 from app.core.exceptions import NotFoundException
 from app.models.vendor import Vendor
+from app.models.vendor_category import VendorCategory
 from app.repositories.vendor import VendorRepository
-from app.repositories.vendor_category import VendorCategoryRepository
 from app.schemas.vendor import VendorCreate, VendorUpdate
 
 
@@ -12,7 +16,6 @@ class VendorService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.vendor_repo = VendorRepository(db)
-        self.category_repo = VendorCategoryRepository(db)
 
     async def get_vendor(self, vendor_id: int) -> Vendor:
         vendor = await self.vendor_repo.get_by_id(vendor_id)
@@ -33,8 +36,17 @@ class VendorService:
             return await self.vendor_repo.get_booked(skip, limit)
         return await self.vendor_repo.get_all(skip=skip, limit=limit)
 
+    def stream_vendors(
+        self,
+        vendor_category_id: int | None = None,
+        is_booked: bool | None = None,
+    ) -> AsyncIterator[Row]:
+        return self.vendor_repo.stream_export(
+            {"vendor_category_id": vendor_category_id, "is_booked": is_booked}
+        )
+
     async def create_vendor(self, data: VendorCreate) -> Vendor:
-        category = await self.category_repo.get_by_id(data.vendor_category_id)
+        category = await lookup_cache.get(self.db, VendorCategory, data.vendor_category_id)
         if not category:
             raise NotFoundException("Vendor category not found")
         return await self.vendor_repo.create(data.model_dump())
@@ -44,7 +56,7 @@ class VendorService:
         update_data = data.model_dump(exclude_unset=True)
 
         if "vendor_category_id" in update_data:
-            category = await self.category_repo.get_by_id(update_data["vendor_category_id"])
+            category = await lookup_cache.get(self.db, VendorCategory, update_data["vendor_category_id"])
             if not category:
                 raise NotFoundException("Vendor category not found")
 
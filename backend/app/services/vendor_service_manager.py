@@ -1,11 +1,15 @@
+from collections.abc import AsyncIterator
+
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import NotFoundException
 from app.models.enums import VendorServiceStatus
+from app.models.event import Event
+from app.models.vendor import Vendor
 from app.models.vendor_service import VendorServiceItem
 from app.repositories.vendor_service import VendorServiceRepository
-from app.repositories.vendor import VendorRepository
-from app.repositories.event import EventRepository
+from app.services.references import ensure_references
 from app.schemas.vendor_service import VendorServiceCreate, VendorServiceUpdate
 
 
@@ -14,8 +18,6 @@ class VendorServiceManager:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.repo = VendorServiceRepository(db)
-        self.vendor_repo = VendorRepository(db)
-        self.event_repo = EventRepository(db)
 
     async def get_service(self, service_id: int) -> VendorServiceItem:
         item = await self.repo.get_by_id(service_id)
@@ -23,6 +25,17 @@ class VendorServiceManager:
             raise NotFoundException("Vendor service not found")
         return item
 
+    @staticmethod
+    def _service_filters(
+        vendor_id: int | None = None,
+        event_id: int | None = None,
+        status: VendorServiceStatus | None = None,
+        unassigned: bool | None = None,
+    ) -> tuple[dict, list]:
+        filters = {"vendor_id": vendor_id, "event_id": event_id, "status": status}
+        conditions = [VendorServiceItem.vendor_id.is_(None)] if unassigned else []
+        return filters, conditions
+
     async def get_services(
         self,
         skip: int = 0,
@@ -32,27 +45,43 @@ class VendorServiceManager:
         status: VendorServiceStatus | None = None,
         unassigned: bool | None = None,
     ) -> list[VendorServiceItem]:
-        if unassigned:
-            return await self.repo.get_unassigned(skip, limit)
-        if vendor_id:
-            return await self.repo.get_by_vendor(vendor_id, skip, limit)
-        if event_id:
-            return await self.repo.get_by_event(event_id, skip, limit)
-        if status:
-            return await self.repo.get_by_status(status, skip, limit)
-        return await self.repo.get_all(skip=skip, limit=limit)
+        filters, conditions = self._service_filters(vendor_id, event_id, status, unassigned)
+        return await self.repo.get_filtered(filters, conditions, skip=skip, limit=limit)
 
-    async def create_service(self, data: VendorServiceCreate) -> VendorServiceItem:
-        if data.vendor_id:
-            vendor = await self.vendor_repo.get_by_id(data.vendor_id)
-            if not vendor:
-                raise NotFoundException("Vendor not found")
+    async def get_services_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        vendor_id: int | None = None,
+        event_id: int | None = None,
+        status: VendorServiceStatus | None = None,
+        unassigned: bool | None = None,
+        cursor: str | None = None,
+    ) -> tuple[list[VendorServiceItem], int | None, str | None]:
+        filters, conditions = self._service_filters(vendor_id, event_id, status, unassigned)
+        return await self.repo.paginate(
+            filters, conditions, skip=skip, limit=limit, cursor=cursor
+        )
+
+    def stream_services(
+        self,
+        vendor_id: int | None = None,
+        event_id: int | None = None,
+        status: VendorServiceStatus | None = None,
+        unassigned: bool | None = None,
+    ) -> AsyncIterator[Row]:
+        filters, conditions = self._service_filters(vendor_id, event_id, status, unassigned)
+        return self.repo.stream_export(filters, conditions)
 
-        if data.event_id:
-            event = await self.event_repo.get_by_id(data.event_id)
-            if not event:
-                raise NotFoundException("Event not found")
+    async def _check_service_references(self, data: dict) -> None:
+        await ensure_references(
+            self.db,
+            (Vendor, data.get("vendor_id"), "Vendor not found"),
+            (Event, data.get("event_id"), "Event not found"),
+        )
 
+    async def create_service(self, data: VendorServiceCreate) -> VendorServiceItem:
+        await self._check_service_references(data.model_dump())
         return await self.repo.create(data.model_dump())
 
     async def update_service(
@@ -61,15 +90,7 @@ class VendorServiceManager:
         await self.get_service(service_id)
         update_data = data.model_dump(exclude_unset=True)
 
-        if "vendor_id" in update_data and update_data["vendor_id"]:
-            vendor = await self.vendor_repo.get_by_id(update_data["vendor_id"])
-            if not vendor:
-                raise NotFoundException("Vendor not found")
-
-        if "event_id" in update_data and update_data["event_id"]:
-            event = await self.event_repo.get_by_id(update_data["event_id"])
-            if not event:
-                raise NotFoundException("Event not found")
+        await self._check_service_references(update_data)
 
         updated = await self.repo.update(service_id, update_data)
         if not updated:
@@ -82,6 +103,3 @@ class VendorServiceManager:
 
     async def get_summary(self) -> dict:
         return await self.repo.get_summary()
-
-    async def count_services(self) -> int:
-        return await self.repo.count_all()
@@ -1,11 +1,19 @@
-from collections.abc import Callable
+import tempfile
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable
 from datetime import date, datetime, time
 from decimal import Decimal
 from enum import Enum
-from io import BytesIO
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
+from starlette.concurrency import run_in_threadpool
+
+EXPORT_CHUNK_SIZE = 64 * 1024
+WIDTH_SAMPLE_SIZE = 200
+MAX_COLUMN_WIDTH = 50
+SPOOL_MAX_SIZE = 4 * 1024 * 1024
 
 
 def _format_value(value):
@@ -27,57 +35,88 @@ def _format_value(value):
     return value
 
 
-def _resolve_value(item, field: str | Callable):
+def resolve_value(item, field: str | Callable):
     """Resolve a column value from an item using a field name or callable."""
     if callable(field):
         return field(item)
     return getattr(item, field, None)
 
 
-def generate_excel(
-    items: list,
+def _column_widths(
+    columns: list[tuple[str | Callable, str]], sample: list[list]
+) -> list[int]:
+    """Estimate column widths from the header and a bounded row sample."""
+    widths = []
+    for col_idx, (_, header) in enumerate(columns):
+        max_length = len(header)
+        for row in sample:
+            value = row[col_idx]
+            if value is not None:
+                max_length = max(max_length, len(str(value)))
+        widths.append(min(max_length + 2, MAX_COLUMN_WIDTH))
+    return widths
+
+
+async def as_async_iter(items: Iterable | AsyncIterable) -> AsyncIterator:
+    """Iterate plain and async iterables alike."""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def stream_excel(
+    items: Iterable | AsyncIterable,
     columns: list[tuple[str | Callable, str]],
     sheet_name: str = "Sheet1",
-) -> BytesIO:
-    """Generate an Excel file from a list of model instances.
+) -> AsyncIterator[bytes]:
+    """Stream an Excel file built from model instances or rows.
+
+    Uses an openpyxl write-only workbook, so rows are flushed to a temp
+    file as they are appended instead of being held as cell objects.
+    Column widths are estimated from the first ``WIDTH_SAMPLE_SIZE`` rows.
+    The finished file is spooled (to disk once large) and yielded in
+    ``EXPORT_CHUNK_SIZE`` chunks.
 
     Args:
-        items: List of SQLAlchemy model instances.
+        items: Iterable or async iterable of SQLAlchemy model instances
+               (or any objects/rows the column specs can read).
         columns: List of (field_or_callable, header_label) tuples.
                  field_or_callable can be a string attribute name or a
                  callable that takes an item and returns the value.
         sheet_name: Name for the worksheet.
-
-    Returns:
-        BytesIO buffer containing the Excel file.
     """
-    wb = Workbook()
-    ws = wb.active
-    ws.title = sheet_name
+    rows = as_async_iter(items)
 
-    bold = Font(bold=True)
+    sample = []
+    async for item in rows:
+        sample.append([_format_value(resolve_value(item, field)) for field, _ in columns])
+        if len(sample) >= WIDTH_SAMPLE_SIZE:
+            break
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title=sheet_name)
 
-    # Write headers
-    for col_idx, (_, header) in enumerate(columns, start=1):
-        cell = ws.cell(row=1, column=col_idx, value=header)
+    for col_idx, width in enumerate(_column_widths(columns, sample), start=1):
+        ws.column_dimensions[get_column_letter(col_idx)].width = width
+
+    bold = Font(bold=True)
+    header = []
+    for _, label in columns:
+        cell = WriteOnlyCell(ws, value=label)
         cell.font = bold
+        header.append(cell)
+    ws.append(header)
 
-    # Write data rows
-    for row_idx, item in enumerate(items, start=2):
-        for col_idx, (field, _) in enumerate(columns, start=1):
-            value = _resolve_value(item, field)
-            ws.cell(row=row_idx, column=col_idx, value=_format_value(value))
+    for row in sample:
+        ws.append(row)
+    async for item in rows:
+        ws.append([_format_value(resolve_value(item, field)) for field, _ in columns])
 
-    # Auto-width columns
-    for col_idx, (_, header) in enumerate(columns, start=1):
-        max_length = len(header)
-        for row in ws.iter_rows(min_row=2, min_col=col_idx, max_col=col_idx):
-            for cell in row:
-                if cell.value is not None:
-                    max_length = max(max_length, len(str(cell.value)))
-        ws.column_dimensions[ws.cell(row=1, column=col_idx).column_letter].width = min(max_length + 2, 50)
-
-    buffer = BytesIO()
-    wb.save(buffer)
-    buffer.seek(0)
-    return buffer
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as buffer:
+        await run_in_threadpool(wb.save, buffer)
+        buffer.seek(0)
+        while chunk := buffer.read(EXPORT_CHUNK_SIZE):
+            yield chunk
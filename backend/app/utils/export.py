@@ -0,0 +1,202 @@
+import csv
+import enum
+import io
+import tempfile
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable
+from datetime import date, time
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from fastapi.responses import StreamingResponse
+from sqlalchemy import (
+    BigInteger, Boolean, Date, DateTime, Enum as SAEnum, Float, Integer, Numeric, Time,
+)
+from starlette.concurrency import run_in_threadpool
+
+from app.utils.excel import (
+    EXPORT_CHUNK_SIZE,
+    SPOOL_MAX_SIZE,
+    as_async_iter,
+    resolve_value,
+    stream_excel,
+)
+
+PARQUET_BATCH_SIZE = 10_000
+
+
+class ExportFormat(str, enum.Enum):
+    XLSX = "xlsx"
+    CSV = "csv"
+    PARQUET = "parquet"
+
+
+MEDIA_TYPES = {
+    ExportFormat.XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+}
+
+
+def _csv_value(value):
+    """Machine-readable CSV text: enum values, ISO dates, plain decimals.
+
+    Decimals and booleans are left to ``csv.writer`` (``str(value)``), so
+    amounts keep their exact digits.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    return value
+
+
+async def stream_csv(
+    items: Iterable | AsyncIterable,
+    columns: list[tuple[str | Callable, str]],
+) -> AsyncIterator[bytes]:
+    """Stream a UTF-8 CSV file, yielding roughly ``EXPORT_CHUNK_SIZE`` chunks.
+
+    Rows are written into one reusable text buffer that is drained every
+    time it fills up, so nothing beyond the current chunk is held.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # BOM so Excel opens the file as UTF-8
+    buffer.write("\ufeff")
+    writer.writerow([header for _, header in columns])
+
+    async for item in as_async_iter(items):
+        writer.writerow([_csv_value(resolve_value(item, field)) for field, _ in columns])
+        if buffer.tell() >= EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def _arrow_type(column_type) -> pa.DataType:
+    """Arrow type for a SQLAlchemy column type; anything unmapped is a string."""
+    if isinstance(column_type, Boolean):
+        return pa.bool_()
+    if isinstance(column_type, SAEnum):
+        return pa.string()
+    if isinstance(column_type, BigInteger):
+        return pa.int64()
+    if isinstance(column_type, Integer):
+        return pa.int32()
+    if isinstance(column_type, Float):
+        return pa.float64()
+    if isinstance(column_type, Numeric) and column_type.precision is not None:
+        return pa.decimal128(column_type.precision, column_type.scale or 0)
+    if isinstance(column_type, DateTime):
+        return pa.timestamp("us", tz="UTC" if column_type.timezone else None)
+    if isinstance(column_type, Date):
+        return pa.date32()
+    if isinstance(column_type, Time):
+        return pa.time64("us")
+    return pa.string()
+
+
+def _parquet_schema(
+    columns: list[tuple[str | Callable, str]], model: type | None
+) -> pa.Schema:
+    """Build the schema up front from ``model``'s column types.
+
+    Column specs that are not columns of ``model`` (joined names,
+    callables) are strings, so no batch of data can change the schema
+    mid-stream.
+    """
+    table_columns = model.__table__.columns if model is not None else {}
+    fields = []
+    for field, header in columns:
+        column = table_columns.get(field) if isinstance(field, str) else None
+        arrow_type = _arrow_type(column.type) if column is not None else pa.string()
+        fields.append(pa.field(header, arrow_type))
+    return pa.schema(fields)
+
+
+def _parquet_value(value, arrow_type: pa.DataType):
+    """Unwrap enums; anything bound for a string column is stringified."""
+    if value is None:
+        return None
+    if isinstance(value, enum.Enum):
+        value = value.value
+    if pa.types.is_string(arrow_type) and not isinstance(value, str):
+        return str(value)
+    return value
+
+
+async def stream_parquet(
+    items: Iterable | AsyncIterable,
+    columns: list[tuple[str | Callable, str]],
+    model: type | None = None,
+) -> AsyncIterator[bytes]:
+    """Stream a Parquet file built from the same column specs as the xlsx export.
+
+    Column types come from ``model`` (see ``_parquet_schema``). Rows are
+    buffered ``PARQUET_BATCH_SIZE`` at a time and written as row groups to
+    a spooled temp file, which is yielded in chunks once the footer has
+    been written.
+    """
+    schema = _parquet_schema(columns, model)
+    types = schema.types
+
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as buffer:
+        writer = pq.ParquetWriter(buffer, schema)
+        batch = []
+
+        def write_batch():
+            arrays = [
+                pa.array([row[i] for row in batch], type=arrow_type)
+                for i, arrow_type in enumerate(types)
+            ]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+
+        async for item in as_async_iter(items):
+            batch.append([
+                _parquet_value(resolve_value(item, field), arrow_type)
+                for (field, _), arrow_type in zip(columns, types)
+            ])
+            if len(batch) >= PARQUET_BATCH_SIZE:
+                await run_in_threadpool(write_batch)
+                batch = []
+        if batch:
+            await run_in_threadpool(write_batch)
+        await run_in_threadpool(writer.close)
+
+        buffer.seek(0)
+        while chunk := buffer.read(EXPORT_CHUNK_SIZE):
+            yield chunk
+
+
+def export_response(
+    items: Iterable | AsyncIterable,
+    columns: list[tuple[str | Callable, str]],
+    sheet_name: str,
+    filename: str,
+    export_format: ExportFormat = ExportFormat.XLSX,
+    model: type | None = None,
+) -> StreamingResponse:
+    """Build a streaming download of ``items`` in the requested format.
+
+    ``model`` is the ORM class the rows come from; Parquet takes its
+    column types from it.
+    """
+    if export_format == ExportFormat.CSV:
+        content = stream_csv(items, columns)
+    elif export_format == ExportFormat.PARQUET:
+        content = stream_parquet(items, columns, model)
+    else:
+        content = stream_excel(items, columns, sheet_name)
+
+    return StreamingResponse(
+        content,
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}.{export_format.value}"
+        },
+    )
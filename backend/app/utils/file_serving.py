@@ -0,0 +1,146 @@
+import os
+from collections.abc import AsyncIterator
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from urllib.parse import quote
+
+import anyio
+from fastapi import Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+from app.core.http_cache import REVALIDATE, etag_matches
+
+FILE_CHUNK_SIZE = 64 * 1024
+
+
+def content_disposition(filename: str) -> str:
+    """``attachment`` disposition, RFC 5987-encoded for non-ASCII names."""
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
+
+
+def accel_redirect_response(
+    location: str, filename: str, media_type: str, cache_control: str = REVALIDATE
+) -> Response:
+    """Hand the file to nginx: an empty response naming an ``internal`` location.
+
+    nginx serves the bytes itself, Range and conditional requests included.
+    """
+    return Response(
+        headers={
+            "X-Accel-Redirect": quote(location),
+            "Content-Type": media_type,
+            "Content-Disposition": content_disposition(filename),
+            "Cache-Control": cache_control,
+        }
+    )
+
+
+def _not_modified(request: Request, etag: str, mtime: float) -> bool:
+    """If-None-Match wins; If-Modified-Since is only consulted without it."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(etag, if_none_match)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def _parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """First and last byte of a single ``bytes=`` range, or ``None`` for all.
+
+    Multi-range and malformed headers fall back to the whole file, as
+    RFC 9110 allows; an unsatisfiable range raises ``ValueError``.
+    """
+    unit, _, spec = header.partition("=")
+    first, dash, last = spec.strip().partition("-")
+    if (
+        unit.strip().lower() != "bytes"
+        or not dash
+        or not (first or last)
+        or not (first.isdigit() or not first)
+        or not (last.isdigit() or not last)
+    ):
+        return None
+    if not first:
+        if int(last) == 0 or size == 0:
+            raise ValueError("range not satisfiable")
+        return max(size - int(last), 0), size - 1
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise ValueError("range not satisfiable")
+    return start, min(int(last), size - 1) if last else size - 1
+
+
+async def _read_range(path: Path, start: int, end: int) -> AsyncIterator[bytes]:
+    async with await anyio.open_file(path, "rb") as f:
+        await f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = await f.read(min(FILE_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def file_response(
+    request: Request,
+    path: Path,
+    filename: str,
+    media_type: str,
+    etag: str | None = None,
+    cache_control: str = REVALIDATE,
+) -> Response:
+    """Serve ``path`` with conditional GET and single-range support.
+
+    ``etag`` defaults to one derived from the file's mtime and size; pass
+    a content hash when there is one.
+    """
+    stat = os.stat(path)
+    etag = etag or f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+        "Accept-Ranges": "bytes",
+        "Cache-Control": cache_control,
+    }
+    if _not_modified(request, etag, stat.st_mtime):
+        return Response(status_code=304, headers=headers)
+
+    byte_range = None
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (if_range is None or if_range.strip() in (etag, headers["Last-Modified"])):
+        try:
+            byte_range = _parse_range(range_header, stat.st_size)
+        except ValueError:
+            return Response(
+                status_code=416, headers={**headers, "Content-Range": f"bytes */{stat.st_size}"}
+            )
+
+    if byte_range is None:
+        return FileResponse(
+            path, stat_result=stat, filename=filename, media_type=media_type, headers=headers
+        )
+
+    start, end = byte_range
+    return StreamingResponse(
+        _read_range(path, start, end),
+        status_code=206,
+        media_type=media_type,
+        headers={
+            **headers,
+            "Content-Range": f"bytes {start}-{end}/{stat.st_size}",
+            "Content-Length": str(end - start + 1),
+            "Content-Disposition": content_disposition(filename),
+        },
+    )
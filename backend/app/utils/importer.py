@@ -0,0 +1,71 @@
+import csv
+import io
+import zipfile
+from pathlib import Path
+
+from openpyxl import load_workbook
+from openpyxl.utils.exceptions import InvalidFileException
+from starlette.concurrency import run_in_threadpool
+
+from app.core.exceptions import BadRequestException
+
+IMPORT_EXTENSIONS = {".xlsx", ".csv"}
+
+
+def normalize_header(header) -> str:
+    """``"No. of Persons"`` -> ``"no_of_persons"``."""
+    text = str(header or "").strip().lower()
+    for char in ".()/-":
+        text = text.replace(char, " ")
+    return "_".join(text.split())
+
+
+def _read_xlsx(content: bytes) -> list[tuple[int, dict]]:
+    wb = load_workbook(io.BytesIO(content), read_only=True, data_only=True)
+    try:
+        # Gaps between rows come back as all-None tuples, so the position
+        # in the iteration is the sheet row number
+        rows = wb.active.iter_rows(values_only=True)
+        headers = [normalize_header(h) for h in next(rows, ())]
+        return [
+            (row_no, dict(zip(headers, values)))
+            for row_no, values in enumerate(rows, start=2)
+            if any(v not in (None, "") for v in values)
+        ]
+    finally:
+        wb.close()
+
+
+def _read_csv(content: bytes) -> list[tuple[int, dict]]:
+    try:
+        text = content.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise BadRequestException("CSV files must be UTF-8 encoded")
+    reader = csv.reader(io.StringIO(text))
+    headers = [normalize_header(h) for h in next(reader, [])]
+    # Numbered by record, as a spreadsheet app shows them: a quoted field
+    # spanning lines is still one row
+    return [
+        (row_no, dict(zip(headers, values)))
+        for row_no, values in enumerate(reader, start=2)
+        if any(v.strip() for v in values)
+    ]
+
+
+async def read_spreadsheet(content: bytes, filename: str) -> list[tuple[int, dict]]:
+    """Parse an uploaded xlsx or CSV file into ``(row number, dict)`` pairs.
+
+    Keys are normalized header names. Fully blank rows are skipped, so
+    each dict carries its own spreadsheet row number (row 1 is the header).
+    """
+    ext = Path(filename or "").suffix.lower()
+    if ext not in IMPORT_EXTENSIONS:
+        raise BadRequestException(
+            f"Unsupported file type '{ext}'. Allowed: {', '.join(sorted(IMPORT_EXTENSIONS))}"
+        )
+    if ext == ".csv":
+        return _read_csv(content)
+    try:
+        return await run_in_threadpool(_read_xlsx, content)
+    except (zipfile.BadZipFile, InvalidFileException, KeyError, ValueError) as exc:
+        raise BadRequestException(f"Could not read spreadsheet: {exc}")
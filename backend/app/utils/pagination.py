@@ -0,0 +1,189 @@
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+
+from sqlalchemy import BigInteger, ColumnElement, and_, or_, false, literal, tuple_
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import UnaryExpression
+
+from app.core.exceptions import BadRequestException
+
+
+class SortKey:
+    """A column in an ORDER BY clause with its direction and NULLS placement."""
+
+    def __init__(self, column: ColumnElement, descending: bool, nulls_last: bool):
+        self.column = column
+        self.descending = descending
+        self.nulls_last = nulls_last
+
+    @classmethod
+    def parse(cls, expr) -> "SortKey":
+        """Unwrap e.g. ``Expense.payment_date.desc().nullslast()``."""
+        if hasattr(expr, "__clause_element__"):
+            expr = expr.__clause_element__()
+        descending = False
+        nulls_last = None
+        while isinstance(expr, UnaryExpression):
+            if expr.modifier is operators.desc_op:
+                descending = True
+            elif expr.modifier is operators.nulls_last_op:
+                nulls_last = True
+            elif expr.modifier is operators.nulls_first_op:
+                nulls_last = False
+            expr = expr.element
+        if nulls_last is None:
+            # PostgreSQL default: NULLS LAST for ASC, NULLS FIRST for DESC
+            nulls_last = not descending
+        return cls(expr, descending, nulls_last)
+
+    @property
+    def nullable(self) -> bool:
+        return getattr(self.column, "nullable", True)
+
+    def beyond(self, value) -> ColumnElement[bool]:
+        """Non-null values sorting strictly after ``value`` on this key."""
+        return self.column < value if self.descending else self.column > value
+
+    def after(self, value) -> ColumnElement[bool]:
+        """Condition for rows that sort strictly after ``value`` on this key."""
+        if value is None:
+            return self.column.isnot(None) if not self.nulls_last else false()
+        if self.nulls_last and self.nullable:
+            return or_(self.beyond(value), self.column.is_(None))
+        return self.beyond(value)
+
+    def equals(self, value) -> ColumnElement[bool]:
+        return self.column.is_(None) if value is None else self.column == value
+
+
+def _expanded(keys: list[SortKey], values: list) -> ColumnElement[bool]:
+    """Rows after ``values``, spelled out key by key, NULLs included."""
+    terms = []
+    for i, key in enumerate(keys):
+        prefix = [keys[j].equals(values[j]) for j in range(i)]
+        terms.append(and_(*prefix, key.after(values[i])))
+    return or_(*terms)
+
+
+def _seek(keys: list[SortKey], values: list) -> ColumnElement[bool]:
+    """Rows after ``values`` among those with the same leading-key nullness."""
+    if values[0] is None:
+        # Only reached for a NULL in a nullable non-leading key
+        return _expanded(keys, values)
+    if len({key.descending for key in keys}) == 1 and not any(
+        key.nullable for key in keys[1:]
+    ):
+        # One row-value comparison is an index range bound
+        columns = tuple_(*(k.column for k in keys))
+        bound = tuple_(*(literal(v, k.column.type) for k, v in zip(keys, values)))
+        return columns < bound if keys[0].descending else columns > bound
+
+    # Mixed directions: the leading key's NULL arm is left to keyset_tail,
+    # and a redundant bound gives the planner a range start on it
+    lead = keys[0].column
+    leading_bound = lead <= values[0] if keys[0].descending else lead >= values[0]
+    rest = _expanded(keys[1:], values[1:])
+    return and_(leading_bound, or_(keys[0].beyond(values[0]), and_(lead == values[0], rest)))
+
+
+def keyset_condition(keys: list[SortKey], values: list) -> ColumnElement[bool]:
+    """Rows after ``values`` in the order given by ``keys``, up to the NULL boundary.
+
+    The leading key's NULLs sort as one block before or after all its
+    values. This covers the rest of the cursor's own block, as an index
+    range; ``keyset_tail`` covers the block that follows it, if any.
+    """
+    lead = keys[0]
+    if values[0] is not None:
+        # Comparisons are never true for NULL, so the NULL block is excluded
+        return _seek(keys, values)
+    if len(keys) == 1:
+        return false()
+    return and_(lead.column.is_(None), _seek(keys[1:], values[1:]))
+
+
+def keyset_tail(keys: list[SortKey], values: list) -> ColumnElement[bool] | None:
+    """The leading-key block after the cursor's block, or ``None`` if it is the last.
+
+    Non-NULL cursors are followed by the NULL rows when NULLs sort last;
+    NULL cursors by every non-NULL row when NULLs sort first.
+    """
+    lead = keys[0]
+    if not lead.nullable:
+        return None
+    if values[0] is not None and lead.nulls_last:
+        return lead.column.is_(None)
+    if values[0] is None and not lead.nulls_last:
+        return lead.column.isnot(None)
+    return None
+
+
+def _encode_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _expect(value, *types):
+    # bool is an int subclass, but never a valid int/float cursor value
+    if not isinstance(value, types) or (isinstance(value, bool) and bool not in types):
+        raise ValueError(f"unexpected cursor value {value!r}")
+    return value
+
+
+def _decode_value(value, column: ColumnElement):
+    """Decode one cursor value, checking it fits ``column``'s type."""
+    if value is None:
+        if not getattr(column, "nullable", True):
+            raise ValueError("NULL cursor value for a NOT NULL column")
+        return None
+    python_type = column.type.python_type
+    if python_type is datetime:
+        decoded = datetime.fromisoformat(_expect(value, str))
+        if getattr(column.type, "timezone", False) and decoded.tzinfo is None:
+            raise ValueError("cursor timestamp without a time zone")
+        return decoded
+    if python_type is date:
+        return date.fromisoformat(_expect(value, str))
+    if python_type is Decimal:
+        decoded = Decimal(_expect(value, str, int))
+        if not decoded.is_finite():
+            raise ValueError("non-finite cursor value")
+        return decoded
+    if issubclass(python_type, Enum):
+        return python_type(_expect(value, str))
+    if python_type is float:
+        return float(_expect(value, int, float))
+    if python_type is int:
+        bits = 63 if isinstance(column.type, BigInteger) else 31
+        if not -(2**bits) <= _expect(value, int) < 2**bits:
+            raise ValueError("cursor value out of range")
+        return value
+    return _expect(value, python_type)
+
+
+def encode_cursor(values: list) -> str:
+    """Encode sort-key values as an opaque URL-safe cursor."""
+    raw = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: list[SortKey]) -> list:
+    """Decode a cursor produced by ``encode_cursor`` for the given sort keys."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(raw, list) or len(raw) != len(keys):
+            raise ValueError("cursor does not match sort order")
+        return [_decode_value(v, key.column) for v, key in zip(raw, keys)]
+    except (ValueError, TypeError, ArithmeticError, NotImplementedError):
+        # ArithmeticError: decimal.InvalidOperation; NotImplementedError: a
+        # column type without a python_type
+        raise BadRequestException("Invalid pagination cursor")
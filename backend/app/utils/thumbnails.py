@@ -0,0 +1,100 @@
+import asyncio
+import logging
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+# Longest-side sizes (px) of the WebP previews kept for each image
+THUMBNAIL_SIZES = (256, 1024)
+THUMBNAIL_DIR = "thumbnails"
+THUMBNAIL_QUALITY = 80
+
+# Formats Pillow can decode; SVGs are served as they are
+THUMBNAIL_MIME_TYPES = {"image/jpeg", "image/png", "image/gif", "image/webp"}
+
+# Decoding and resizing are CPU-bound; a small dedicated pool keeps a
+# burst of photo uploads from starving the default threadpool.
+_thumbnail_executor = ThreadPoolExecutor(
+    max_workers=settings.thumbnail_workers,
+    thread_name_prefix="thumbnail",
+)
+
+
+def thumbnail_path(upload_path: str, size: int) -> str:
+    """``thumbnails/<size>/<upload_path>.webp`` relative to ``upload_dir``."""
+    return f"{THUMBNAIL_DIR}/{size}/{upload_path}.webp"
+
+
+def _publish(part: Path, target: Path, source: Path) -> bool:
+    """Move a finished preview into place unless its image was deleted meanwhile.
+
+    ``release_file`` unlinks the blob before sweeping its previews, so a
+    source still present after the move means the sweep has not run yet
+    and will take this preview too; one gone by then may have missed it.
+    """
+    if not source.exists():
+        return False
+    os.replace(part, target)
+    if not source.exists():
+        target.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def _generate(upload_path: str) -> bool:
+    """Write every missing preview of ``upload_path``.
+
+    ``False`` if it is not an image or was deleted while being read.
+    Upload tasks, the on-demand endpoint and the backfill command may
+    render the same preview at once; each writes its own part file and
+    the last move wins.
+    """
+    root = Path(settings.upload_dir)
+    source = root / upload_path
+    targets = {
+        size: root / thumbnail_path(upload_path, size)
+        for size in THUMBNAIL_SIZES
+        if not (root / thumbnail_path(upload_path, size)).exists()
+    }
+    if not targets:
+        return True
+    try:
+        with Image.open(source) as original:
+            image = ImageOps.exif_transpose(original)
+            image = image.convert("RGBA" if image.has_transparency_data else "RGB")
+            for size, target in targets.items():
+                preview = image.copy()
+                preview.thumbnail((size, size), Image.Resampling.LANCZOS)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                part = target.with_name(f".{target.name}.{uuid.uuid4().hex}.part")
+                try:
+                    preview.save(part, "WEBP", quality=THUMBNAIL_QUALITY)
+                    if not _publish(part, target, source):
+                        return False
+                finally:
+                    part.unlink(missing_ok=True)
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as exc:
+        logger.warning("Could not create thumbnails for %s: %s", upload_path, exc)
+        return False
+    return True
+
+
+async def generate_thumbnails(upload_path: str) -> bool:
+    """Create the previews of a stored image on the thumbnail pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_thumbnail_executor, _generate, upload_path)
+
+
+def remove_thumbnails(upload_path: str) -> None:
+    root = Path(settings.upload_dir)
+    for size in THUMBNAIL_SIZES:
+        (root / thumbnail_path(upload_path, size)).unlink(missing_ok=True)
@@ -0,0 +1,44 @@
+"""Shared operations for the revisions in ``versions/``."""
+from alembic import op
+import sqlalchemy as sa
+
+
+def create_indexes_concurrently(indexes) -> None:
+    """CREATE INDEX CONCURRENTLY each missing index of an existing table.
+
+    A failed concurrent build leaves an INVALID index behind that IF NOT
+    EXISTS would skip, so such leftovers are dropped and rebuilt. Offline
+    (``--sql``) every index is emitted, guarded only by IF NOT EXISTS.
+    """
+    offline = op.get_context().as_sql
+    bind = op.get_bind()
+    tables = None if offline else set(sa.inspect(bind).get_table_names())
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in indexes:
+            if tables is not None and table not in tables:
+                continue
+            invalid = not offline and bind.execute(
+                sa.text(
+                    "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+                    "WHERE c.relname = :name AND NOT i.indisvalid"
+                ),
+                {"name": name},
+            ).first()
+            if invalid:
+                op.drop_index(name, table_name=table, postgresql_concurrently=True)
+            op.create_index(
+                name,
+                table,
+                [sa.text(column) for column in columns],
+                postgresql_where=sa.text(where) if where else None,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def drop_indexes_concurrently(indexes) -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in indexes:
+            op.drop_index(
+                name, table_name=table, postgresql_concurrently=True, if_exists=True
+            )
@@ -0,0 +1,65 @@
+"""Partial indexes on active rows for the hot list filters
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+
+Tables are still created by ``metadata.create_all`` on first start, with
+these indexes; this revision adds them to databases created before. It
+builds them with CREATE INDEX CONCURRENTLY outside a transaction, so
+writes continue while a large table is indexed.
+"""
+from migrations.helpers import create_indexes_concurrently, drop_indexes_concurrently
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+ACTIVE = "is_deleted = false"
+
+# (name, table, columns, WHERE), matching the Index() declarations in app/models
+INDEXES = [
+    ("ix_guests_active_first_name", "guests", ["first_name", "id"], ACTIVE),
+    ("ix_guests_active_side_first_name", "guests", ["side", "first_name", "id"], ACTIVE),
+    (
+        "ix_guests_active_vip_first_name", "guests", ["first_name", "id"],
+        f"{ACTIVE} AND is_vip = true",
+    ),
+    (
+        "ix_expenses_active_payment_date", "expenses",
+        ["payment_date DESC NULLS LAST", "id DESC"], ACTIVE,
+    ),
+    (
+        "ix_expenses_active_payment_status", "expenses",
+        ["payment_status", "payment_date DESC NULLS LAST", "id DESC"], ACTIVE,
+    ),
+    ("ix_expenses_active_budget", "expenses", ["budget_id"], ACTIVE),
+    ("ix_tasks_active_due_date", "tasks", ["due_date ASC NULLS LAST", "id"], ACTIVE),
+    (
+        "ix_tasks_active_status_due_date", "tasks",
+        ["status", "due_date ASC NULLS LAST", "id"], ACTIVE,
+    ),
+    (
+        "ix_vendor_services_active_service_date", "vendor_services",
+        ["service_date ASC NULLS LAST", "id"], ACTIVE,
+    ),
+    (
+        "ix_vendor_services_active_status", "vendor_services",
+        ["status", "service_date ASC NULLS LAST", "id"], ACTIVE,
+    ),
+    (
+        "ix_gifts_active_thank_you_pending", "gifts", ["received_at ASC NULLS LAST"],
+        f"{ACTIVE} AND thank_you_sent = false",
+    ),
+    ("ix_events_active_status_event_date", "events", ["status", "event_date"], ACTIVE),
+    ("ix_invitations_active_event_status", "invitations", ["event_id", "status"], ACTIVE),
+]
+
+
+def upgrade() -> None:
+    create_indexes_concurrently(INDEXES)
+
+
+def downgrade() -> None:
+    drop_indexes_concurrently(INDEXES)
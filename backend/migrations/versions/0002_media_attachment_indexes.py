@@ -0,0 +1,29 @@
+"""Media attachment lookups by stored file and by owning entity
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from migrations.helpers import create_indexes_concurrently, drop_indexes_concurrently
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+# (name, table, columns, WHERE), matching app/models/media_attachment.py
+INDEXES = [
+    ("ix_media_attachments_upload_path", "media_attachments", ["upload_path"], None),
+    (
+        "ix_media_attachments_entity", "media_attachments",
+        ["entity_type", "entity_id", "is_deleted"], None,
+    ),
+]
+
+
+def upgrade() -> None:
+    create_indexes_concurrently(INDEXES)
+
+
+def downgrade() -> None:
+    drop_indexes_concurrently(INDEXES)
@@ -0,0 +1,76 @@
+"""Shared fixtures.
+
+Database tests run against the PostgreSQL server named by
+``TEST_DATABASE_URL`` and are skipped without one. Each test works inside
+a transaction that is rolled back, schema included, so the database is
+left as it was.
+"""
+import os
+
+import pytest
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+# Settings are read at import time; tests never touch the app's own database.
+os.environ.setdefault("DATABASE_URL", TEST_DATABASE_URL or "postgresql+asyncpg://test@localhost/test")
+os.environ.setdefault("JWT_SECRET_KEY", "test-secret")
+
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+from sqlalchemy.pool import NullPool  # noqa: E402
+
+from app.db.base import Base  # noqa: E402
+
+
+class StatementCounter:
+    """Records every SQL statement sent to the database while attached."""
+
+    def __init__(self):
+        self.statements: list[str] = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def reset(self) -> None:
+        self.statements.clear()
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def engine():
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def db(engine):
+    """Session on a connection whose transaction is rolled back afterwards."""
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        await conn.run_sync(Base.metadata.create_all)
+        session = AsyncSession(bind=conn, expire_on_commit=False, autoflush=False)
+        try:
+            yield session
+        finally:
+            await session.close()
+            await trans.rollback()
+
+
+@pytest.fixture
+def statement_counter(engine):
+    """Counts statements via ``before_cursor_execute``; call ``reset()`` first."""
+    counter = StatementCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", counter)
+    yield counter
+    event.remove(engine.sync_engine, "before_cursor_execute", counter)
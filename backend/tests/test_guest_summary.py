@@ -0,0 +1,118 @@
+"""``GuestRepository.get_summary`` against the per-count queries it replaced.
+
+The single GROUPING SETS query must report exactly what the seven
+separate queries did, on a wedding-sized guest list with soft-deleted
+rows and NULL foreign keys. Timings of both are printed (``pytest -s``).
+"""
+import time
+
+import pytest
+from sqlalchemy import distinct, func, select, text
+
+from app.models.dietary_preference import DietaryPreference
+from app.models.guest import Guest
+from app.repositories.guest import GuestRepository
+
+pytestmark = pytest.mark.anyio
+
+GUEST_COUNT = 50_000
+TIMING_RUNS = 5
+
+SEED_SQL = [
+    """
+    INSERT INTO dietary_preferences (name, is_active, is_deleted)
+    SELECT 'Diet ' || n, true, false FROM generate_series(1, 8) AS n
+    """,
+    """
+    INSERT INTO family_groups (name, is_active, is_deleted)
+    SELECT 'Family ' || n, true, false FROM generate_series(1, 3000) AS n
+    """,
+    f"""
+    INSERT INTO guests (
+        first_name, last_name, phone, side, age_group, dietary_preference_id,
+        family_group_id, number_of_persons, is_vip, is_deleted
+    )
+    SELECT 'Guest ' || n, 'Test', 'phone-' || n,
+           (ARRAY['BRIDE', 'GROOM'])[1 + n % 2]::guest_side_enum,
+           (ARRAY['ADULT', 'ADULT', 'ADULT', 'CHILD', 'INFANT'])[1 + n % 5]::age_group_enum,
+           CASE WHEN n % 3 = 0 THEN NULL
+                ELSE (SELECT min(id) FROM dietary_preferences) + n % 8 END,
+           CASE WHEN n % 4 = 0 THEN NULL
+                ELSE (SELECT min(id) FROM family_groups) + n % 3000 END,
+           CASE WHEN n % 11 = 0 THEN NULL ELSE 1 + n % 4 END,
+           n % 37 = 0, n % 20 = 0
+    FROM generate_series(1, {GUEST_COUNT}) AS n
+    """,
+    "ANALYZE dietary_preferences, family_groups, guests",
+]
+
+
+async def _summary_per_count(db) -> dict:
+    """The summary as it was computed before GROUPING SETS, one query per figure."""
+    base = Guest.is_deleted == False
+
+    side_q = select(Guest.side, func.count(Guest.id)).where(base).group_by(Guest.side)
+    by_side = {k.value: v for k, v in (await db.execute(side_q)).all()}
+
+    diet_q = (
+        select(DietaryPreference.name, func.count(Guest.id))
+        .join(DietaryPreference, Guest.dietary_preference_id == DietaryPreference.id)
+        .where(base)
+        .group_by(DietaryPreference.name)
+    )
+    by_diet = dict((await db.execute(diet_q)).all())
+
+    age_q = select(Guest.age_group, func.count(Guest.id)).where(base).group_by(Guest.age_group)
+    by_age = {k.value: v for k, v in (await db.execute(age_q)).all()}
+
+    vip_q = select(func.count(Guest.id)).where(base, Guest.is_vip == True)
+    vip_count = (await db.execute(vip_q)).scalar() or 0
+
+    fg_q = select(func.count(distinct(Guest.family_group_id))).where(
+        base, Guest.family_group_id.isnot(None)
+    )
+    fg_count = (await db.execute(fg_q)).scalar() or 0
+
+    persons_q = select(func.coalesce(func.sum(Guest.number_of_persons), 0)).where(base)
+    total_persons = (await db.execute(persons_q)).scalar() or 0
+
+    return {
+        "total_guests": sum(by_side.values()),
+        "total_persons": total_persons,
+        "by_side": by_side,
+        "by_dietary_preference": by_diet,
+        "by_age_group": by_age,
+        "vip_count": vip_count,
+        "family_groups_count": fg_count,
+    }
+
+
+async def _best_time(call) -> float:
+    timings = []
+    for _ in range(TIMING_RUNS):
+        started = time.perf_counter()
+        await call()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+async def test_summary_matches_per_count_queries(db, record_property):
+    for statement in SEED_SQL:
+        await db.execute(text(statement))
+    repo = GuestRepository(db)
+
+    summary = await repo.get_summary()
+
+    assert summary == await _summary_per_count(db)
+    assert summary["total_guests"] == GUEST_COUNT - GUEST_COUNT // 20
+    assert sum(summary["by_age_group"].values()) == summary["total_guests"]
+
+    grouping_sets = await _best_time(repo.get_summary)
+    per_count = await _best_time(lambda: _summary_per_count(db))
+    record_property("grouping_sets_seconds", grouping_sets)
+    record_property("per_count_seconds", per_count)
+    print(
+        f"\nguest summary over {GUEST_COUNT} guests (best of {TIMING_RUNS}): "
+        f"GROUPING SETS {grouping_sets * 1000:.1f} ms, "
+        f"per-count queries {per_count * 1000:.1f} ms"
+    )
@@ -0,0 +1,208 @@
+"""The hot list filters must be answered from their partial indexes.
+
+Each repository call's SELECT is captured and EXPLAINed with sequential
+scans disabled, so an index the query cannot use (a WHERE that does not
+imply the index predicate, a mismatched sort) shows up as a failure
+instead of a slow page in production.
+"""
+import json
+
+import pytest
+from sqlalchemy import Select, text
+from sqlalchemy.dialects import postgresql
+
+from app.models.enums import EventStatus, GuestSide, PaymentStatus, TaskStatus, VendorServiceStatus
+from app.repositories.budget import ExpenseRepository
+from app.repositories.event import EventRepository
+from app.repositories.gift import GiftRepository
+from app.repositories.guest import GuestRepository
+from app.repositories.invitation import InvitationRepository
+from app.repositories.media_attachment import MediaAttachmentRepository
+from app.repositories.task import TaskRepository
+from app.repositories.vendor_service import VendorServiceRepository
+
+pytestmark = pytest.mark.anyio
+
+
+async def _first_select(db, call, table) -> Select:
+    """Run ``call`` and return the first SELECT on ``table`` it sends through ``db``."""
+    statements = []
+    execute = db.execute
+
+    async def recording(statement, *args, **kwargs):
+        statements.append(statement)
+        return await execute(statement, *args, **kwargs)
+
+    db.execute = recording
+    try:
+        await call()
+    finally:
+        del db.execute
+    return next(
+        s for s in statements if isinstance(s, Select) and table in s.get_final_froms()
+    )
+
+
+def _indexes_used(plan: dict) -> set[str]:
+    names = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", ()):
+        names |= _indexes_used(child)
+    return names
+
+
+async def _plan_indexes(db, call, table) -> set[str]:
+    query = await _first_select(db, call, table)
+    sql = query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    await db.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = (await db.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return _indexes_used(plan[0]["Plan"])
+
+
+# The planner picks among overlapping indexes by chance on empty tables,
+# so every table under test gets a realistic spread of rows (about 5% soft
+# deleted) and fresh statistics.
+SEED_SQL = [
+    "INSERT INTO event_types (name, is_active, is_deleted) VALUES ('Seed', true, false)",
+    "INSERT INTO gift_types (name, is_active, is_deleted) VALUES ('Seed', true, false)",
+    """
+    INSERT INTO budget_categories (category, estimated_amount, is_deleted)
+    SELECT 'Category ' || n, 1000, false FROM generate_series(1, 20) AS n
+    """,
+    """
+    INSERT INTO guests (first_name, last_name, phone, side, age_group, is_vip, is_deleted)
+    SELECT 'Guest ' || n, 'Test', 'phone-' || n,
+           CASE WHEN n % 2 = 0 THEN 'BRIDE' ELSE 'GROOM' END::guest_side_enum,
+           'ADULT'::age_group_enum, n % 50 = 0, n % 20 = 0
+    FROM generate_series(1, 5000) AS n
+    """,
+    """
+    INSERT INTO events (name, event_type_id, event_date, status, is_deleted)
+    SELECT 'Event ' || n, (SELECT min(id) FROM event_types), DATE '2026-01-01' + n,
+           (ARRAY['UPCOMING', 'ONGOING', 'COMPLETED', 'CANCELLED'])[n % 4 + 1]::event_status_enum,
+           n % 20 = 0
+    FROM generate_series(1, 400) AS n
+    """,
+    """
+    INSERT INTO expenses (budget_id, description, amount, payment_method, payment_status,
+        payment_date, is_deleted)
+    SELECT c.id, 'Expense ' || n, 100,
+           'CASH'::payment_method_enum,
+           (ARRAY['PENDING', 'PARTIAL', 'PAID'])[n % 3 + 1]::payment_status_enum,
+           CASE WHEN n % 10 = 0 THEN NULL ELSE DATE '2026-01-01' + n % 300 END,
+           n % 20 = 0
+    FROM generate_series(1, 5000) AS n
+    JOIN (SELECT id, row_number() OVER (ORDER BY id) - 1 AS k FROM budget_categories) AS c
+      ON c.k = n % 20
+    """,
+    """
+    INSERT INTO tasks (title, priority, status, due_date, is_deleted)
+    SELECT 'Task ' || n, 'MEDIUM'::task_priority_enum,
+           (ARRAY['PENDING', 'IN_PROGRESS', 'COMPLETED', 'CANCELLED'])[n % 4 + 1]::task_status_enum,
+           CASE WHEN n % 10 = 0 THEN NULL ELSE DATE '2026-01-01' + n % 300 END,
+           n % 20 = 0
+    FROM generate_series(1, 5000) AS n
+    """,
+    """
+    INSERT INTO vendor_services (title, status, service_date, is_deleted)
+    SELECT 'Service ' || n,
+           (ARRAY['PENDING', 'SCHEDULED', 'IN_PROGRESS', 'COMPLETED', 'CANCELLED'])[n % 5 + 1]
+               ::vendor_service_status_enum,
+           CASE WHEN n % 10 = 0 THEN NULL ELSE DATE '2026-01-01' + n % 300 END,
+           n % 20 = 0
+    FROM generate_series(1, 5000) AS n
+    """,
+    """
+    INSERT INTO gifts (guest_id, gift_type_id, received_at, thank_you_sent, is_deleted)
+    SELECT g.id, (SELECT min(id) FROM gift_types), DATE '2026-01-01' + g.id % 300,
+           g.id % 10 <> 0, g.id % 20 = 0
+    FROM guests AS g
+    """,
+    """
+    INSERT INTO invitations (guest_id, event_id, status, plus_ones, is_deleted)
+    SELECT g.id, e.id, 'SENT'::invitation_status_enum, 0, (g.id + e.id) % 20 = 0
+    FROM guests AS g
+    JOIN (SELECT id, row_number() OVER (ORDER BY id) - 1 AS k FROM events) AS e
+      ON e.k = g.id % 400
+    """,
+    """
+    INSERT INTO media_attachments (entity_type, entity_id, original_filename,
+        stored_filename, file_size, mime_type, upload_path, is_deleted)
+    SELECT CASE WHEN n % 2 = 0 THEN 'task' ELSE 'vendor_service' END, n % 500,
+           'file.jpg', 'stored-' || n, 1024, 'image/jpeg', 'blobs/' || n, n % 20 = 0
+    FROM generate_series(1, 5000) AS n
+    """,
+    """
+    ANALYZE event_types, gift_types, budget_categories, guests, events, expenses, tasks,
+        vendor_services, gifts, invitations, media_attachments
+    """,
+]
+
+
+@pytest.fixture
+async def seeded_db(db):
+    for statement in SEED_SQL:
+        await db.execute(text(statement))
+    return db
+
+
+HOT_FILTERS = [
+    (GuestRepository, lambda r: r.get_page(), "ix_guests_active_first_name"),
+    (
+        GuestRepository,
+        lambda r: r.get_page({"side": GuestSide.BRIDE}),
+        "ix_guests_active_side_first_name",
+    ),
+    (GuestRepository, lambda r: r.get_page({"is_vip": True}), "ix_guests_active_vip_first_name"),
+    (ExpenseRepository, lambda r: r.get_page(), "ix_expenses_active_payment_date"),
+    (
+        ExpenseRepository,
+        lambda r: r.get_page({"payment_status": PaymentStatus.PENDING}),
+        "ix_expenses_active_payment_status",
+    ),
+    (ExpenseRepository, lambda r: r.get_spent_by_budget(1), "ix_expenses_active_budget"),
+    (TaskRepository, lambda r: r.get_page(), "ix_tasks_active_due_date"),
+    (
+        TaskRepository,
+        lambda r: r.get_page({"status": TaskStatus.PENDING}),
+        "ix_tasks_active_status_due_date",
+    ),
+    (VendorServiceRepository, lambda r: r.get_page(), "ix_vendor_services_active_service_date"),
+    (
+        VendorServiceRepository,
+        lambda r: r.get_page({"status": VendorServiceStatus.SCHEDULED}),
+        "ix_vendor_services_active_status",
+    ),
+    (GiftRepository, lambda r: r.get_thank_you_pending(), "ix_gifts_active_thank_you_pending"),
+    (
+        EventRepository,
+        lambda r: r.get_by_status(EventStatus.UPCOMING),
+        "ix_events_active_status_event_date",
+    ),
+    # The plain event_id index (kept for the ON DELETE CASCADE from events)
+    # costs the same here, so the planner may take either
+    (
+        InvitationRepository,
+        lambda r: r.get_rsvp_summary(1),
+        ("ix_invitations_active_event_status", "ix_invitations_event_id"),
+    ),
+    (
+        MediaAttachmentRepository,
+        lambda r: r.get_by_entity("task", 1),
+        "ix_media_attachments_entity",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("repo_class", "call", "indexes"),
+    HOT_FILTERS,
+    ids=[index if isinstance(index, str) else index[0] for _, _, index in HOT_FILTERS],
+)
+async def test_hot_filter_uses_partial_index(seeded_db, repo_class, call, indexes):
+    if isinstance(indexes, str):
+        indexes = (indexes,)
+    repo = repo_class(seeded_db)
+    used = await _plan_indexes(seeded_db, lambda: call(repo), repo.model.__table__)
+    assert used & set(indexes), used
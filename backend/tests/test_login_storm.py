@@ -0,0 +1,72 @@
+"""A burst of logins against the bounded password hashing pool.
+
+Many more ``verify_password`` calls than hashing threads are started at
+once. They queue on the pool instead of the event loop, so a heartbeat
+task keeps running on time throughout; per-login latency (p50/p99) and
+the worst heartbeat lag are printed (``pytest -s``).
+"""
+import asyncio
+import statistics
+import time
+
+import pytest
+
+from app.core.security import pwd_context, settings, verify_password
+
+pytestmark = pytest.mark.anyio
+
+# Four waves of logins per hashing thread
+LOGINS = settings.password_hash_workers * 4
+# bcrypt cost of the stored hash: below the default to keep the suite
+# quick, still tens of milliseconds per verify.
+STORM_ROUNDS = 10
+HEARTBEAT_INTERVAL = 0.01
+# Worst acceptable heartbeat delay; a loop blocked on a verify would
+# overshoot this several times over.
+MAX_LOOP_LAG = 0.05
+PASSWORD = "correct horse battery staple"
+
+
+async def _timed_login(password: str, hashed: str) -> float:
+    started = time.perf_counter()
+    assert await verify_password(password, hashed)
+    return time.perf_counter() - started
+
+
+async def _heartbeat(stop: asyncio.Event) -> float:
+    """Tick every ``HEARTBEAT_INTERVAL`` until ``stop``; return the worst lag."""
+    worst = 0.0
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        worst = max(worst, time.perf_counter() - started - HEARTBEAT_INTERVAL)
+    return worst
+
+
+async def test_login_storm_keeps_event_loop_responsive(record_property):
+    hashed = pwd_context.handler().using(rounds=STORM_ROUNDS).hash(PASSWORD)
+    single = await _timed_login(PASSWORD, hashed)
+
+    stop = asyncio.Event()
+    heartbeat = asyncio.create_task(_heartbeat(stop))
+    latencies = await asyncio.gather(
+        *(_timed_login(PASSWORD, hashed) for _ in range(LOGINS))
+    )
+    stop.set()
+    loop_lag = await heartbeat
+
+    p50 = statistics.median(latencies)
+    p99 = statistics.quantiles(latencies, n=100)[98]
+    record_property("login_p50_seconds", p50)
+    record_property("login_p99_seconds", p99)
+    record_property("event_loop_max_lag_seconds", loop_lag)
+    print(
+        f"\n{LOGINS} concurrent logins on {settings.password_hash_workers} hashing threads: "
+        f"single {single * 1000:.0f} ms, p50 {p50 * 1000:.0f} ms, p99 {p99 * 1000:.0f} ms, "
+        f"worst event loop lag {loop_lag * 1000:.1f} ms"
+    )
+
+    assert loop_lag < MAX_LOOP_LAG
+    # Logins beyond the pool size wait their turn, so the slowest took
+    # several verifies' worth of time rather than running all at once.
+    assert max(latencies) > single * 2
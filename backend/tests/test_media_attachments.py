@@ -0,0 +1,75 @@
+"""Blob store bookkeeping around attachment transactions."""
+import asyncio
+import hashlib
+from pathlib import Path
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.services import media_attachment_service
+from app.services.media_attachment_service import (
+    STAGING_DIR, MediaAttachmentService, _blob_path,
+)
+
+pytestmark = pytest.mark.anyio
+
+CONTENT = b"seating chart, final final v3"
+
+
+@pytest.fixture
+def sessions(db, tmp_path, monkeypatch):
+    """Sessions on the test connection, each rolling back to its own savepoint.
+
+    ``release_file`` opens its sessions from the same factory, so it sees
+    the test's tables and rows.
+    """
+    monkeypatch.setattr(media_attachment_service.settings, "upload_dir", str(tmp_path))
+    factory = async_sessionmaker(
+        db.bind, expire_on_commit=False, join_transaction_mode="create_savepoint"
+    )
+    monkeypatch.setattr(media_attachment_service, "AsyncSessionLocal", factory)
+    return factory
+
+
+def _staged(upload_dir: Path, name: str) -> dict:
+    staged = upload_dir / STAGING_DIR / f"{name}.part"
+    staged.parent.mkdir(parents=True, exist_ok=True)
+    staged.write_bytes(CONTENT)
+    return {
+        "staged": staged,
+        "original_filename": "chart.txt",
+        "stored_filename": f"{name}.txt",
+        "file_size": len(CONTENT),
+        "mime_type": "text/plain",
+        "upload_path": _blob_path(hashlib.sha256(CONTENT).hexdigest()),
+    }
+
+
+async def _record_and_roll_back(sessions, tmp_path: Path, name: str) -> Path:
+    async with sessions() as session:
+        service = MediaAttachmentService(session)
+        attachment = await service._record_file("task", 1, _staged(tmp_path, name))
+        blob = tmp_path / attachment.upload_path
+        assert blob.read_bytes() == CONTENT
+        await session.rollback()
+    await asyncio.gather(*media_attachment_service._pending_releases)
+    return blob
+
+
+async def test_rolled_back_upload_removes_its_blob(sessions, tmp_path):
+    blob = await _record_and_roll_back(sessions, tmp_path, "rolled-back")
+
+    assert not blob.exists()
+    assert not list((tmp_path / STAGING_DIR).iterdir())
+
+
+async def test_rolled_back_upload_keeps_a_shared_blob(sessions, tmp_path):
+    async with sessions() as session:
+        await MediaAttachmentService(session)._record_file(
+            "task", 1, _staged(tmp_path, "committed")
+        )
+        await session.commit()
+
+    blob = await _record_and_roll_back(sessions, tmp_path, "rolled-back")
+
+    assert blob.read_bytes() == CONTENT
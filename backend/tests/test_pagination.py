@@ -0,0 +1,120 @@
+"""Keyset pagination: cursor validation and seek predicates."""
+import base64
+import json
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+from app.core.exceptions import BadRequestException
+from app.models.budget import Expense
+from app.models.task import Task
+from app.repositories.task import TaskRepository
+from app.utils.pagination import SortKey, decode_cursor, encode_cursor, keyset_condition
+
+TASK_KEYS = [SortKey.parse(Task.due_date.asc().nullslast()), SortKey.parse(Task.id)]
+
+
+def _raw_cursor(values) -> str:
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+
+def _sql(condition) -> str:
+    return str(condition.compile(dialect=postgresql.dialect()))
+
+
+def test_cursor_round_trip():
+    values = [date(2026, 5, 1), 42]
+    assert decode_cursor(encode_cursor(values), TASK_KEYS) == values
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not base64!",
+        _raw_cursor({"due_date": "2026-05-01"}),
+        _raw_cursor(["2026-05-01"]),
+        _raw_cursor(["2026-05-01", "42"]),
+        _raw_cursor(["2026-05-01", True]),
+        _raw_cursor(["2026-05-01", 2**40]),
+        _raw_cursor(["2026-05-01", None]),
+        _raw_cursor(["May 1st", 42]),
+        _raw_cursor([20260501, 42]),
+    ],
+)
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(BadRequestException):
+        decode_cursor(cursor, TASK_KEYS)
+
+
+@pytest.mark.parametrize("amount", ["twelve", "NaN", 12.5, [1]])
+def test_malformed_decimal_cursor_is_rejected(amount):
+    keys = [SortKey.parse(Expense.amount), SortKey.parse(Expense.id)]
+    with pytest.raises(BadRequestException):
+        decode_cursor(_raw_cursor([amount, 1]), keys)
+
+
+def test_uniform_order_seeks_with_a_row_value_comparison():
+    sql = _sql(keyset_condition(TASK_KEYS, [date(2026, 5, 1), 42]))
+    assert "(tasks.due_date, tasks.id) >" in sql
+    assert " OR " not in sql and "IS NULL" not in sql
+
+
+def test_mixed_order_bounds_the_leading_key():
+    keys = [SortKey.parse(Task.due_date.asc().nullslast()), SortKey.parse(Task.id.desc())]
+    sql = _sql(keyset_condition(keys, [date(2026, 5, 1), 42]))
+    assert sql.startswith("tasks.due_date >=")
+    assert "IS NULL" not in sql
+
+
+# --- Against the database -------------------------------------------------
+
+ORDERS = {
+    "asc_nulls_last": (Task.due_date.asc().nullslast(), Task.id),
+    "desc_nulls_first": (Task.due_date.desc(), Task.id.desc()),
+    "mixed": (Task.due_date.asc().nullslast(), Task.id.desc()),
+}
+
+
+@pytest.fixture
+async def tasks(db):
+    repo = TaskRepository(db)
+    start = date(2026, 1, 1)
+    for n in range(23):
+        # Repeated dates and a block of NULLs exercise every tie-break
+        due = None if n % 4 == 0 else start + timedelta(days=n % 5)
+        await repo.create({"title": f"Task {n}", "due_date": due})
+    return repo
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("order", ORDERS.values(), ids=ORDERS.keys())
+async def test_keyset_pages_match_offset_order(tasks, order):
+    expected = [t.id for t in await tasks.get_filtered(order_by=order, limit=1000)]
+
+    seen, cursor = [], None
+    while True:
+        items, cursor = await tasks.get_keyset_page(order_by=order, cursor=cursor, limit=4)
+        seen += [t.id for t in items]
+        if cursor is None:
+            break
+    assert seen == expected
+
+
+@pytest.mark.anyio
+async def test_keyset_seek_is_an_index_range(tasks, db):
+    """The seek must bound the index scan, not filter rows read from its start."""
+    repo = tasks
+    cursor = repo.cursor_for((await repo.get_filtered(limit=3))[-1])
+    condition = keyset_condition(TASK_KEYS, decode_cursor(cursor, TASK_KEYS))
+    query = repo._filtered_query(conditions=[condition]).order_by(*repo.default_order_by)
+    sql = query.limit(4).compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    await db.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = (await db.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))).scalar()
+    plan = json.loads(plan) if isinstance(plan, str) else plan
+    scan = plan[0]["Plan"]["Plans"][0]
+    assert scan["Index Name"] == "ix_tasks_active_due_date"
+    assert scan["Index Cond"].startswith("(ROW(due_date, id) > ")
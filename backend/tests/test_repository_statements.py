@@ -0,0 +1,39 @@
+"""BaseRepository writes must each take a single round trip."""
+import pytest
+
+from app.repositories.event_type import EventTypeRepository
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_create_issues_one_statement(db, statement_counter):
+    repo = EventTypeRepository(db)
+
+    statement_counter.reset()
+    event_type = await repo.create({"name": "Sangeet", "description": "Music night"})
+
+    assert statement_counter.count == 1, statement_counter.statements
+    assert event_type.id is not None
+    assert event_type.created_at is not None
+    assert event_type.is_active is True
+
+
+async def test_update_issues_one_statement(db, statement_counter):
+    repo = EventTypeRepository(db)
+    event_type = await repo.create({"name": "Mehendi"})
+
+    statement_counter.reset()
+    updated = await repo.update(event_type.id, {"description": "Henna"})
+
+    assert statement_counter.count == 1, statement_counter.statements
+    assert updated is event_type
+    assert updated.description == "Henna"
+    assert updated.updated_at is not None
+
+
+async def test_update_of_missing_row_issues_one_statement(db, statement_counter):
+    repo = EventTypeRepository(db)
+
+    statement_counter.reset()
+    assert await repo.update(-1, {"description": "Nothing"}) is None
+    assert statement_counter.count == 1, statement_counter.statements
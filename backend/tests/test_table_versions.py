@@ -0,0 +1,33 @@
+"""Which tables a flush marks as written, and so bumps on commit."""
+import pytest
+
+from app.models.event_type import EventType
+from app.repositories.base import _WRITTEN_TABLES
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def event_type(db):
+    event_type = EventType(name="Haldi", description="Turmeric")
+    db.add(event_type)
+    await db.flush()
+    db.info.pop(_WRITTEN_TABLES, None)
+    return event_type
+
+
+async def test_unchanged_assignment_marks_nothing_written(db, event_type, statement_counter):
+    statement_counter.reset()
+    event_type.description = "Turmeric"
+    assert event_type in db.dirty
+    await db.flush()
+
+    assert statement_counter.count == 0, statement_counter.statements
+    assert _WRITTEN_TABLES not in db.info
+
+
+async def test_changed_assignment_marks_table_written(db, event_type):
+    event_type.description = "Turmeric paste"
+    await db.flush()
+
+    assert db.info[_WRITTEN_TABLES] == {"event_types"}
@@ -19,5 +19,8 @@ export const getAttachments = (entityType, entityId) =>
 export const getFileUrl = (attachmentId) =>
   `${api.defaults.baseURL}${BASE}/file/${attachmentId}`
 
+export const getThumbnailUrl = (attachmentId, size = 256) =>
+  `${api.defaults.baseURL}${BASE}/thumbnail/${attachmentId}?size=${size}`
+
 export const deleteAttachment = (id) =>
   api.delete(`${BASE}/${id}`).then((r) => r.data)
@@ -1,7 +1,7 @@
 import { useState, useEffect } from 'react'
 import { Trash2, Download, FileText, Image as ImageIcon, File } from 'lucide-react'
 import ConfirmDialog from './ConfirmDialog'
-import { getFileUrl } from '../api/media'
+import { getFileUrl, getThumbnailUrl } from '../api/media'
 import useAuthStore from '../stores/authStore'
 
 function getFileIcon(mimeType) {
@@ -25,8 +25,10 @@ function AuthImage({ attachmentId, alt, className }) {
 
   useEffect(() => {
     const token = useAuthStore.getState().token
-    const url = getFileUrl(attachmentId)
-    fetch(url, { headers: { Authorization: `Bearer ${token}` } })
+    const headers = { Authorization: `Bearer ${token}` }
+    // Small WebP preview; fall back to the original (e.g. SVGs have none)
+    fetch(getThumbnailUrl(attachmentId), { headers })
+      .then((r) => (r.ok ? r : fetch(getFileUrl(attachmentId), { headers })))
       .then((r) => r.blob())
       .then((blob) => setSrc(URL.createObjectURL(blob)))
       .catch(() => {})